@@ -0,0 +1,125 @@
+"""
+Ohmni Estimate - Serialization Benchmark
+Drop into: backend/benchmarks/bench_serialization.py
+
+Compares payload build time for a large estimate:
+    1. current path:  estimate.to_dict() + [item.to_dict()] + json.dumps
+    2. compiled path: CompiledSerializer.dump over ORM instances + dumps()
+    3. row path:      CompiledSerializer.dump_rows over SQL row tuples + dumps()
+
+Uses transient (unsaved) model instances, so no database is needed:
+    python -m backend.benchmarks.bench_serialization --items 5000 --repeat 20
+"""
+
+from datetime import datetime
+from decimal import Decimal
+import argparse
+import json
+import random
+import statistics
+import time
+
+from backend.models.estimate_models import Estimate, EstimateLineItem
+from backend.services.estimate_serializers import (
+    category_totals_from_items, dumps, estimate_serializer, line_item_serializer,
+    compress_body, orjson, brotli
+)
+
+CATEGORIES = [
+    'INTERIOR_LIGHTING', 'POWER_RECEPTACLES', 'ELECTRICAL_SERVICE',
+    'MECHANICAL_CONNECTIONS', 'FIRE_ALARM', 'GENERAL_CONDITIONS'
+]
+
+
+def build_fixture(n_items: int):
+    now = datetime.utcnow()
+    estimate = Estimate(
+        id='bench-estimate', user_id='bench-user', project_name='Benchmark Warehouse',
+        square_footage=120000, project_type='warehouse',
+        labor_rate=Decimal('118.00'), material_tax_rate=Decimal('0.1025'),
+        overhead_profit_rate=Decimal('0.1500'), total_material=Decimal('512345.67'),
+        total_material_with_tax=Decimal('564861.10'), total_labor_hours=Decimal('9876.50'),
+        total_labor_cost=Decimal('1165427.00'), subtotal=Decimal('1730288.10'),
+        overhead_profit=Decimal('259543.22'), final_bid=Decimal('1989831'),
+        price_per_sqft=Decimal('16.58'), status='draft', created_at=now, updated_at=now
+    )
+
+    items = []
+    rng = random.Random(42)
+    for i in range(n_items):
+        items.append(EstimateLineItem(
+            id=f'item-{i:06d}', estimate_id=estimate.id, pricing_item_id=None,
+            category=rng.choice(CATEGORIES), description=f'Line item {i}',
+            quantity=Decimal(rng.randint(1, 500)), unit_type='E',
+            material_unit_cost=Decimal('57.25'), labor_hours_per_unit=Decimal('1.300'),
+            material_extension=Decimal('2862.50'), labor_extension=Decimal('65.000'),
+            total_cost=Decimal('10825.06'), source='manual', ai_confidence=None,
+            sort_order=i
+        ))
+
+    rows = [tuple(getattr(item, attr) for attr in line_item_serializer.attrs) for item in items]
+    return estimate, items, rows
+
+
+def current_path(estimate, items):
+    data = estimate.to_dict()
+    data['line_items'] = [item.to_dict() for item in items]
+    totals = {}
+    for item in items:
+        totals[item.category] = totals.get(item.category, 0) + (float(item.total_cost) if item.total_cost else 0)
+    data['category_totals'] = totals
+    return json.dumps(data).encode('utf-8')
+
+
+def compiled_path(estimate, items):
+    data = estimate_serializer.dump(estimate)
+    data['line_items'] = line_item_serializer.dump_many(items)
+    data['category_totals'] = category_totals_from_items(data['line_items'])
+    return dumps(data)
+
+
+def row_path(estimate, rows):
+    data = estimate_serializer.dump(estimate)
+    data['line_items'] = line_item_serializer.dump_rows(rows)
+    data['category_totals'] = category_totals_from_items(data['line_items'])
+    return dumps(data)
+
+
+def timed(fn, repeat: int):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--items', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    estimate, items, rows = build_fixture(args.items)
+
+    base_ms, base_body = timed(lambda: current_path(estimate, items), args.repeat)
+    compiled_ms, _ = timed(lambda: compiled_path(estimate, items), args.repeat)
+    row_ms, row_body = timed(lambda: row_path(estimate, rows), args.repeat)
+
+    print(f"line items: {args.items}  repeat: {args.repeat}  "
+          f"encoder: {'orjson' if orjson else 'json'}")
+    print(f"{'to_dict + json':<22}{base_ms:>10.2f} ms")
+    print(f"{'compiled + dumps':<22}{compiled_ms:>10.2f} ms  ({base_ms / compiled_ms:.1f}x)")
+    print(f"{'row tuples + dumps':<22}{row_ms:>10.2f} ms  ({base_ms / row_ms:.1f}x)")
+
+    gz_body, _ = compress_body(row_body, 'gzip')
+    print(f"payload: {len(base_body):,} bytes raw, {len(gz_body):,} gzip", end='')
+    if brotli is not None:
+        br_body, _ = compress_body(row_body, 'br')
+        print(f", {len(br_body):,} br", end='')
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Ohmni Estimate - Supplier Transport Benchmark
+Drop into: backend/benchmarks/bench_supplier_transport.py
+
+Price lookups against the local stub supplier API (supplier_stub_server.py):
+    1. new connection:  a fresh TCP connection per request (pool keeps none idle)
+    2. pooled:          keep-alive connections reused through SupplierTransport
+    3. adapter bulk:    GraybarAdapter.get_bulk_prices (OAuth + gzip) in batches
+
+No network or credentials needed:
+    python -m backend.benchmarks.bench_supplier_transport --requests 2000 --threads 8 --latency-ms 5
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import os
+import statistics
+import time
+
+from backend.benchmarks.supplier_stub_server import StubConfig, start_stub_server
+from backend.services.supplier_adapters import GraybarAdapter
+from backend.services.supplier_transport import SupplierTransport, close_transports
+
+
+def run(transport: SupplierTransport, skus, threads: int):
+    latencies = []
+
+    def lookup(sku):
+        result = transport.request('GET', f'/api/products/{sku}/price', params={'quantity': 1})
+        latencies.append(result.elapsed_ms)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lookup, skus))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'rps': len(skus) / elapsed,
+        'p50': statistics.median(latencies),
+        'p95': latencies[int(len(latencies) * 0.95) - 1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--latency-ms', type=float, default=5.0)
+    parser.add_argument('--bulk-skus', type=int, default=5000)
+    args = parser.parse_args()
+
+    server, _ = start_stub_server(StubConfig(
+        latency_ms=args.latency_ms, jitter_ms=0, require_auth=False,
+        catalog_size=max(args.requests, args.bulk_skus)
+    ))
+    skus = list(server.catalog)
+    lookups = [skus[i % len(skus)] for i in range(args.requests)]
+
+    print(f"requests: {args.requests}  threads: {args.threads}  server latency: {args.latency_ms} ms")
+    for label, maxsize in (('new connection', 0), ('pooled keep-alive', args.threads)):
+        transport = SupplierTransport(server.base_url, max_connections=maxsize)
+        result = run(transport, lookups, args.threads)
+        stats = transport.stats()
+        transport.close()
+        print(f"{label:<20}{result['rps']:>9.0f} req/s  p50 {result['p50']:6.2f} ms  "
+              f"p95 {result['p95']:6.2f} ms  connections {stats['connections_opened']}")
+
+    server.config.require_auth = True
+    os.environ.update({
+        'GRAYBAR_API_URL': server.base_url,
+        'GRAYBAR_CLIENT_ID': 'bench', 'GRAYBAR_CLIENT_SECRET': 'bench',
+    })
+    adapter = GraybarAdapter()
+    bulk = skus[:args.bulk_skus]
+    served = server.stats['requests']
+    start = time.perf_counter()
+    priced = 0
+    for i in range(0, len(bulk), adapter.bulk_batch_size):
+        priced += len(adapter.get_bulk_prices(bulk[i:i + adapter.bulk_batch_size]))
+    elapsed = time.perf_counter() - start
+    print(f"{'adapter bulk':<20}{priced / elapsed:>9.0f} SKU/s  ({priced} SKUs, "
+          f"{server.stats['requests'] - served} requests)")
+
+    close_transports()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
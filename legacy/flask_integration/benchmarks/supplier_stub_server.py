@@ -0,0 +1,293 @@
+"""
+Ohmni Estimate - Stub Supplier API Server
+Drop into: backend/benchmarks/supplier_stub_server.py
+
+Local stand-in for a distributor B2B API (the endpoints GraybarAdapter and
+WESCOAdapter call), for offline tests and transport benchmarks. Simulates
+latency (base + jitter + a slow tail), random 503s and a 429 rate limit.
+
+    POST /oauth/token                 client credentials -> access_token
+    GET  /api/products/search?q=...   {"products": [product, ...]}
+    GET  /api/products/{sku}/price    product, or 404
+    POST /api/quotes {"skus": [...]}  {"prices": {sku: product}}
+
+Run standalone:
+    python -m backend.benchmarks.supplier_stub_server --port 8765 --latency-ms 50 --error-rate 0.01
+then point an adapter at it:
+    GRAYBAR_API_URL=http://127.0.0.1:8765 GRAYBAR_CLIENT_ID=x GRAYBAR_CLIENT_SECRET=y
+
+Or in-process: server, thread = start_stub_server(StubConfig(latency_ms=20))
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+import argparse
+import csv
+import gzip
+import json
+import random
+import secrets
+import threading
+import time
+
+
+@dataclass
+class StubConfig:
+    latency_ms: float = 20.0
+    jitter_ms: float = 10.0
+    tail_rate: float = 0.0        # fraction of requests that take tail_ms
+    tail_ms: float = 2000.0
+    error_rate: float = 0.0       # fraction answered with 503
+    rate_limit_rps: float = 0.0   # 0 = unlimited; above it requests get 429
+    token_ttl_seconds: int = 3600
+    require_auth: bool = True
+    catalog_size: int = 5000
+    csv_path: Optional[str] = None
+    seed: int = 7
+
+
+_WORDS = ['EMT', 'conduit', 'THHN', 'copper', 'receptacle', 'duplex', 'breaker', 'panel',
+          'box', 'connector', 'coupling', 'strap', 'switch', 'fixture', 'LED', 'wire']
+_SIZES = ['1/2"', '3/4"', '1"', '1-1/4"', '#12', '#10', '#6', '20A', '30A']
+
+
+def build_catalog(config: StubConfig) -> Dict[str, Dict]:
+    """sku -> product dict, from config.csv_path or generated."""
+    valid_until = (datetime.utcnow() + timedelta(days=7)).isoformat() + 'Z'
+    catalog = {}
+    if config.csv_path:
+        with open(config.csv_path, newline='') as f:
+            for row in csv.DictReader(f):
+                catalog[row['sku']] = {
+                    'sku': row['sku'], 'description': row['description'],
+                    'unit_price': float(row['unit_price']), 'uom': row.get('uom') or 'EA',
+                    'quantity_available': None, 'lead_time_days': None, 'valid_until': valid_until,
+                }
+        return catalog
+
+    rng = random.Random(config.seed)
+    for i in range(config.catalog_size):
+        sku = f"STB-{i:06d}"
+        catalog[sku] = {
+            'sku': sku,
+            'description': f"{' '.join(rng.sample(_WORDS, 3))} {rng.choice(_SIZES)}",
+            'unit_price': round(rng.uniform(0.5, 500), 2),
+            'uom': rng.choice(['EA', 'EA', 'C', 'M']),
+            'quantity_available': rng.randint(0, 5000),
+            'lead_time_days': rng.choice([0, 1, 3, 10]),
+            'valid_until': valid_until,
+        }
+    return catalog
+
+
+class _RateLimiter:
+    def __init__(self, rps: float):
+        self.rps = rps
+        self.tokens = rps
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        if self.rps <= 0:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rps, self.tokens + (now - self.updated) * self.rps)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class StubSupplierServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], config: StubConfig):
+        super().__init__(address, _Handler)
+        self.config = config
+        self.catalog = build_catalog(config)
+        self.tokens = set()
+        self.limiter = _RateLimiter(config.rate_limit_rps)
+        self.rng = random.Random(config.seed)
+        self.lock = threading.Lock()
+        self.stats = {'requests': 0, 'rate_limited': 0, 'errors': 0, 'unauthorized': 0}
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key: str):
+        with self.lock:
+            self.stats[key] += 1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+    def log_message(self, format, *args):
+        pass
+
+    # -------------------------------------------------------------------------
+    # PLUMBING
+    # -------------------------------------------------------------------------
+
+    def _send(self, status: int, payload, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload).encode()
+        if 'gzip' in self.headers.get('Accept-Encoding', '') and len(body) > 512:
+            body = gzip.compress(body)
+            headers = {**(headers or {}), 'Content-Encoding': 'gzip'}
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> bytes:
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if self.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        return body
+
+    def _simulate(self) -> bool:
+        """Latency, 429 and 503 simulation. Returns False if a response was sent."""
+        server: StubSupplierServer = self.server
+        config = server.config
+        server.count('requests')
+        if not server.limiter.allow():
+            server.count('rate_limited')
+            self._send(429, {'error': 'rate limited'}, {'Retry-After': '1'})
+            return False
+
+        with server.lock:
+            slow = server.rng.random() < config.tail_rate
+            failed = server.rng.random() < config.error_rate
+            jitter = server.rng.uniform(0, config.jitter_ms)
+        time.sleep((config.tail_ms if slow else config.latency_ms + jitter) / 1000)
+
+        if failed:
+            server.count('errors')
+            self._send(503, {'error': 'service unavailable'}, {'Retry-After': '1'})
+            return False
+        return True
+
+    def _authorized(self) -> bool:
+        server: StubSupplierServer = self.server
+        if not server.config.require_auth:
+            return True
+        auth = self.headers.get('Authorization', '')
+        if auth.startswith('Bearer ') and auth[7:] in server.tokens:
+            return True
+        if self.headers.get('X-API-Key'):
+            return True
+        server.count('unauthorized')
+        self._send(401, {'error': 'unauthorized'})
+        return False
+
+    # -------------------------------------------------------------------------
+    # ENDPOINTS
+    # -------------------------------------------------------------------------
+
+    def do_POST(self):
+        server: StubSupplierServer = self.server
+        url = urlsplit(self.path)
+        body = self._body()
+
+        if url.path == '/oauth/token':
+            form = parse_qs(body.decode())
+            if not form.get('client_id') or not form.get('client_secret'):
+                self._send(401, {'error': 'invalid_client'})
+                return
+            token = secrets.token_hex(16)
+            with server.lock:
+                server.tokens.add(token)
+            self._send(200, {
+                'access_token': token, 'token_type': 'bearer',
+                'expires_in': server.config.token_ttl_seconds,
+            })
+            return
+
+        if not self._simulate() or not self._authorized():
+            return
+        if url.path == '/api/quotes':
+            skus = json.loads(body or b'{}').get('skus', [])
+            self._send(200, {'prices': {s: server.catalog[s] for s in skus if s in server.catalog}})
+            return
+        self._send(404, {'error': 'not found'})
+
+    def do_GET(self):
+        server: StubSupplierServer = self.server
+        url = urlsplit(self.path)
+        if not self._simulate() or not self._authorized():
+            return
+
+        params = parse_qs(url.query)
+        if url.path == '/api/products/search':
+            query = (params.get('q') or [''])[0].lower()
+            limit = int((params.get('limit') or ['50'])[0])
+            products = [
+                p for p in server.catalog.values()
+                if query and (query in p['sku'].lower() or query in p['description'].lower())
+            ][:limit]
+            self._send(200, {'products': products})
+            return
+
+        parts = url.path.strip('/').split('/')
+        if len(parts) == 4 and parts[:2] == ['api', 'products'] and parts[3] == 'price':
+            product = server.catalog.get(unquote(parts[2]))
+            if product is None:
+                self._send(404, {'error': 'unknown sku'})
+            else:
+                self._send(200, product)
+            return
+        self._send(404, {'error': 'not found'})
+
+
+def start_stub_server(config: Optional[StubConfig] = None, host: str = '127.0.0.1',
+                      port: int = 0) -> Tuple[StubSupplierServer, threading.Thread]:
+    """Serve in a daemon thread (port 0 = any free port). Stop with server.shutdown()."""
+    server = StubSupplierServer((host, port), config or StubConfig())
+    thread = threading.Thread(target=server.serve_forever, name='supplier-stub', daemon=True)
+    thread.start()
+    return server, thread
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=20.0)
+    parser.add_argument('--jitter-ms', type=float, default=10.0)
+    parser.add_argument('--tail-rate', type=float, default=0.0)
+    parser.add_argument('--tail-ms', type=float, default=2000.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='requests/second, 0 = unlimited')
+    parser.add_argument('--catalog-size', type=int, default=5000)
+    parser.add_argument('--csv', dest='csv_path')
+    parser.add_argument('--no-auth', action='store_true')
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, tail_rate=args.tail_rate,
+        tail_ms=args.tail_ms, error_rate=args.error_rate, rate_limit_rps=args.rate_limit,
+        catalog_size=args.catalog_size, csv_path=args.csv_path, require_auth=not args.no_auth
+    )
+    server = StubSupplierServer((args.host, args.port), config)
+    print(f"Stub supplier API on {server.base_url} ({len(server.catalog)} SKUs)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
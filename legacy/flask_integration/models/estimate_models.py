@@ -3,7 +3,10 @@ Ohmni Estimate - SQLAlchemy Models
 Drop into: backend/models/estimate_models.py
 
 Then add to backend/models/__init__.py:
-    from .estimate_models import Estimate, EstimateLineItem, PricingItem, Proposal
+    from .estimate_models import (
+        Estimate, EstimateLineItem, OutcomeStatsBucket, PricingItem, PricingItemPrice,
+        PricingOverlay, Proposal
+    )
 """
 
 from datetime import datetime
@@ -17,6 +20,29 @@ def generate_uuid():
     return str(uuid.uuid4())
 
 
+def calculate_line(qty, mat_cost, labor_hrs, unit_type, labor_rate=118.00, tax_rate=0.1025, op_rate=0):
+    """
+    Line item math shared by EstimateLineItem.calculate and set-based repricing.
+    Returns (material_extension, labor_extension, total_cost).
+    """
+    # Calculate extensions based on unit type
+    if unit_type == 'C':  # Per 100 ft
+        material_extension = (qty * mat_cost) / 100
+        labor_extension = (qty * labor_hrs) / 100
+    elif unit_type == 'M':  # Per 1000 ft
+        material_extension = (qty * mat_cost) / 1000
+        labor_extension = (qty * labor_hrs) / 1000
+    else:  # Each or Lot
+        material_extension = qty * mat_cost
+        labor_extension = qty * labor_hrs
+
+    # Calculate total: ((labor × rate) + (material × (1 + tax))) × (1 + O&P)
+    labor_cost = labor_extension * labor_rate
+    material_with_tax = material_extension * (1 + tax_rate)
+    subtotal = labor_cost + material_with_tax
+    return material_extension, labor_extension, subtotal * (1 + op_rate)
+
+
 class PricingItem(db.Model):
     """
     Master pricing database - conduit, wire, equipment, devices, fixtures
@@ -53,6 +79,7 @@ class PricingItem(db.Model):
 
     # Metadata
     is_active = db.Column(db.Boolean, default=True)
+    import_batch = db.Column(db.String(36), nullable=True, index=True)  # Import job that staged this row
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -77,6 +104,90 @@ class PricingItem(db.Model):
         }
 
 
+class PricingItemPrice(db.Model):
+    """
+    Effective-dated price history for a pricing item.
+    A row applies from `effective_from` until the next row for the same item.
+    Rows recorded together share a `price_book` label (e.g. "2024-Q3", an import job id).
+    """
+    __tablename__ = 'pricing_item_prices'
+
+    id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
+    pricing_item_id = db.Column(db.String(36), db.ForeignKey('pricing_items.id'), nullable=False)
+
+    price_book = db.Column(db.String(100), nullable=False)
+    effective_from = db.Column(db.DateTime, nullable=False)
+
+    material_cost = db.Column(db.Numeric(10, 2), nullable=False, default=0)
+    labor_hours = db.Column(db.Numeric(8, 3), nullable=False, default=0)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_price_item_effective', 'pricing_item_id', 'effective_from'),
+        Index('idx_price_book', 'price_book'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'pricing_item_id': self.pricing_item_id,
+            'price_book': self.price_book,
+            'effective_from': self.effective_from.isoformat() if self.effective_from else None,
+            'material_cost': float(self.material_cost) if self.material_cost else 0,
+            'labor_hours': float(self.labor_hours) if self.labor_hours else 0,
+        }
+
+
+class PricingOverlay(db.Model):
+    """
+    Price adjustment layered over the base catalog.
+    layer='region' (layer_key e.g. 'CHI') or layer='project_type' (e.g. 'hospital').
+    Scope is one pricing item, a whole category, or (neither set) the layer itself,
+    which is where a region's labor_rate lives.
+    """
+    __tablename__ = 'pricing_overlays'
+
+    id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
+
+    layer = db.Column(db.String(20), nullable=False)  # region, project_type
+    layer_key = db.Column(db.String(50), nullable=False)
+
+    # Scope (most specific wins within a layer)
+    pricing_item_id = db.Column(db.String(36), db.ForeignKey('pricing_items.id'), nullable=True)
+    category = db.Column(db.String(50), nullable=True)
+
+    # material = base × material_multiplier + material_adder; labor = base × labor_multiplier
+    material_multiplier = db.Column(db.Numeric(6, 4), nullable=False, default=1)
+    material_adder = db.Column(db.Numeric(10, 2), nullable=False, default=0)
+    labor_multiplier = db.Column(db.Numeric(6, 4), nullable=False, default=1)
+
+    # Default labor rate for estimates in this layer (layer-wide rows only)
+    labor_rate = db.Column(db.Numeric(10, 2), nullable=True)
+
+    is_active = db.Column(db.Boolean, default=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_overlay_layer_key', 'layer', 'layer_key'),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'layer': self.layer,
+            'layer_key': self.layer_key,
+            'pricing_item_id': self.pricing_item_id,
+            'category': self.category,
+            'material_multiplier': float(self.material_multiplier) if self.material_multiplier is not None else 1,
+            'material_adder': float(self.material_adder) if self.material_adder else 0,
+            'labor_multiplier': float(self.labor_multiplier) if self.labor_multiplier is not None else 1,
+            'labor_rate': float(self.labor_rate) if self.labor_rate else None,
+            'is_active': self.is_active,
+        }
+
+
 class Estimate(db.Model):
     """
     A complete electrical estimate/bid
@@ -104,6 +215,7 @@ class Estimate(db.Model):
     # Project specs
     square_footage = db.Column(db.Integer, nullable=True)
     project_type = db.Column(db.String(50), nullable=True)  # warehouse, office, retail, industrial
+    region = db.Column(db.String(50), nullable=True)  # metro code for regional pricing overlays
 
     # Pricing parameters (can override defaults per estimate)
     labor_rate = db.Column(db.Numeric(10, 2), default=118.00)
@@ -125,10 +237,12 @@ class Estimate(db.Model):
     submitted_at = db.Column(db.DateTime, nullable=True)
     outcome_at = db.Column(db.DateTime, nullable=True)
     won_amount = db.Column(db.Numeric(12, 2), nullable=True)  # Actual contract amount if won
+    deleted_at = db.Column(db.DateTime, nullable=True)  # Soft delete; purged in the background
 
     # Metadata for AI learning
     estimate_metadata = db.Column(JSONB, default=dict)
     # Store: source (chat/photo/manual), confidence scores, AI suggestions, etc.
+    # price_overrides: {pricing_item_id: {material_cost, labor_hours}} (top pricing layer)
 
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -140,6 +254,12 @@ class Estimate(db.Model):
                                  cascade='all, delete-orphan')
     user = db.relationship('User', backref='estimates')
 
+    # Archival sweep: closed estimates by outcome date; purge: soft-deleted by date
+    __table_args__ = (
+        Index('idx_estimate_status_outcome', 'status', 'outcome_at'),
+        Index('idx_estimate_deleted_at', 'deleted_at'),
+    )
+
     def to_dict(self, include_line_items=False):
         data = {
             'id': self.id,
@@ -152,6 +272,7 @@ class Estimate(db.Model):
             'contact_name': self.contact_name,
             'square_footage': self.square_footage,
             'project_type': self.project_type,
+            'region': self.region,
             'labor_rate': float(self.labor_rate) if self.labor_rate else 118.00,
             'material_tax_rate': float(self.material_tax_rate) if self.material_tax_rate else 0.1025,
             'overhead_profit_rate': float(self.overhead_profit_rate) if self.overhead_profit_rate else 0,
@@ -191,6 +312,10 @@ class Estimate(db.Model):
             total_material += float(item.material_extension) if item.material_extension else 0
             total_labor_hours += float(item.labor_extension) if item.labor_extension else 0
 
+        self.apply_totals(total_material, total_labor_hours)
+
+    def apply_totals(self, total_material, total_labor_hours):
+        """Set denormalized totals from summed line item extensions"""
         labor_rate = float(self.labor_rate) if self.labor_rate else 118.00
         tax_rate = float(self.material_tax_rate) if self.material_tax_rate else 0.1025
         op_rate = float(self.overhead_profit_rate) if self.overhead_profit_rate else 0
@@ -216,7 +341,7 @@ class EstimateLineItem(db.Model):
     id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
     estimate_id = db.Column(db.String(36), db.ForeignKey('estimates.id'), nullable=False, index=True)
 
-    # Optional link to master pricing item
+    # Optional link to master pricing item (reverse lookup for repricing)
     pricing_item_id = db.Column(db.String(36), db.ForeignKey('pricing_items.id'), nullable=True)
 
     # Category for grouping
@@ -254,6 +379,11 @@ class EstimateLineItem(db.Model):
     # Relationship to pricing item
     pricing_item = db.relationship('PricingItem', backref='line_items')
 
+    # Pricing item -> line items, covering the join back to estimates
+    __table_args__ = (
+        Index('idx_line_item_pricing_item', 'pricing_item_id', 'estimate_id'),
+    )
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -279,22 +409,9 @@ class EstimateLineItem(db.Model):
         mat_cost = float(self.material_unit_cost) if self.material_unit_cost else 0
         labor_hrs = float(self.labor_hours_per_unit) if self.labor_hours_per_unit else 0
 
-        # Calculate extensions based on unit type
-        if self.unit_type == 'C':  # Per 100 ft
-            self.material_extension = (qty * mat_cost) / 100
-            self.labor_extension = (qty * labor_hrs) / 100
-        elif self.unit_type == 'M':  # Per 1000 ft
-            self.material_extension = (qty * mat_cost) / 1000
-            self.labor_extension = (qty * labor_hrs) / 1000
-        else:  # Each or Lot
-            self.material_extension = qty * mat_cost
-            self.labor_extension = qty * labor_hrs
-
-        # Calculate total: ((labor × rate) + (material × (1 + tax))) × (1 + O&P)
-        labor_cost = float(self.labor_extension) * labor_rate
-        material_with_tax = float(self.material_extension) * (1 + tax_rate)
-        subtotal = labor_cost + material_with_tax
-        self.total_cost = subtotal * (1 + op_rate)
+        self.material_extension, self.labor_extension, self.total_cost = calculate_line(
+            qty, mat_cost, labor_hrs, self.unit_type, labor_rate, tax_rate, op_rate
+        )
 
 
 class Proposal(db.Model):
@@ -325,6 +442,12 @@ class Proposal(db.Model):
     # Versioning
     version = db.Column(db.Integer, default=1)
 
+    # Background rendering (services/proposal_rendering.py)
+    render_status = db.Column(db.String(20), default='pending')  # pending, rendering, ready, failed
+    source_revision = db.Column(db.String(64), nullable=True)  # estimate revision rendered
+    render_error = db.Column(db.Text, nullable=True)
+    rendered_at = db.Column(db.DateTime, nullable=True)
+
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -340,5 +463,78 @@ class Proposal(db.Model):
             'valid_days': self.valid_days,
             'valid_until': self.valid_until.isoformat() if self.valid_until else None,
             'version': self.version,
+            'render_status': self.render_status,
+            'source_revision': self.source_revision,
+            'render_error': self.render_error,
+            'rendered_at': self.rendered_at.isoformat() if self.rendered_at else None,
             'created_at': self.created_at.isoformat() if self.created_at else None,
         }
+
+
+class OutcomeStatsBucket(db.Model):
+    """
+    Running win/loss statistics for one bucket of a user's outcomes, updated
+    incrementally by record_outcome (see services/outcome_stats.py).
+    dimension: all, project_type, gc_name, month (bucket_key 'YYYY-MM')
+    """
+    __tablename__ = 'estimate_outcome_stats'
+
+    id = db.Column(db.String(36), primary_key=True, default=generate_uuid)
+    user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
+
+    dimension = db.Column(db.String(20), nullable=False)
+    bucket_key = db.Column(db.String(255), nullable=False)
+
+    # Counts and sums
+    outcomes = db.Column(db.Integer, nullable=False, default=0)
+    wins = db.Column(db.Integer, nullable=False, default=0)
+    final_bid_sum = db.Column(db.Numeric(16, 2), nullable=False, default=0)
+    won_bid_sum = db.Column(db.Numeric(16, 2), nullable=False, default=0)
+    won_amount_sum = db.Column(db.Numeric(16, 2), nullable=False, default=0)
+    price_per_sqft_count = db.Column(db.Integer, nullable=False, default=0)
+    price_per_sqft_sum = db.Column(db.Numeric(14, 4), nullable=False, default=0)
+
+    # Serialized quantile sketches: price_per_sqft (all / won), won_amount / final_bid
+    sketches = db.Column(JSONB, default=dict)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'dimension', 'bucket_key', name='uq_outcome_stats_bucket'),
+    )
+
+
+# =============================================================================
+# COLD STORAGE
+# =============================================================================
+
+def _archive_table(model, name, *indexes):
+    """
+    Column-for-column copy of a model's table (no foreign keys), plus archived_at.
+    Rows move here with INSERT ... SELECT, so column names must match the hot table.
+    """
+    columns = [
+        db.Column(c.name, c.type, primary_key=c.primary_key, nullable=c.nullable)
+        for c in model.__table__.columns
+    ]
+    return db.Table(
+        name, db.metadata,
+        *columns,
+        db.Column('archived_at', db.DateTime, nullable=False, default=datetime.utcnow),
+        *indexes
+    )
+
+
+# Won/lost estimates moved out of the hot tables (see services/estimate_archive.py)
+estimates_archive = _archive_table(
+    Estimate, 'estimates_archive',
+    Index('idx_estimates_archive_user', 'user_id', 'status')
+)
+estimate_line_items_archive = _archive_table(
+    EstimateLineItem, 'estimate_line_items_archive',
+    Index('idx_line_items_archive_estimate', 'estimate_id')
+)
+proposals_archive = _archive_table(
+    Proposal, 'proposals_archive',
+    Index('idx_proposals_archive_estimate', 'estimate_id')
+)
@@ -0,0 +1,323 @@
+"""
+Ohmni Estimate - Admin API Routes
+Drop into: backend/routes/admin_routes.py
+
+Admin-only catalog maintenance: pricing imports, price books, pricing
+overlays and the estimate archive. Every route requires admin_required.
+
+Mounted under estimation_bp (/api/estimates) by estimation_routes.py.
+"""
+
+from flask import Blueprint, current_app, request, jsonify
+from flask_jwt_extended import jwt_required
+import logging
+import os
+
+from backend.services.pricing_import import (
+    IMPORT_BATCH_SIZE, get_import_job, list_import_jobs, start_import_job
+)
+from backend.services.estimate_archive import (
+    ARCHIVE_AFTER_DAYS, ARCHIVE_BATCH_SIZE, archive_closed_estimates, archive_stats
+)
+from backend.services.pricing_layers import pricing_layers
+from backend.services.price_history import record_price_book
+from backend.models.estimate_models import PricingOverlay
+from backend.extensions import db
+from backend.routes.estimation_helpers import admin_required, parse_as_of
+
+logger = logging.getLogger(__name__)
+
+admin_bp = Blueprint('admin', __name__)
+
+
+# =============================================================================
+# ADMIN: IMPORT PRICING DATABASE
+# =============================================================================
+
+@admin_bp.route('/admin/import-pricing', methods=['POST'])
+@jwt_required()
+@admin_required
+def import_pricing():
+    """
+    Start a background import of the pricing database from JSON.
+    Admin only. The new catalog replaces the live one atomically when the
+    job completes; poll the returned status URL for progress.
+
+    POST /api/estimates/admin/import-pricing
+    {
+        "json_path": "flask_integration/data/pricing_database.json",
+        "batch_size": 500
+    }
+
+    Set PRICING_IMPORT_DIR in the app config to restrict json_path to one directory.
+    """
+    try:
+        data = request.get_json() or {}
+        json_path = data.get('json_path', 'flask_integration/data/pricing_database.json')
+
+        import_dir = current_app.config.get('PRICING_IMPORT_DIR')
+        if import_dir:
+            root = os.path.realpath(import_dir)
+            json_path = os.path.realpath(os.path.join(root, json_path))
+            if os.path.commonpath([root, json_path]) != root:
+                return jsonify({'error': 'json_path must be inside PRICING_IMPORT_DIR'}), 400
+
+        job = start_import_job(
+            current_app._get_current_object(),
+            json_path,
+            batch_size=data.get('batch_size', IMPORT_BATCH_SIZE)
+        )
+
+        return jsonify({
+            'success': True,
+            'job': job.to_dict(),
+            'status_url': f"{request.script_root}{request.path}/{job.id}"
+        }), 202
+
+    except FileNotFoundError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error importing pricing: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@admin_bp.route('/admin/import-pricing', methods=['GET'])
+@jwt_required()
+@admin_required
+def list_pricing_imports():
+    """
+    Recent pricing import jobs, newest first.
+
+    GET /api/estimates/admin/import-pricing
+    """
+    jobs = list_import_jobs()
+    return jsonify({
+        'success': True,
+        'jobs': [job.to_dict() for job in jobs],
+        'count': len(jobs)
+    })
+
+
+@admin_bp.route('/admin/import-pricing/<job_id>', methods=['GET'])
+@jwt_required()
+@admin_required
+def get_pricing_import(job_id):
+    """
+    Progress and row counts for a pricing import job.
+
+    GET /api/estimates/admin/import-pricing/{job_id}
+    """
+    job = get_import_job(job_id)
+    if not job:
+        return jsonify({'error': 'Import job not found'}), 404
+
+    return jsonify({
+        'success': True,
+        'job': job.to_dict()
+    })
+
+
+@admin_bp.route('/admin/price-books', methods=['POST'])
+@jwt_required()
+@admin_required
+def create_price_book():
+    """
+    Record an effective-dated price book.
+    Admin only. Omit "prices" to snapshot the live catalog.
+
+    POST /api/estimates/admin/price-books
+    {
+        "price_book": "2025-Q1",
+        "effective_from": "2025-01-01",
+        "prices": [
+            {"pricing_item_id": "uuid-here", "material_cost": 61.50, "labor_hours": 1.3}
+        ]
+    }
+    """
+    try:
+        data = request.get_json()
+        if not data.get('price_book'):
+            return jsonify({'error': 'price_book is required'}), 400
+
+        count = record_price_book(
+            data['price_book'],
+            effective_from=parse_as_of(data.get('effective_from')),
+            prices=data.get('prices')
+        )
+
+        return jsonify({
+            'success': True,
+            'price_book': data['price_book'],
+            'prices_recorded': count
+        }), 201
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error recording price book: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+# =============================================================================
+# ADMIN: PRICING OVERLAYS
+# =============================================================================
+
+@admin_bp.route('/admin/pricing-overlays', methods=['GET'])
+@jwt_required()
+@admin_required
+def list_pricing_overlays():
+    """
+    List active regional and project_type pricing overlays.
+
+    GET /api/estimates/admin/pricing-overlays?layer=region&layer_key=CHI
+    """
+    try:
+        query = PricingOverlay.query.filter_by(is_active=True)
+        if request.args.get('layer'):
+            query = query.filter_by(layer=request.args['layer'])
+        if request.args.get('layer_key'):
+            query = query.filter_by(layer_key=request.args['layer_key'])
+        overlays = query.order_by(PricingOverlay.layer, PricingOverlay.layer_key).all()
+
+        return jsonify({
+            'success': True,
+            'overlays': [o.to_dict() for o in overlays],
+            'count': len(overlays)
+        })
+
+    except Exception as e:
+        logger.error(f"Error listing pricing overlays: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@admin_bp.route('/admin/pricing-overlays', methods=['POST'])
+@jwt_required()
+@admin_required
+def create_pricing_overlay():
+    """
+    Add a pricing overlay. Admin only.
+    Scope with pricing_item_id or category; omit both for a layer-wide row
+    (the only place labor_rate is read from).
+
+    POST /api/estimates/admin/pricing-overlays
+    {
+        "layer": "region",
+        "layer_key": "CHI",
+        "category": "WIRE",
+        "material_multiplier": 1.08,
+        "material_adder": 0,
+        "labor_multiplier": 1.0,
+        "labor_rate": null
+    }
+    """
+    try:
+        data = request.get_json()
+        if data.get('layer') not in ('region', 'project_type'):
+            return jsonify({'error': "layer must be 'region' or 'project_type'"}), 400
+        if not data.get('layer_key'):
+            return jsonify({'error': 'layer_key is required'}), 400
+
+        overlay = PricingOverlay(
+            layer=data['layer'],
+            layer_key=data['layer_key'],
+            pricing_item_id=data.get('pricing_item_id'),
+            category=data.get('category'),
+            material_multiplier=data.get('material_multiplier', 1),
+            material_adder=data.get('material_adder', 0),
+            labor_multiplier=data.get('labor_multiplier', 1),
+            labor_rate=data.get('labor_rate')
+        )
+        db.session.add(overlay)
+        db.session.commit()
+        pricing_layers.invalidate()
+
+        return jsonify({
+            'success': True,
+            'overlay': overlay.to_dict()
+        }), 201
+
+    except Exception as e:
+        logger.error(f"Error creating pricing overlay: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@admin_bp.route('/admin/pricing-overlays/<overlay_id>', methods=['DELETE'])
+@jwt_required()
+@admin_required
+def delete_pricing_overlay(overlay_id):
+    """
+    Deactivate a pricing overlay. Admin only.
+
+    DELETE /api/estimates/admin/pricing-overlays/{overlay_id}
+    """
+    try:
+        overlay = PricingOverlay.query.get(overlay_id)
+        if not overlay:
+            return jsonify({'error': 'Overlay not found'}), 404
+
+        overlay.is_active = False
+        db.session.commit()
+        pricing_layers.invalidate()
+
+        return jsonify({
+            'success': True,
+            'message': 'Overlay deactivated'
+        })
+
+    except Exception as e:
+        logger.error(f"Error deleting pricing overlay: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+# =============================================================================
+# ADMIN: ESTIMATE ARCHIVE
+# =============================================================================
+
+@admin_bp.route('/admin/archive', methods=['POST'])
+@jwt_required()
+@admin_required
+def archive_estimates():
+    """
+    Move won/lost estimates closed more than N days ago to the archive tables.
+    Admin only. Safe to run repeatedly (e.g. nightly from cron).
+
+    POST /api/estimates/admin/archive
+    {"older_than_days": 180, "batch_size": 200}
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        moved = archive_closed_estimates(
+            older_than_days=int(data.get('older_than_days', ARCHIVE_AFTER_DAYS)),
+            batch_size=int(data.get('batch_size', ARCHIVE_BATCH_SIZE))
+        )
+
+        return jsonify({
+            'success': True,
+            'archived': moved
+        })
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error archiving estimates: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@admin_bp.route('/admin/archive', methods=['GET'])
+@jwt_required()
+@admin_required
+def get_archive_stats():
+    """
+    Hot vs archived row counts per table.
+
+    GET /api/estimates/admin/archive
+    """
+    try:
+        return jsonify({
+            'success': True,
+            'tables': archive_stats()
+        })
+
+    except Exception as e:
+        logger.error(f"Error reading archive stats: {e}")
+        return jsonify({'error': str(e)}), 500
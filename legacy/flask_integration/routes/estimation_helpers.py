@@ -0,0 +1,139 @@
+"""
+Ohmni Estimate - API Route Helpers
+Drop into: backend/routes/estimation_helpers.py
+
+Request parsing and auth helpers shared by the estimate route modules
+(estimation_routes.py and the route groups it mounts).
+"""
+
+from flask import current_app, request, jsonify
+from flask_jwt_extended import get_jwt, get_jwt_identity
+from datetime import datetime, timezone
+from functools import wraps
+
+from backend.services.estimation_service import EstimationService
+from backend.services.estimate_archive import restore_estimate
+from backend.services.estimate_serializers import (
+    estimate_serializer, line_item_serializer, project_estimate,
+    project_line_items, project_category_totals, category_totals_from_items
+)
+
+
+# =============================================================================
+# HELPER
+# =============================================================================
+
+def get_service():
+    """Get estimation service for current user."""
+    user_id = get_jwt_identity()
+    return EstimationService(user_id)
+
+
+def is_admin() -> bool:
+    """
+    True for a token carrying role "admin" (or is_admin) in its claims, or
+    for a user id listed in the ADMIN_USER_IDS app config.
+    """
+    claims = get_jwt() or {}
+    if claims.get('role') == 'admin' or claims.get('is_admin') is True:
+        return True
+    return str(get_jwt_identity()) in {str(u) for u in current_app.config.get('ADMIN_USER_IDS', ())}
+
+
+def admin_required(view):
+    """Reject non-admin callers with 403. Goes below @jwt_required()."""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if not is_admin():
+            return jsonify({'error': 'Admin access required'}), 403
+        return view(*args, **kwargs)
+    return wrapper
+
+
+def requested_fields(resource, serializer, primary=False):
+    """
+    Sparse fieldset from the query string.
+
+    ?fields[line_items]=id,quantity,total_cost   (per resource)
+    ?fields=id,final_bid                         (primary resource only)
+
+    Raises ValueError on unknown fields.
+    """
+    raw = request.args.get(f'fields[{resource}]')
+    if raw is None and primary:
+        raw = request.args.get('fields')
+    if not raw:
+        return serializer
+    return serializer.subset(raw.split(','))
+
+
+def parse_as_of(value):
+    """
+    Parse an ISO date/datetime (e.g. "2024-06-30"). Offsets ("...Z",
+    "+02:00") are converted to naive UTC like the stored dates. Raises ValueError.
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid as_of date: {value}")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+INCLUDES = ('estimate', 'line_items', 'category_totals')
+
+
+def requested_includes(default=()):
+    """
+    Related data to embed, e.g. ?include=line_items,category_totals
+    Raises ValueError on unknown names.
+    """
+    raw = request.args.get('include')
+    if raw is None:
+        return set(default)
+    includes = {part.strip() for part in raw.split(',') if part.strip()}
+    unknown = includes.difference(INCLUDES)
+    if unknown:
+        raise ValueError(f"Unknown include: {', '.join(sorted(unknown))} (allowed: {', '.join(INCLUDES)})")
+    return includes
+
+
+def payload_fields():
+    """
+    (estimate, line item) serializers for estimate_payload. Resolve them before
+    writing, so a bad fields= is a 400 before anything is committed.
+    """
+    return (
+        requested_fields('estimate', estimate_serializer, primary=True),
+        requested_fields('line_items', line_item_serializer)
+    )
+
+
+def estimate_payload(estimate_id, includes, estimate_fields=None, item_fields=None):
+    """
+    Build an estimate response from column projections.
+    Returns None if the estimate doesn't exist for the current user.
+    """
+    serializer = estimate_fields or requested_fields('estimate', estimate_serializer, primary=True)
+    data = project_estimate(estimate_id, get_jwt_identity(), serializer)
+    if data is None:
+        if not restore_estimate(estimate_id, get_jwt_identity()):
+            return None
+        data = project_estimate(estimate_id, get_jwt_identity(), serializer)
+
+    items = None
+    if 'line_items' in includes:
+        item_serializer = item_fields or requested_fields('line_items', line_item_serializer)
+        items = project_line_items(estimate_id, item_serializer)
+        data['line_items'] = items
+
+    if 'category_totals' in includes:
+        if items is not None and {'category', 'total_cost'} <= set(items[0] if items else ()):
+            data['category_totals'] = category_totals_from_items(items)
+        else:
+            data['category_totals'] = project_category_totals(estimate_id)
+
+    return data
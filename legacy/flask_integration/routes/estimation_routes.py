@@ -5,29 +5,42 @@ Drop into: backend/routes/estimation_routes.py
 Register in app_minimal.py:
     from backend.routes.estimation_routes import estimation_bp
     app.register_blueprint(estimation_bp, url_prefix='/api/estimates')
+
+Estimate CRUD and live events live here; line item, pricing, proposal,
+outcome and admin routes are blueprints in their own modules, mounted under
+estimation_bp so they share its /api/estimates prefix.
 """
 
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, Response, request, jsonify, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
 import logging
 
-from backend.services.estimation_service import EstimationService, import_pricing_database
-from backend.models.estimate_models import Estimate, EstimateLineItem, PricingItem
+from backend.services.estimate_archive import project_archived_estimates, restore_estimate
+from backend.services.estimate_events import event_bus, format_sse, totals_payload
+from backend.services.estimate_serializers import (
+    json_response, estimate_serializer, project_estimates, project_estimates_by_id, project_category_rollups
+)
 from backend.extensions import db
+from backend.routes.estimation_helpers import (
+    get_service, requested_fields, requested_includes, payload_fields, estimate_payload
+)
+from backend.routes.line_item_routes import line_items_bp
+from backend.routes.pricing_routes import pricing_bp
+from backend.routes.proposal_routes import proposals_bp
+from backend.routes.outcome_routes import outcomes_bp
+from backend.routes.admin_routes import admin_bp
 
 logger = logging.getLogger(__name__)
 
-estimation_bp = Blueprint('estimation', __name__)
-
+MAX_BATCH_ESTIMATES = 100
 
-# =============================================================================
-# HELPER
-# =============================================================================
-
-def get_service():
-    """Get estimation service for current user."""
-    user_id = get_jwt_identity()
-    return EstimationService(user_id)
+estimation_bp = Blueprint('estimation', __name__)
+# Route groups kept in their own modules share this blueprint's url_prefix
+estimation_bp.register_blueprint(line_items_bp)
+estimation_bp.register_blueprint(pricing_bp)
+estimation_bp.register_blueprint(proposals_bp)
+estimation_bp.register_blueprint(outcomes_bp)
+estimation_bp.register_blueprint(admin_bp)
 
 
 # =============================================================================
@@ -47,6 +60,7 @@ def create_estimate():
         "square_footage": 5000,
         "gc_name": "ABC Construction",
         "project_location": "123 Main St",
+        "region": "CHI",
         "labor_rate": 118.00,
         "material_tax_rate": 0.1025,
         "overhead_profit_rate": 0.15
@@ -55,6 +69,7 @@ def create_estimate():
     try:
         data = request.get_json()
         service = get_service()
+        serializer = requested_fields('estimate', estimate_serializer, primary=True)
 
         estimate = service.create_estimate(
             project_name=data.get('project_name', 'New Estimate'),
@@ -63,16 +78,19 @@ def create_estimate():
             gc_name=data.get('gc_name'),
             project_location=data.get('project_location'),
             chat_session_id=data.get('chat_session_id'),
-            labor_rate=data.get('labor_rate', 118.00),
+            labor_rate=data.get('labor_rate'),
             material_tax_rate=data.get('material_tax_rate', 0.1025),
-            overhead_profit_rate=data.get('overhead_profit_rate', 0)
+            overhead_profit_rate=data.get('overhead_profit_rate', 0),
+            region=data.get('region')
         )
 
-        return jsonify({
+        return json_response({
             'success': True,
-            'estimate': estimate.to_dict()
-        }), 201
+            'estimate': serializer.dump(estimate)
+        }, 201)
 
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error creating estimate: {e}")
         return jsonify({'error': str(e)}), 500
@@ -85,22 +103,100 @@ def list_estimates():
     List user's estimates.
 
     GET /api/estimates?status=draft&limit=20
+    GET /api/estimates?fields=id,project_name,final_bid,status
+    GET /api/estimates?status=won&include_archived=true
+
+    Archived (old won/lost) estimates are listed separately under
+    "archived_estimates" and restored automatically when opened.
     """
     try:
-        service = get_service()
         status = request.args.get('status')
         limit = request.args.get('limit', 50, type=int)
+        serializer = requested_fields('estimates', estimate_serializer, primary=True)
 
-        estimates = service.get_user_estimates(status=status, limit=limit)
+        estimates = project_estimates(
+            get_jwt_identity(), serializer, status=status, limit=limit
+        )
+        payload = {
+            'success': True,
+            'estimates': estimates,
+            'count': len(estimates)
+        }
 
-        return jsonify({
+        if request.args.get('include_archived', 'false').lower() == 'true':
+            payload['archived_estimates'] = project_archived_estimates(
+                get_jwt_identity(), serializer, status=status, limit=limit
+            )
+
+        return json_response(payload)
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error listing estimates: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@estimation_bp.route('/batch', methods=['GET', 'POST'])
+@jwt_required()
+def batch_get_estimates():
+    """
+    Fetch summaries and category rollups for many estimates at once.
+    Runs two queries regardless of how many ids are requested.
+
+    GET  /api/estimates/batch?ids=id1,id2,id3
+    POST /api/estimates/batch
+    {
+        "ids": ["id1", "id2", "id3"]
+    }
+
+    Each estimate carries "category_rollups": {category: {"total", "item_count"}}
+    (GET /<id>'s "category_totals" is {category: total}).
+
+    Supports fields= like the list endpoint. Archived estimates are restored
+    on the way (like GET /<id>); ids that don't exist (or belong to another
+    user) are returned in "missing". The no-miss path stays at two queries.
+    """
+    try:
+        if request.method == 'POST':
+            ids = (request.get_json(silent=True) or {}).get('ids', [])
+            if not isinstance(ids, list) or not all(isinstance(i, str) for i in ids):
+                return jsonify({'error': 'ids must be a list of strings'}), 400
+        else:
+            ids = [i for i in request.args.get('ids', '').split(',') if i]
+
+        # De-duplicate while keeping the caller's order
+        ids = list(dict.fromkeys(ids))
+        if len(ids) > MAX_BATCH_ESTIMATES:
+            return jsonify({'error': f'At most {MAX_BATCH_ESTIMATES} ids per batch'}), 400
+
+        serializer = requested_fields('estimates', estimate_serializer, primary=True)
+        user_id = get_jwt_identity()
+        by_id = {e['id']: e for e in project_estimates_by_id(user_id, ids, serializer)}
+        restored = [i for i in ids if i not in by_id and restore_estimate(i, user_id)]
+        if restored:
+            by_id.update((e['id'], e) for e in project_estimates_by_id(user_id, restored, serializer))
+        rollups = project_category_rollups(list(by_id))
+
+        estimates = []
+        for estimate_id in ids:
+            data = by_id.get(estimate_id)
+            if data is None:
+                continue
+            data['category_rollups'] = rollups.get(estimate_id, {})
+            estimates.append(data)
+
+        return json_response({
             'success': True,
-            'estimates': [e.to_dict() for e in estimates],
+            'estimates': estimates,
+            'missing': [i for i in ids if i not in by_id],
             'count': len(estimates)
         })
 
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
-        logger.error(f"Error listing estimates: {e}")
+        logger.error(f"Error batch fetching estimates: {e}")
         return jsonify({'error': str(e)}), 500
 
 
@@ -111,19 +207,25 @@ def get_estimate(estimate_id):
     Get estimate with line items.
 
     GET /api/estimates/{id}
+    GET /api/estimates/{id}?include=category_totals&fields=id,final_bid
+    GET /api/estimates/{id}?fields[line_items]=id,quantity,total_cost
+
+    include defaults to "line_items,category_totals".
     """
     try:
-        service = get_service()
-        estimate = service.get_estimate(estimate_id)
+        includes = requested_includes(default=('line_items', 'category_totals'))
+        data = estimate_payload(estimate_id, includes)
 
-        if not estimate:
+        if data is None:
             return jsonify({'error': 'Estimate not found'}), 404
 
-        return jsonify({
+        return json_response({
             'success': True,
-            'estimate': estimate.to_dict(include_line_items=True)
+            'estimate': data
         })
 
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error getting estimate: {e}")
         return jsonify({'error': str(e)}), 500
@@ -140,21 +242,32 @@ def update_estimate(estimate_id):
         "project_name": "Updated Name",
         "overhead_profit_rate": 0.20
     }
+
+    Returns totals only; add ?include=estimate,line_items,category_totals
+    for the full estimate.
     """
     try:
         data = request.get_json()
         service = get_service()
+        includes = requested_includes()
+        estimate_fields, item_fields = payload_fields()
 
         estimate = service.update_estimate(estimate_id, **data)
 
         if not estimate:
             return jsonify({'error': 'Estimate not found'}), 404
 
-        return jsonify({
+        response = {
             'success': True,
-            'estimate': estimate.to_dict(include_line_items=True)
-        })
+            'estimate_totals': totals_payload(estimate)
+        }
+        if includes:
+            response['estimate'] = estimate_payload(estimate_id, includes, estimate_fields, item_fields)
 
+        return json_response(response)
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         logger.error(f"Error updating estimate: {e}")
         return jsonify({'error': str(e)}), 500
@@ -164,13 +277,15 @@ def update_estimate(estimate_id):
 @jwt_required()
 def delete_estimate(estimate_id):
     """
-    Delete an estimate.
+    Delete an estimate, its line items and proposals.
 
     DELETE /api/estimates/{id}
+    DELETE /api/estimates/{id}?soft=true   (recoverable until the background purge)
     """
     try:
         service = get_service()
-        success = service.delete_estimate(estimate_id)
+        soft = request.args.get('soft', 'false').lower() == 'true'
+        success = service.delete_estimate(estimate_id, soft=soft)
 
         if not success:
             return jsonify({'error': 'Estimate not found'}), 404
@@ -182,419 +297,146 @@ def delete_estimate(estimate_id):
         return jsonify({'error': str(e)}), 500
 
 
-# =============================================================================
-# LINE ITEM ENDPOINTS
-# =============================================================================
-
-@estimation_bp.route('/<estimate_id>/items', methods=['POST'])
+@estimation_bp.route('/bulk-delete', methods=['POST'])
 @jwt_required()
-def add_line_item(estimate_id):
+def bulk_delete_estimates():
     """
-    Add a line item to an estimate.
+    Delete many estimates with set-based DELETEs.
 
-    POST /api/estimates/{id}/items
+    POST /api/estimates/bulk-delete
     {
-        "category": "POWER_RECEPTACLES",
-        "description": "Duplex Receptacle",
-        "quantity": 25,
-        "material_unit_cost": 60.00,
-        "labor_hours_per_unit": 1.30,
-        "unit_type": "E"
+        "ids": ["id1", "id2"],
+        "soft": false
     }
 
-    OR use pricing_item_id:
-    {
-        "pricing_item_id": "uuid-here",
-        "quantity": 25
-    }
+    Ids that don't exist (or belong to another user) are returned in "missing".
     """
     try:
-        data = request.get_json()
-        service = get_service()
-
-        # Check if using pricing item
-        if 'pricing_item_id' in data:
-            item = service.add_line_item_from_pricing(
-                estimate_id=estimate_id,
-                pricing_item_id=data['pricing_item_id'],
-                quantity=data.get('quantity', 1),
-                source=data.get('source', 'manual')
-            )
-        else:
-            item = service.add_line_item(
-                estimate_id=estimate_id,
-                category=data.get('category', 'GENERAL_CONDITIONS'),
-                description=data['description'],
-                quantity=data.get('quantity', 1),
-                material_unit_cost=data.get('material_unit_cost', 0),
-                labor_hours_per_unit=data.get('labor_hours_per_unit', 0),
-                unit_type=data.get('unit_type', 'E'),
-                source=data.get('source', 'manual'),
-                ai_confidence=data.get('ai_confidence'),
-                ai_notes=data.get('ai_notes')
-            )
-
-        if not item:
-            return jsonify({'error': 'Failed to add line item'}), 400
+        data = request.get_json() or {}
+        ids = list(dict.fromkeys(data.get('ids', [])))
+        if not ids:
+            return jsonify({'error': 'ids is required'}), 400
 
-        # Get updated estimate
-        estimate = service.get_estimate(estimate_id)
-
-        return jsonify({
-            'success': True,
-            'line_item': item.to_dict(),
-            'estimate_totals': {
-                'total_material': float(estimate.total_material),
-                'total_labor_hours': float(estimate.total_labor_hours),
-                'final_bid': float(estimate.final_bid)
-            }
-        }), 201
-
-    except Exception as e:
-        logger.error(f"Error adding line item: {e}")
-        return jsonify({'error': str(e)}), 500
-
-
-@estimation_bp.route('/<estimate_id>/items/bulk', methods=['POST'])
-@jwt_required()
-def bulk_add_line_items(estimate_id):
-    """
-    Add multiple line items at once.
-
-    POST /api/estimates/{id}/items/bulk
-    {
-        "items": [
-            {"category": "INTERIOR_LIGHTING", "description": "2x4 LED Panel", "quantity": 50, "material_unit_cost": 50, "labor_hours_per_unit": 1.5},
-            {"category": "POWER_RECEPTACLES", "description": "Duplex Receptacle", "quantity": 30, "material_unit_cost": 60, "labor_hours_per_unit": 1.3}
-        ],
-        "source": "chat"
-    }
-    """
-    try:
-        data = request.get_json()
         service = get_service()
-
-        items = service.bulk_add_line_items(
-            estimate_id=estimate_id,
-            items=data.get('items', []),
-            source=data.get('source', 'manual')
-        )
-
-        estimate = service.get_estimate(estimate_id)
+        deleted = service.bulk_delete_estimates(ids, soft=bool(data.get('soft', False)))
+        deleted_set = set(deleted)
 
         return jsonify({
             'success': True,
-            'items_added': len(items),
-            'estimate': estimate.to_dict(include_line_items=True)
-        }), 201
-
-    except Exception as e:
-        logger.error(f"Error bulk adding line items: {e}")
-        return jsonify({'error': str(e)}), 500
-
-
-@estimation_bp.route('/<estimate_id>/items/<item_id>', methods=['PATCH'])
-@jwt_required()
-def update_line_item(estimate_id, item_id):
-    """
-    Update a line item.
-
-    PATCH /api/estimates/{estimate_id}/items/{item_id}
-    {
-        "quantity": 30
-    }
-    """
-    try:
-        data = request.get_json()
-        service = get_service()
-
-        item = service.update_line_item(item_id, estimate_id, **data)
-
-        if not item:
-            return jsonify({'error': 'Line item not found'}), 404
-
-        estimate = service.get_estimate(estimate_id)
-
-        return jsonify({
-            'success': True,
-            'line_item': item.to_dict(),
-            'estimate_totals': {
-                'final_bid': float(estimate.final_bid)
-            }
+            'deleted': deleted,
+            'missing': [i for i in ids if i not in deleted_set]
         })
 
     except Exception as e:
-        logger.error(f"Error updating line item: {e}")
+        logger.error(f"Error bulk deleting estimates: {e}")
         return jsonify({'error': str(e)}), 500
 
 
-@estimation_bp.route('/<estimate_id>/items/<item_id>', methods=['DELETE'])
+@estimation_bp.route('/undelete', methods=['POST'])
 @jwt_required()
-def delete_line_item(estimate_id, item_id):
-    """Delete a line item."""
-    try:
-        service = get_service()
-        success = service.delete_line_item(item_id, estimate_id)
-
-        if not success:
-            return jsonify({'error': 'Line item not found'}), 404
-
-        estimate = service.get_estimate(estimate_id)
-
-        return jsonify({
-            'success': True,
-            'estimate_totals': {
-                'final_bid': float(estimate.final_bid) if estimate else 0
-            }
-        })
-
-    except Exception as e:
-        logger.error(f"Error deleting line item: {e}")
-        return jsonify({'error': str(e)}), 500
-
-
-# =============================================================================
-# PRICING DATABASE ENDPOINTS
-# =============================================================================
-
-@estimation_bp.route('/pricing/search', methods=['GET'])
-@jwt_required()
-def search_pricing():
-    """
-    Search pricing items.
-
-    GET /api/estimates/pricing/search?q=receptacle&category=POWER_RECEPTACLES
-    """
-    try:
-        query = request.args.get('q', '')
-        category = request.args.get('category')
-        limit = request.args.get('limit', 20, type=int)
-
-        items = EstimationService.search_pricing_items(
-            query=query,
-            category=category,
-            limit=limit
-        )
-
-        return jsonify({
-            'success': True,
-            'items': [item.to_dict() for item in items],
-            'count': len(items)
-        })
-
-    except Exception as e:
-        logger.error(f"Error searching pricing: {e}")
-        return jsonify({'error': str(e)}), 500
-
-
-@estimation_bp.route('/pricing/categories', methods=['GET'])
-@jwt_required()
-def get_pricing_categories():
-    """
-    Get all pricing categories with item counts.
-
-    GET /api/estimates/pricing/categories
-    """
-    try:
-        categories = db.session.query(
-            PricingItem.category,
-            db.func.count(PricingItem.id)
-        ).filter(
-            PricingItem.is_active == True
-        ).group_by(PricingItem.category).all()
-
-        return jsonify({
-            'success': True,
-            'categories': [
-                {'name': cat, 'count': count}
-                for cat, count in categories
-            ]
-        })
-
-    except Exception as e:
-        logger.error(f"Error getting categories: {e}")
-        return jsonify({'error': str(e)}), 500
-
-
-@estimation_bp.route('/pricing/category/<category>', methods=['GET'])
-@jwt_required()
-def get_category_items(category):
-    """
-    Get all items in a category.
-
-    GET /api/estimates/pricing/category/INTERIOR_LIGHTING
-    """
-    try:
-        items = EstimationService.get_pricing_by_category(category.upper())
-
-        return jsonify({
-            'success': True,
-            'category': category.upper(),
-            'items': [item.to_dict() for item in items],
-            'count': len(items)
-        })
-
-    except Exception as e:
-        logger.error(f"Error getting category items: {e}")
-        return jsonify({'error': str(e)}), 500
-
-
-# =============================================================================
-# QUICK QUOTE ENDPOINT
-# =============================================================================
-
-@estimation_bp.route('/quick-quote', methods=['POST'])
-@jwt_required()
-def quick_quote():
+def undelete_estimates():
     """
-    Generate a quick quote without saving.
+    Restore soft-deleted estimates that have not been purged yet.
 
-    POST /api/estimates/quick-quote
-    {
-        "items": [
-            {"name": "Duplex Receptacle", "quantity": 25},
-            {"name": "2x4 LED", "quantity": 50},
-            {"name": "Single Pole Switch", "quantity": 10}
-        ],
-        "labor_rate": 118.00,
-        "overhead_profit_rate": 0.15
-    }
+    POST /api/estimates/undelete
+    {"ids": ["id1", "id2"]}
     """
     try:
-        data = request.get_json()
+        data = request.get_json() or {}
         service = get_service()
-
-        result = service.quick_quote(
-            items=data.get('items', []),
-            labor_rate=data.get('labor_rate', 118.00),
-            tax_rate=data.get('material_tax_rate', 0.1025),
-            op_rate=data.get('overhead_profit_rate', 0)
-        )
+        restored = service.undelete_estimates(data.get('ids', []))
 
         return jsonify({
             'success': True,
-            'quote': result
+            'restored': restored
         })
 
     except Exception as e:
-        logger.error(f"Error generating quick quote: {e}")
+        logger.error(f"Error restoring estimates: {e}")
         return jsonify({'error': str(e)}), 500
 
 
-# =============================================================================
-# FEEDER CALCULATOR ENDPOINT
-# =============================================================================
-
-@estimation_bp.route('/calculate-feeder', methods=['POST'])
+@estimation_bp.route('/<estimate_id>/events', methods=['GET'])
 @jwt_required()
-def calculate_feeder():
+def stream_estimate_events(estimate_id):
     """
-    Calculate feeder pricing.
-
-    POST /api/estimates/calculate-feeder
-    {
-        "wire_material": "CU",
-        "wire_size": "#500 MCM",
-        "conduit_type": "EMT_SS",
-        "conduit_size": "4",
-        "length_feet": 150,
-        "conductor_count": 4,
-        "ampacity_multiplier": 2
-    }
+    Server-sent event stream of changes to an estimate.
+
+    GET /api/estimates/{id}/events
+    Accept: text/event-stream
+
+    Events:
+        snapshot          - current totals, sent once on connect
+        line_item         - {"op": "added|updated|deleted", "item": {...}, "totals": {...}}
+        estimate_updated  - {"fields": {...}, "line_items_repriced": bool, "totals": {...}}
+        estimate_deleted  - stream ends after this event
+        estimate_restored - undeleted, or restored from the archive ({"archived": true})
+        resync            - events were dropped (client fell behind); refetch
+                            the estimate and reconnect. Stream ends after this event
     """
     try:
-        data = request.get_json()
         service = get_service()
+        estimate = service.get_estimate(estimate_id)
 
-        result = service.calculate_feeder(
-            wire_material=data['wire_material'],
-            wire_size=data['wire_size'],
-            conduit_type=data['conduit_type'],
-            conduit_size=data['conduit_size'],
-            length_feet=data['length_feet'],
-            conductor_count=data.get('conductor_count', 4),
-            ampacity_multiplier=data.get('ampacity_multiplier', 1.0)
-        )
+        if not estimate:
+            return jsonify({'error': 'Estimate not found'}), 404
 
-        return jsonify({
-            'success': True,
-            'feeder': result
-        })
+        q = event_bus.subscribe(estimate_id)
+        snapshot = {
+            'id': 0,
+            'type': 'snapshot',
+            'estimate_id': estimate_id,
+            'data': {'totals': totals_payload(estimate)}
+        }
+        # Release the DB connection; the stream can stay open for hours
+        db.session.remove()
+
+        def generate():
+            yield format_sse(snapshot)
+            yield from event_bus.stream(estimate_id, q=q)
+
+        return Response(
+            stream_with_context(generate()),
+            mimetype='text/event-stream',
+            headers={
+                'Cache-Control': 'no-cache',
+                'X-Accel-Buffering': 'no'
+            }
+        )
 
     except Exception as e:
-        logger.error(f"Error calculating feeder: {e}")
+        logger.error(f"Error opening event stream: {e}")
         return jsonify({'error': str(e)}), 500
 
 
-# =============================================================================
-# OUTCOME TRACKING
-# =============================================================================
-
-@estimation_bp.route('/<estimate_id>/outcome', methods=['POST'])
+@estimation_bp.route('/<estimate_id>/price-overrides', methods=['PATCH'])
 @jwt_required()
-def record_outcome(estimate_id):
+def set_price_overrides(estimate_id):
     """
-    Record bid outcome (won/lost).
+    Pin per-estimate prices for pricing items (the top pricing layer).
+    A null value removes the override. Applies to line items added afterwards.
 
-    POST /api/estimates/{id}/outcome
+    PATCH /api/estimates/{id}/price-overrides
     {
-        "won": true,
-        "won_amount": 125000,
-        "notes": "Beat competition by 5%"
+        "uuid-1": {"material_cost": 55.00, "labor_hours": 1.1},
+        "uuid-2": null
     }
     """
     try:
         data = request.get_json()
         service = get_service()
-
-        estimate = service.record_outcome(
-            estimate_id=estimate_id,
-            won=data.get('won', False),
-            won_amount=data.get('won_amount'),
-            notes=data.get('notes')
-        )
+        estimate = service.set_price_overrides(estimate_id, data or {})
 
         if not estimate:
             return jsonify({'error': 'Estimate not found'}), 404
 
         return jsonify({
             'success': True,
-            'estimate': estimate.to_dict()
-        })
-
-    except Exception as e:
-        logger.error(f"Error recording outcome: {e}")
-        return jsonify({'error': str(e)}), 500
-
-
-# =============================================================================
-# ADMIN: IMPORT PRICING DATABASE
-# =============================================================================
-
-@estimation_bp.route('/admin/import-pricing', methods=['POST'])
-@jwt_required()
-def import_pricing():
-    """
-    Import pricing database from JSON.
-    Admin only - run once during setup.
-
-    POST /api/estimates/admin/import-pricing
-    {
-        "json_path": "flask_integration/data/pricing_database.json"
-    }
-    """
-    try:
-        # TODO: Add admin role check
-        data = request.get_json()
-        json_path = data.get('json_path', 'flask_integration/data/pricing_database.json')
-
-        stats = import_pricing_database(json_path)
-
-        return jsonify({
-            'success': True,
-            'imported': stats
+            'price_overrides': estimate.estimate_metadata.get('price_overrides', {})
         })
 
+    except (ValueError, TypeError, KeyError) as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
-        logger.error(f"Error importing pricing: {e}")
+        logger.error(f"Error setting price overrides: {e}")
         return jsonify({'error': str(e)}), 500
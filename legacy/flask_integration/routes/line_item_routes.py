@@ -0,0 +1,211 @@
+"""
+Ohmni Estimate - Line Item API Routes
+Drop into: backend/routes/line_item_routes.py
+
+Line items of an estimate: add (single or bulk), update, delete.
+
+Mounted under estimation_bp (/api/estimates) by estimation_routes.py.
+"""
+
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required
+import logging
+
+from backend.services.estimate_events import totals_payload
+from backend.services.estimate_serializers import json_response, line_item_serializer
+from backend.routes.estimation_helpers import (
+    get_service, requested_fields, parse_as_of, requested_includes, payload_fields, estimate_payload
+)
+
+logger = logging.getLogger(__name__)
+
+line_items_bp = Blueprint('line_items', __name__)
+
+
+# =============================================================================
+# LINE ITEM ENDPOINTS
+# =============================================================================
+
+@line_items_bp.route('/<estimate_id>/items', methods=['POST'])
+@jwt_required()
+def add_line_item(estimate_id):
+    """
+    Add a line item to an estimate.
+
+    POST /api/estimates/{id}/items
+    {
+        "category": "POWER_RECEPTACLES",
+        "description": "Duplex Receptacle",
+        "quantity": 25,
+        "material_unit_cost": 60.00,
+        "labor_hours_per_unit": 1.30,
+        "unit_type": "E"
+    }
+
+    OR use pricing_item_id (optionally priced as of a past date):
+    {
+        "pricing_item_id": "uuid-here",
+        "quantity": 25,
+        "as_of": "2024-06-30"
+    }
+
+    ?fields[line_items]=id,quantity,total_cost trims the echoed line item.
+    """
+    try:
+        data = request.get_json()
+        service = get_service()
+        item_serializer = requested_fields('line_items', line_item_serializer)
+
+        # Check if using pricing item
+        if 'pricing_item_id' in data:
+            item = service.add_line_item_from_pricing(
+                estimate_id=estimate_id,
+                pricing_item_id=data['pricing_item_id'],
+                quantity=data.get('quantity', 1),
+                source=data.get('source', 'manual'),
+                as_of=parse_as_of(data.get('as_of'))
+            )
+        else:
+            item = service.add_line_item(
+                estimate_id=estimate_id,
+                category=data.get('category', 'GENERAL_CONDITIONS'),
+                description=data['description'],
+                quantity=data.get('quantity', 1),
+                material_unit_cost=data.get('material_unit_cost', 0),
+                labor_hours_per_unit=data.get('labor_hours_per_unit', 0),
+                unit_type=data.get('unit_type', 'E'),
+                source=data.get('source', 'manual'),
+                ai_confidence=data.get('ai_confidence'),
+                ai_notes=data.get('ai_notes')
+            )
+
+        if not item:
+            return jsonify({'error': 'Failed to add line item'}), 400
+
+        # Get updated estimate
+        estimate = service.get_estimate(estimate_id)
+
+        return json_response({
+            'success': True,
+            'line_item': item_serializer.dump(item),
+            'estimate_totals': totals_payload(estimate)
+        }, 201)
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error adding line item: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@line_items_bp.route('/<estimate_id>/items/bulk', methods=['POST'])
+@jwt_required()
+def bulk_add_line_items(estimate_id):
+    """
+    Add multiple line items at once.
+
+    POST /api/estimates/{id}/items/bulk
+    {
+        "items": [
+            {"category": "INTERIOR_LIGHTING", "description": "2x4 LED Panel", "quantity": 50, "material_unit_cost": 50, "labor_hours_per_unit": 1.5},
+            {"category": "POWER_RECEPTACLES", "description": "Duplex Receptacle", "quantity": 30, "material_unit_cost": 60, "labor_hours_per_unit": 1.3}
+        ],
+        "source": "chat"
+    }
+
+    Returns the new item ids and totals; add
+    ?include=estimate,line_items,category_totals for the full estimate.
+    """
+    try:
+        data = request.get_json()
+        service = get_service()
+        includes = requested_includes()
+        estimate_fields, item_fields = payload_fields()
+
+        items = service.bulk_add_line_items(
+            estimate_id=estimate_id,
+            items=data.get('items', []),
+            source=data.get('source', 'manual')
+        )
+
+        estimate = service.get_estimate(estimate_id)
+        if not estimate:
+            return jsonify({'error': 'Estimate not found'}), 404
+
+        response = {
+            'success': True,
+            'items_added': len(items),
+            'item_ids': [item.id for item in items],
+            'estimate_totals': totals_payload(estimate)
+        }
+        if includes:
+            response['estimate'] = estimate_payload(estimate_id, includes, estimate_fields, item_fields)
+
+        return json_response(response, 201)
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error bulk adding line items: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@line_items_bp.route('/<estimate_id>/items/<item_id>', methods=['PATCH'])
+@jwt_required()
+def update_line_item(estimate_id, item_id):
+    """
+    Update a line item.
+
+    PATCH /api/estimates/{estimate_id}/items/{item_id}
+    {
+        "quantity": 30
+    }
+
+    ?fields[line_items]=id,quantity,total_cost trims the echoed line item.
+    """
+    try:
+        data = request.get_json()
+        service = get_service()
+        item_serializer = requested_fields('line_items', line_item_serializer)
+
+        item = service.update_line_item(item_id, estimate_id, **data)
+
+        if not item:
+            return jsonify({'error': 'Line item not found'}), 404
+
+        estimate = service.get_estimate(estimate_id)
+
+        return json_response({
+            'success': True,
+            'line_item': item_serializer.dump(item),
+            'estimate_totals': totals_payload(estimate)
+        })
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error updating line item: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@line_items_bp.route('/<estimate_id>/items/<item_id>', methods=['DELETE'])
+@jwt_required()
+def delete_line_item(estimate_id, item_id):
+    """Delete a line item."""
+    try:
+        service = get_service()
+        success = service.delete_line_item(item_id, estimate_id)
+
+        if not success:
+            return jsonify({'error': 'Line item not found'}), 404
+
+        estimate = service.get_estimate(estimate_id)
+
+        return jsonify({
+            'success': True,
+            'estimate_totals': totals_payload(estimate) if estimate else {'final_bid': 0}
+        })
+
+    except Exception as e:
+        logger.error(f"Error deleting line item: {e}")
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,127 @@
+"""
+Ohmni Estimate - Outcome Tracking API Routes
+Drop into: backend/routes/outcome_routes.py
+
+Won/lost outcomes and the outcome statistics built from them.
+
+Mounted under estimation_bp (/api/estimates) by estimation_routes.py.
+"""
+
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+import logging
+
+from backend.services.outcome_stats import get_outcome_stats, rebuild_outcome_stats
+from backend.services.estimate_serializers import json_response, estimate_serializer
+from backend.routes.estimation_helpers import get_service, requested_fields
+
+logger = logging.getLogger(__name__)
+
+outcomes_bp = Blueprint('outcomes', __name__)
+
+
+# =============================================================================
+# OUTCOME TRACKING
+# =============================================================================
+
+@outcomes_bp.route('/<estimate_id>/outcome', methods=['POST'])
+@jwt_required()
+def record_outcome(estimate_id):
+    """
+    Record bid outcome (won/lost).
+
+    POST /api/estimates/{id}/outcome
+    {
+        "won": true,
+        "won_amount": 125000,
+        "notes": "Beat competition by 5%"
+    }
+    """
+    try:
+        data = request.get_json()
+        service = get_service()
+        serializer = requested_fields('estimate', estimate_serializer, primary=True)
+
+        estimate = service.record_outcome(
+            estimate_id=estimate_id,
+            won=data.get('won', False),
+            won_amount=data.get('won_amount'),
+            notes=data.get('notes')
+        )
+
+        if not estimate:
+            return jsonify({'error': 'Estimate not found'}), 404
+
+        return json_response({
+            'success': True,
+            'estimate': serializer.dump(estimate)
+        })
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error recording outcome: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@outcomes_bp.route('/stats/outcomes', methods=['GET'])
+@jwt_required()
+def get_outcome_statistics():
+    """
+    Win rate and $/sqft statistics, maintained as outcomes are recorded.
+
+    GET /api/estimates/stats/outcomes                                  (overall)
+    GET /api/estimates/stats/outcomes?dimension=project_type           (every project type)
+    GET /api/estimates/stats/outcomes?dimension=project_type&key=warehouse&max_price_per_sqft=18
+
+    dimension: all, project_type, gc_name, month (key 'YYYY-MM').
+    max_price_per_sqft adds the win rate among bids at or under that price
+    (approximate, from the quantile sketches).
+    """
+    try:
+        dimension = request.args.get('dimension', 'all')
+        key = request.args.get('key')
+        if dimension == 'all':
+            key = 'all'
+
+        buckets = get_outcome_stats(
+            get_jwt_identity(),
+            dimension=dimension,
+            key=key,
+            max_price_per_sqft=request.args.get('max_price_per_sqft', type=float)
+        )
+
+        return jsonify({
+            'success': True,
+            'dimension': dimension,
+            'buckets': buckets,
+            'count': len(buckets)
+        })
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error reading outcome stats: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@outcomes_bp.route('/stats/outcomes/rebuild', methods=['POST'])
+@jwt_required()
+def rebuild_outcome_statistics():
+    """
+    Recompute the current user's outcome statistics from their won/lost
+    estimates (one-time backfill for outcomes recorded before stats existed).
+
+    POST /api/estimates/stats/outcomes/rebuild
+    """
+    try:
+        count = rebuild_outcome_stats(get_jwt_identity())
+
+        return jsonify({
+            'success': True,
+            'outcomes': count
+        })
+
+    except Exception as e:
+        logger.error(f"Error rebuilding outcome stats: {e}")
+        return jsonify({'error': str(e)}), 500
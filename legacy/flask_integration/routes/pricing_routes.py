@@ -0,0 +1,396 @@
+"""
+Ohmni Estimate - Pricing API Routes
+Drop into: backend/routes/pricing_routes.py
+
+Pricing catalog search, autocomplete and matching, point-in-time prices,
+repricing, quick quotes and the feeder calculator.
+
+Mounted under estimation_bp (/api/estimates) by estimation_routes.py.
+"""
+
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required
+import logging
+import time
+
+from backend.services.estimation_service import EstimationService
+from backend.services.pricing_index import pricing_index
+from backend.services.quote_cache import quick_quote_cache
+from backend.services.price_history import get_prices_as_of
+from backend.services.estimate_serializers import json_response, pricing_item_serializer
+from backend.models.estimate_models import PricingItem
+from backend.extensions import db
+from backend.routes.estimation_helpers import get_service, requested_fields, parse_as_of
+
+logger = logging.getLogger(__name__)
+
+pricing_bp = Blueprint('pricing', __name__)
+
+
+# =============================================================================
+# PRICING DATABASE ENDPOINTS
+# =============================================================================
+
+@pricing_bp.route('/pricing/search', methods=['GET'])
+@jwt_required()
+def search_pricing():
+    """
+    Search pricing items.
+
+    GET /api/estimates/pricing/search?q=receptacle&category=POWER_RECEPTACLES
+    GET /api/estimates/pricing/search?q=receptacle&fields=id,name,material_cost
+    """
+    try:
+        query = request.args.get('q', '')
+        category = request.args.get('category')
+        limit = request.args.get('limit', 20, type=int)
+        serializer = requested_fields('items', pricing_item_serializer, primary=True)
+
+        rows = EstimationService.search_pricing_items(
+            query=query,
+            category=category,
+            limit=limit,
+            columns=serializer.columns
+        )
+
+        return json_response({
+            'success': True,
+            'items': serializer.dump_rows(rows),
+            'count': len(rows)
+        })
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error searching pricing: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@pricing_bp.route('/pricing/autocomplete', methods=['GET'])
+@jwt_required()
+def autocomplete_pricing():
+    """
+    Search-as-you-type suggestions from the in-memory pricing index.
+    Every query term matches as a token prefix; no database access.
+
+    GET /api/estimates/pricing/autocomplete?q=3/4 em&category=CONDUIT&limit=10
+    """
+    try:
+        query = request.args.get('q', '')
+        category = request.args.get('category')
+        limit = min(request.args.get('limit', 10, type=int), 50)
+
+        start = time.perf_counter()
+        index = pricing_index.current
+        matches = index.search(query, category=category, limit=limit)
+        took_ms = (time.perf_counter() - start) * 1000
+
+        return json_response({
+            'success': True,
+            'suggestions': [dict(entry.to_dict(), score=score) for entry, score in matches],
+            'count': len(matches),
+            'catalog_version': index.version,
+            'took_ms': round(took_ms, 3)
+        })
+
+    except Exception as e:
+        logger.error(f"Error in pricing autocomplete: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@pricing_bp.route('/pricing/match', methods=['POST'])
+@jwt_required()
+def match_pricing():
+    """
+    Resolve free-text takeoff names to ranked catalog candidates.
+
+    POST /api/estimates/pricing/match
+    {
+        "names": ["dup recpt", "2x4 troffer", "quad outlet"],
+        "limit": 3,
+        "category": "POWER_RECEPTACLES"
+    }
+    """
+    try:
+        data = request.get_json()
+        names = data.get('names', [])
+        limit = min(int(data.get('limit', 3)), 20)
+
+        results = EstimationService.match_pricing_items(
+            names, limit=limit, category=data.get('category')
+        )
+
+        return json_response({
+            'success': True,
+            'matches': [
+                {
+                    'name': name,
+                    'candidates': [
+                        dict(entry.to_dict(), score=score) for entry, score in candidates
+                    ]
+                }
+                for name, candidates in zip(names, results)
+            ],
+            'count': len(names)
+        })
+
+    except Exception as e:
+        logger.error(f"Error matching pricing items: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@pricing_bp.route('/pricing/prices-as-of', methods=['POST'])
+@jwt_required()
+def prices_as_of():
+    """
+    Batch point-in-time price lookup.
+
+    POST /api/estimates/pricing/prices-as-of
+    {
+        "pricing_item_ids": ["uuid-1", "uuid-2"],
+        "as_of": "2024-06-30"
+    }
+
+    Items with no price book entry on or before as_of return their current
+    catalog price with effective_from null.
+    """
+    try:
+        data = request.get_json()
+        as_of = parse_as_of(data.get('as_of'))
+        prices = get_prices_as_of(data.get('pricing_item_ids', []), as_of)
+
+        return jsonify({
+            'success': True,
+            'as_of': as_of.isoformat() if as_of else None,
+            'prices': {item_id: point.to_dict() for item_id, point in prices.items()},
+            'count': len(prices)
+        })
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error looking up prices: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@pricing_bp.route('/pricing/impact', methods=['POST'])
+@jwt_required()
+def pricing_impact():
+    """
+    Which open (draft/submitted) estimates use these pricing items, and by how much
+    would they move at current catalog prices. Read-only.
+
+    POST /api/estimates/pricing/impact
+    {
+        "pricing_item_ids": ["uuid-1", "uuid-2"],
+        "prices": {"uuid-1": {"material_cost": 1450.00}}  // optional what-if
+    }
+    """
+    try:
+        data = request.get_json()
+        pricing_item_ids = data.get('pricing_item_ids', [])
+        if not pricing_item_ids:
+            return jsonify({'error': 'pricing_item_ids is required'}), 400
+
+        service = get_service()
+        report = service.pricing_impact(pricing_item_ids, prices=data.get('prices'))
+
+        return jsonify({'success': True, **report})
+
+    except Exception as e:
+        logger.error(f"Error building pricing impact: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@pricing_bp.route('/pricing/reprice', methods=['POST'])
+@jwt_required()
+def reprice_open_estimates():
+    """
+    Apply current catalog prices (or "prices" overrides) to the affected line
+    items of open estimates and recalculate their totals. Same body as /pricing/impact.
+
+    POST /api/estimates/pricing/reprice
+    """
+    try:
+        data = request.get_json()
+        pricing_item_ids = data.get('pricing_item_ids', [])
+        if not pricing_item_ids:
+            return jsonify({'error': 'pricing_item_ids is required'}), 400
+
+        service = get_service()
+        report = service.reprice_open_estimates(pricing_item_ids, prices=data.get('prices'))
+
+        return jsonify({'success': True, **report})
+
+    except Exception as e:
+        logger.error(f"Error repricing estimates: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@pricing_bp.route('/pricing/categories', methods=['GET'])
+@jwt_required()
+def get_pricing_categories():
+    """
+    Get all pricing categories with item counts.
+
+    GET /api/estimates/pricing/categories
+    """
+    try:
+        categories = db.session.query(
+            PricingItem.category,
+            db.func.count(PricingItem.id)
+        ).filter(
+            PricingItem.is_active == True
+        ).group_by(PricingItem.category).all()
+
+        return jsonify({
+            'success': True,
+            'categories': [
+                {'name': cat, 'count': count}
+                for cat, count in categories
+            ]
+        })
+
+    except Exception as e:
+        logger.error(f"Error getting categories: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@pricing_bp.route('/pricing/category/<category>', methods=['GET'])
+@jwt_required()
+def get_category_items(category):
+    """
+    Get all items in a category.
+
+    GET /api/estimates/pricing/category/INTERIOR_LIGHTING
+    GET /api/estimates/pricing/category/INTERIOR_LIGHTING?fields=id,name,size
+    """
+    try:
+        serializer = requested_fields('items', pricing_item_serializer, primary=True)
+        rows = EstimationService.get_pricing_by_category(
+            category.upper(), columns=serializer.columns
+        )
+
+        return json_response({
+            'success': True,
+            'category': category.upper(),
+            'items': serializer.dump_rows(rows),
+            'count': len(rows)
+        })
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error getting category items: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+# =============================================================================
+# QUICK QUOTE ENDPOINT
+# =============================================================================
+
+@pricing_bp.route('/quick-quote', methods=['POST'])
+@jwt_required()
+def quick_quote():
+    """
+    Generate a quick quote without saving.
+
+    POST /api/estimates/quick-quote
+    {
+        "items": [
+            {"name": "Duplex Receptacle", "quantity": 25},
+            {"name": "2x4 LED", "quantity": 50},
+            {"name": "Single Pole Switch", "quantity": 10}
+        ],
+        "labor_rate": 118.00,
+        "overhead_profit_rate": 0.15,
+        "as_of": "2024-06-30"
+    }
+    """
+    try:
+        data = request.get_json()
+        service = get_service()
+
+        result = service.quick_quote(
+            items=data.get('items', []),
+            labor_rate=data.get('labor_rate', 118.00),
+            tax_rate=data.get('material_tax_rate', 0.1025),
+            op_rate=data.get('overhead_profit_rate', 0),
+            as_of=parse_as_of(data.get('as_of'))
+        )
+
+        return jsonify({
+            'success': True,
+            'quote': result
+        })
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error generating quick quote: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@pricing_bp.route('/quick-quote/cache-stats', methods=['GET'])
+@jwt_required()
+def quick_quote_cache_stats():
+    """
+    Hit/miss counters for the quick quote caches.
+
+    GET /api/estimates/quick-quote/cache-stats
+    """
+    return jsonify({
+        'success': True,
+        'cache': quick_quote_cache.stats()
+    })
+
+
+# =============================================================================
+# FEEDER CALCULATOR ENDPOINT
+# =============================================================================
+
+@pricing_bp.route('/calculate-feeder', methods=['POST'])
+@jwt_required()
+def calculate_feeder():
+    """
+    Calculate feeder pricing.
+
+    POST /api/estimates/calculate-feeder
+    {
+        "wire_material": "CU",
+        "wire_size": "#500 MCM",
+        "conduit_type": "EMT_SS",
+        "conduit_size": "4",
+        "length_feet": 150,
+        "conductor_count": 4,
+        "ampacity_multiplier": 2,
+        "region": "CHI",            // optional pricing overlays
+        "project_type": "hospital",
+        "estimate_id": "uuid-here"  // or take them (and overrides) from an estimate
+    }
+    """
+    try:
+        data = request.get_json()
+        service = get_service()
+
+        result = service.calculate_feeder(
+            wire_material=data['wire_material'],
+            wire_size=data['wire_size'],
+            conduit_type=data['conduit_type'],
+            conduit_size=data['conduit_size'],
+            length_feet=data['length_feet'],
+            conductor_count=data.get('conductor_count', 4),
+            ampacity_multiplier=data.get('ampacity_multiplier', 1.0),
+            region=data.get('region'),
+            project_type=data.get('project_type'),
+            estimate_id=data.get('estimate_id')
+        )
+
+        return jsonify({
+            'success': True,
+            'feeder': result
+        })
+
+    except Exception as e:
+        logger.error(f"Error calculating feeder: {e}")
+        return jsonify({'error': str(e)}), 500
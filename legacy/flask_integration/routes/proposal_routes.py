@@ -0,0 +1,157 @@
+"""
+Ohmni Estimate - Proposal API Routes
+Drop into: backend/routes/proposal_routes.py
+
+Background proposal generation, polling and download.
+
+Mounted under estimation_bp (/api/estimates) by estimation_routes.py.
+"""
+
+from flask import Blueprint, current_app, request, jsonify, send_file
+from flask_jwt_extended import jwt_required
+import logging
+import os
+
+from backend.services.proposal_rendering import get_storage
+from backend.services.estimate_serializers import json_response, proposal_serializer
+from backend.routes.estimation_helpers import get_service, requested_fields
+
+logger = logging.getLogger(__name__)
+
+proposals_bp = Blueprint('proposals', __name__)
+
+
+# =============================================================================
+# PROPOSALS
+# =============================================================================
+
+@proposals_bp.route('/<estimate_id>/proposals', methods=['POST'])
+@jwt_required()
+def generate_proposal(estimate_id):
+    """
+    Render a proposal in the background. Returns 202 while a new render is
+    queued, or 200 with the latest proposal if the estimate hasn't changed.
+
+    POST /api/estimates/{id}/proposals
+    {
+        "title": "Electrical Proposal - Warehouse",
+        "scope_of_work": "...",
+        "exclusions": ["Permit or bond fees", ...],
+        "valid_days": 30,
+        "force": false
+    }
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        service = get_service()
+        serializer = requested_fields('proposal', proposal_serializer, primary=True)
+
+        proposal, queued = service.generate_proposal(
+            current_app._get_current_object(),
+            estimate_id,
+            title=data.get('title'),
+            scope_of_work=data.get('scope_of_work'),
+            exclusions=data.get('exclusions'),
+            valid_days=data.get('valid_days'),
+            force=data.get('force', False)
+        )
+
+        if not proposal:
+            return jsonify({'error': 'Estimate not found'}), 404
+
+        return json_response({
+            'success': True,
+            'queued': queued,
+            'proposal': serializer.dump(proposal),
+            'status_url': f"{request.script_root}{request.path}/{proposal.id}"
+        }, 202 if queued else 200)
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error generating proposal: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@proposals_bp.route('/<estimate_id>/proposals', methods=['GET'])
+@jwt_required()
+def list_proposals(estimate_id):
+    """
+    Proposals for an estimate, newest version first.
+
+    GET /api/estimates/{id}/proposals?fields[proposals]=id,version,render_status,pdf_url
+    """
+    try:
+        service = get_service()
+        serializer = requested_fields('proposals', proposal_serializer)
+
+        proposals = service.get_proposals(estimate_id)
+        if proposals is None:
+            return jsonify({'error': 'Estimate not found'}), 404
+
+        return json_response({
+            'success': True,
+            'proposals': [serializer.dump(p) for p in proposals]
+        })
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error listing proposals: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@proposals_bp.route('/<estimate_id>/proposals/<proposal_id>', methods=['GET'])
+@jwt_required()
+def get_proposal(estimate_id, proposal_id):
+    """
+    Proposal with its render status (poll until render_status is ready/failed).
+
+    GET /api/estimates/{id}/proposals/{proposal_id}
+    """
+    try:
+        serializer = requested_fields('proposal', proposal_serializer, primary=True)
+        proposal = get_service().get_proposal(estimate_id, proposal_id)
+        if not proposal:
+            return jsonify({'error': 'Proposal not found'}), 404
+
+        return json_response({
+            'success': True,
+            'proposal': serializer.dump(proposal)
+        })
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error getting proposal: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
+@proposals_bp.route('/<estimate_id>/proposals/<proposal_id>/file', methods=['GET'])
+@jwt_required()
+def download_proposal(estimate_id, proposal_id):
+    """
+    Rendered document behind pdf_url (PDF, or HTML when PDF rendering is unavailable).
+
+    GET /api/estimates/{id}/proposals/{proposal_id}/file
+    """
+    try:
+        proposal = get_service().get_proposal(estimate_id, proposal_id)
+        if not proposal:
+            return jsonify({'error': 'Proposal not found'}), 404
+        if proposal.render_status != 'ready':
+            return jsonify({'error': f"Proposal is {proposal.render_status}"}), 409
+
+        path = get_storage(current_app._get_current_object()).path(proposal.pdf_url)
+        if not path:
+            return jsonify({'error': 'Proposal file not found'}), 404
+
+        return send_file(
+            path,
+            as_attachment=True,
+            download_name=f"proposal-v{proposal.version}{os.path.splitext(path)[1]}"
+        )
+
+    except Exception as e:
+        logger.error(f"Error downloading proposal: {e}")
+        return jsonify({'error': str(e)}), 500
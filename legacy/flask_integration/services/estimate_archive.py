@@ -0,0 +1,187 @@
+"""
+Ohmni Estimate - Hot/Cold Estimate Archive
+Drop into: backend/services/estimate_archive.py
+
+Closed bids (won/lost) are rarely touched after the outcome is recorded, but
+they keep growing the `estimates` and `estimate_line_items` indexes every hot
+query walks. This module moves them, with their line items and proposals, into
+column-identical archive tables (see estimates_archive and friends in
+estimate_models.py) using set-based INSERT ... SELECT + DELETE, one batch per
+transaction.
+
+Reads are transparent: EstimationService.get_estimate (and the GET routes)
+call restore_estimate() on a hot miss, which moves an archived estimate back
+before it is used. The next sweep archives it again once it is old enough.
+
+Run the sweep nightly, e.g. from cron via the admin route or:
+    with app.app_context():
+        archive_closed_estimates(older_than_days=180)
+"""
+
+from typing import Dict, List, Optional, Sequence
+from datetime import datetime, timedelta
+import logging
+
+from sqlalchemy import DateTime, literal, select
+
+from backend.extensions import db
+from backend.models.estimate_models import (
+    Estimate, EstimateLineItem, Proposal,
+    estimates_archive, estimate_line_items_archive, proposals_archive
+)
+from backend.services.estimate_events import event_bus
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_AFTER_DAYS = 180
+ARCHIVE_BATCH_SIZE = 200
+CLOSED_STATUSES = ('won', 'lost')
+
+# (hot table, archive table, column holding the estimate id), parent first
+_TABLES = (
+    (Estimate.__table__, estimates_archive, 'id'),
+    (EstimateLineItem.__table__, estimate_line_items_archive, 'estimate_id'),
+    (Proposal.__table__, proposals_archive, 'estimate_id'),
+)
+
+
+def _move(source, target, key: str, estimate_ids: Sequence[str], archived_at: Optional[datetime]) -> int:
+    """INSERT INTO target SELECT ... FROM source WHERE key IN ids. Returns rows copied."""
+    names = [c.name for c in source.columns if c.name != 'archived_at']
+    columns = [source.c[name] for name in names]
+    if archived_at is not None:
+        names.append('archived_at')
+        columns.append(literal(archived_at, DateTime).label('archived_at'))
+
+    result = db.session.execute(
+        target.insert().from_select(
+            names, select(*columns).where(source.c[key].in_(estimate_ids))
+        )
+    )
+    return result.rowcount or 0
+
+
+def _delete(table, key: str, estimate_ids: Sequence[str]):
+    db.session.execute(table.delete().where(table.c[key].in_(estimate_ids)))
+
+
+def _archive_batch(estimate_ids: List[str]) -> Dict[str, int]:
+    now = datetime.utcnow()
+    counts = {}
+    for hot, cold, key in _TABLES:
+        counts[hot.name] = _move(hot, cold, key, estimate_ids, now)
+    # Children before parent (foreign keys)
+    for hot, _, key in reversed(_TABLES):
+        _delete(hot, key, estimate_ids)
+    db.session.commit()
+    return counts
+
+
+def archive_closed_estimates(
+    older_than_days: int = ARCHIVE_AFTER_DAYS,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+    user_id: Optional[str] = None
+) -> Dict[str, int]:
+    """
+    Move won/lost estimates whose outcome (or last update) is older than the
+    cutoff into the archive tables. Returns rows moved per hot table.
+    """
+    if older_than_days < 1:
+        raise ValueError("older_than_days must be at least 1")
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    closed_at = db.func.coalesce(Estimate.outcome_at, Estimate.updated_at)
+    totals = {hot.name: 0 for hot, _, _ in _TABLES}
+
+    while True:
+        query = db.session.query(Estimate.id).filter(
+            Estimate.status.in_(CLOSED_STATUSES),
+            Estimate.deleted_at.is_(None),
+            closed_at < cutoff
+        )
+        if user_id:
+            query = query.filter(Estimate.user_id == user_id)
+        ids = [row[0] for row in query.limit(batch_size).all()]
+        if not ids:
+            break
+
+        try:
+            counts = _archive_batch(ids)
+        except Exception:
+            db.session.rollback()
+            raise
+        for table, count in counts.items():
+            totals[table] += count
+        if len(ids) < batch_size:
+            break
+
+    logger.info(f"Archived closed estimates older than {older_than_days} days: {totals}")
+    return totals
+
+
+def restore_estimate(estimate_id: str, user_id: Optional[str] = None) -> bool:
+    """
+    Read-through: move an archived estimate (and its items and proposals) back
+    into the hot tables. Returns False if it isn't archived (for this user).
+    """
+    query = db.session.query(estimates_archive.c.id).filter(estimates_archive.c.id == estimate_id)
+    if user_id:
+        query = query.filter(estimates_archive.c.user_id == user_id)
+    if query.first() is None:
+        return False
+
+    try:
+        for hot, cold, key in _TABLES:
+            _move(cold, hot, key, [estimate_id], None)
+        for _, cold, key in reversed(_TABLES):
+            _delete(cold, key, [estimate_id])
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    event_bus.publish(estimate_id, 'estimate_restored', {'archived': True})
+    logger.info(f"Restored archived estimate {estimate_id}")
+    return True
+
+
+def delete_archived_estimates(estimate_ids: Sequence[str], user_id: Optional[str] = None) -> List[str]:
+    """Set-based delete of archived estimates and their archived children. Caller commits."""
+    if not estimate_ids:
+        return []
+    query = db.session.query(estimates_archive.c.id).filter(estimates_archive.c.id.in_(list(estimate_ids)))
+    if user_id:
+        query = query.filter(estimates_archive.c.user_id == user_id)
+    ids = [row[0] for row in query.all()]
+    if ids:
+        for _, cold, key in reversed(_TABLES):
+            _delete(cold, key, ids)
+    return ids
+
+
+def project_archived_estimates(
+    user_id: str,
+    serializer,
+    status: Optional[str] = None,
+    limit: int = 50
+) -> List[Dict]:
+    """Archive-table equivalent of estimate_serializers.project_estimates (no restore)."""
+    columns = [estimates_archive.c[attr] for attr in serializer.attrs]
+    query = db.session.query(*columns).filter(estimates_archive.c.user_id == user_id)
+    if status:
+        query = query.filter(estimates_archive.c.status == status)
+    rows = query.order_by(estimates_archive.c.updated_at.desc()).limit(limit).all()
+    return serializer.dump_rows(rows)
+
+
+def archive_stats() -> Dict[str, Dict[str, int]]:
+    """Row counts per hot and archive table."""
+    return {
+        hot.name: {
+            'hot': db.session.query(db.func.count()).select_from(hot).scalar(),
+            'archived': db.session.query(db.func.count()).select_from(cold).scalar(),
+        }
+        for hot, cold, _ in _TABLES
+    }
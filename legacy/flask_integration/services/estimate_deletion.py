@@ -0,0 +1,251 @@
+"""
+Ohmni Estimate - Set-Based Estimate Deletion
+Drop into: backend/services/estimate_deletion.py
+
+`db.session.delete(estimate)` with cascade='all, delete-orphan' on the dynamic
+relationships loads every line item and proposal and deletes them one row at a
+time. Here deletes are plain DELETE ... WHERE estimate_id IN (...) statements
+issued children first (line items, proposals, then estimates), so a 10k-line
+estimate is three statements and nothing is loaded into memory.
+
+Soft delete only stamps estimates.deleted_at; the hot queries skip those rows
+and a background purger removes them (set-based, in batches) after a grace
+period. Deleting (hard, or soft until undeleted) backs an estimate's recorded
+outcome out of the outcome stats buckets. Start it from the app factory:
+    init_estimate_purger(app)
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from datetime import datetime, timedelta
+import logging
+import threading
+
+from backend.extensions import db
+from backend.models.estimate_models import Estimate, EstimateLineItem, Proposal, estimates_archive
+from backend.services.estimate_archive import delete_archived_estimates, restore_estimate
+from backend.services.estimate_events import event_bus
+from backend.services.outcome_stats import restore_outcome_stats, retract_outcome_stats
+
+logger = logging.getLogger(__name__)
+
+DELETE_CHUNK_SIZE = 500          # estimate ids per DELETE statement
+PURGE_GRACE_SECONDS = 24 * 3600  # soft-deleted estimates can be restored until then
+PURGE_INTERVAL_SECONDS = 600
+
+# Tables holding rows per estimate, children first
+_CHILDREN = (
+    (EstimateLineItem.__table__, 'estimate_id'),
+    (Proposal.__table__, 'estimate_id'),
+)
+
+
+def _chunks(ids: Sequence[str], size: int = DELETE_CHUNK_SIZE) -> Iterable[List[str]]:
+    for i in range(0, len(ids), size):
+        yield list(ids[i:i + size])
+
+
+def _owned_ids(estimate_ids: Iterable[str], user_id: Optional[str], include_deleted: bool) -> List[str]:
+    ids = list(dict.fromkeys(estimate_ids))
+    if not ids:
+        return []
+    owned = []
+    for chunk in _chunks(ids):
+        query = db.session.query(Estimate.id).filter(Estimate.id.in_(chunk))
+        if user_id:
+            query = query.filter(Estimate.user_id == user_id)
+        if not include_deleted:
+            query = query.filter(Estimate.deleted_at.is_(None))
+        owned.extend(row[0] for row in query.all())
+    return owned
+
+
+def _outcome_rows(table, ids: Sequence[str], user_id: Optional[str] = None) -> List[Tuple[str, Optional[Dict]]]:
+    """(user_id, estimate_metadata) of rows not soft-deleted, whose outcome stats still count."""
+    rows = []
+    for chunk in _chunks(ids):
+        query = db.session.query(table.c.user_id, table.c.estimate_metadata).filter(
+            table.c.id.in_(chunk),
+            table.c.deleted_at.is_(None)
+        )
+        if user_id:
+            query = query.filter(table.c.user_id == user_id)
+        rows.extend(query.all())
+    return rows
+
+
+def _hard_delete(ids: Sequence[str]):
+    """DELETE children then estimates for the given ids. Caller commits."""
+    estimates = Estimate.__table__
+    for chunk in _chunks(ids):
+        for table, key in _CHILDREN:
+            db.session.execute(table.delete().where(table.c[key].in_(chunk)))
+        db.session.execute(estimates.delete().where(estimates.c.id.in_(chunk)))
+
+
+def delete_estimates(estimate_ids: Iterable[str], user_id: Optional[str] = None) -> List[str]:
+    """
+    Hard-delete estimates (scoped to user_id when given) with their line items
+    and proposals in one transaction, including archived ones. Returns the ids
+    that were deleted.
+    """
+    requested = list(dict.fromkeys(estimate_ids))
+    ids = _owned_ids(requested, user_id, include_deleted=True)
+    hot = set(ids)
+    remaining = [i for i in requested if i not in hot]
+    try:
+        retract_outcome_stats(_outcome_rows(Estimate.__table__, ids))
+        retract_outcome_stats(_outcome_rows(estimates_archive, remaining, user_id))
+        _hard_delete(ids)
+        ids += delete_archived_estimates(remaining, user_id=user_id)
+        if not ids:
+            return []
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    for estimate_id in ids:
+        event_bus.publish(estimate_id, 'estimate_deleted', {})
+    logger.info(f"Deleted {len(ids)} estimates")
+    return ids
+
+
+def soft_delete_estimates(estimate_ids: Iterable[str], user_id: Optional[str] = None) -> List[str]:
+    """
+    Mark estimates deleted; rows are removed later by purge_deleted_estimates().
+    Archived estimates are restored first so they can be undeleted like any other.
+    """
+    requested = list(dict.fromkeys(estimate_ids))
+    ids = _owned_ids(requested, user_id, include_deleted=False)
+    hot = set(ids)
+    ids += [i for i in requested if i not in hot and restore_estimate(i, user_id)]
+    if not ids:
+        return []
+    now = datetime.utcnow()
+    try:
+        retract_outcome_stats(_outcome_rows(Estimate.__table__, ids))
+        for chunk in _chunks(ids):
+            Estimate.query.filter(Estimate.id.in_(chunk)).update(
+                {'deleted_at': now, 'updated_at': now}, synchronize_session=False
+            )
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    for estimate_id in ids:
+        event_bus.publish(estimate_id, 'estimate_deleted', {'soft': True})
+    logger.info(f"Soft-deleted {len(ids)} estimates")
+    return ids
+
+
+def undelete_estimates(estimate_ids: Iterable[str], user_id: Optional[str] = None) -> List[str]:
+    """
+    Clear deleted_at for soft-deleted estimates that have not been purged yet,
+    re-adding their outcome stats.
+    """
+    ids = list(dict.fromkeys(estimate_ids))
+    restored = []
+    for chunk in _chunks(ids):
+        query = db.session.query(Estimate.id).filter(
+            Estimate.id.in_(chunk),
+            Estimate.deleted_at.isnot(None)
+        )
+        if user_id:
+            query = query.filter(Estimate.user_id == user_id)
+        found = [row[0] for row in query.all()]
+        if found:
+            restore_outcome_stats(
+                db.session.query(Estimate.user_id, Estimate.estimate_metadata).filter(Estimate.id.in_(found)).all()
+            )
+            Estimate.query.filter(Estimate.id.in_(found)).update(
+                {'deleted_at': None}, synchronize_session=False
+            )
+            restored.extend(found)
+    db.session.commit()
+
+    for estimate_id in restored:
+        event_bus.publish(estimate_id, 'estimate_restored', {})
+    return restored
+
+
+def purge_deleted_estimates(
+    grace_seconds: float = PURGE_GRACE_SECONDS,
+    batch_size: int = DELETE_CHUNK_SIZE
+) -> int:
+    """Hard-delete estimates soft-deleted more than grace_seconds ago. Returns count."""
+    cutoff = datetime.utcnow() - timedelta(seconds=grace_seconds)
+    purged = 0
+    while True:
+        ids = [
+            row[0] for row in db.session.query(Estimate.id).filter(
+                Estimate.deleted_at.isnot(None),
+                Estimate.deleted_at < cutoff
+            ).limit(batch_size).all()
+        ]
+        if not ids:
+            break
+        try:
+            _hard_delete(ids)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        purged += len(ids)
+        if len(ids) < batch_size:
+            break
+
+    if purged:
+        logger.info(f"Purged {purged} soft-deleted estimates")
+    return purged
+
+
+# =============================================================================
+# BACKGROUND PURGER
+# =============================================================================
+
+class EstimatePurger:
+    """Daemon thread that runs purge_deleted_estimates() every interval."""
+
+    def __init__(self, interval_seconds: float = PURGE_INTERVAL_SECONDS,
+                 grace_seconds: float = PURGE_GRACE_SECONDS):
+        self.interval_seconds = interval_seconds
+        self.grace_seconds = grace_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, app):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(app,), name='estimate-purger', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self, app):
+        while not self._stop.wait(self.interval_seconds):
+            with app.app_context():
+                try:
+                    purge_deleted_estimates(self.grace_seconds)
+                except Exception as e:
+                    logger.error(f"Estimate purge failed: {e}")
+                finally:
+                    db.session.remove()
+
+
+estimate_purger = EstimatePurger()
+
+
+def init_estimate_purger(app):
+    """
+    Start the background purger. Call from the app factory:
+        init_estimate_purger(app)
+    ESTIMATE_PURGE_INTERVAL / ESTIMATE_PURGE_GRACE (seconds) override the defaults.
+    """
+    estimate_purger.interval_seconds = app.config.get('ESTIMATE_PURGE_INTERVAL', PURGE_INTERVAL_SECONDS)
+    estimate_purger.grace_seconds = app.config.get('ESTIMATE_PURGE_GRACE', PURGE_GRACE_SECONDS)
+    estimate_purger.start(app)
@@ -0,0 +1,168 @@
+"""
+Ohmni Estimate - Estimate Event Bus
+Drop into: backend/services/estimate_events.py
+
+In-process pub/sub for live estimate collaboration. The estimation service
+publishes compact events (line item patches, new totals) after each committed
+mutation and the SSE route streams them to every client watching the estimate.
+
+Single-node only: subscribers live in this process's memory.
+"""
+
+from typing import Dict, Iterator, Optional, Set
+from datetime import datetime
+import itertools
+import json
+import logging
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+SUBSCRIBER_QUEUE_SIZE = 256
+HEARTBEAT_SECONDS = 15
+
+TOTALS_FIELDS = (
+    'total_material', 'total_material_with_tax', 'total_labor_hours',
+    'total_labor_cost', 'subtotal', 'overhead_profit', 'final_bid',
+    'price_per_sqft'
+)
+
+
+# =============================================================================
+# EVENT BUS
+# =============================================================================
+
+class SubscriberQueue(queue.Queue):
+    """Bounded event queue; `resync` is set when the bus drops it for falling behind."""
+
+    def __init__(self, maxsize: int):
+        super().__init__(maxsize)
+        self.resync = False
+
+
+class EstimateEventBus:
+    """
+    Fan-out of estimate events to per-subscriber queues.
+
+    Each subscriber gets a bounded queue. A subscriber that stops draining
+    (dead browser tab) is dropped instead of blocking publishers; its stream
+    then sends a `resync` event and ends, so a slow but live client knows to
+    refetch the estimate and reconnect.
+    """
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Set[queue.Queue]] = {}
+        self._seq = itertools.count(1)
+
+    def subscribe(self, estimate_id: str) -> SubscriberQueue:
+        """Register a new subscriber queue for an estimate."""
+        q = SubscriberQueue(self.queue_size)
+        with self._lock:
+            self._subscribers.setdefault(estimate_id, set()).add(q)
+        return q
+
+    def unsubscribe(self, estimate_id: str, q: queue.Queue):
+        """Remove a subscriber queue."""
+        with self._lock:
+            subs = self._subscribers.get(estimate_id)
+            if not subs:
+                return
+            subs.discard(q)
+            if not subs:
+                del self._subscribers[estimate_id]
+
+    def subscriber_count(self, estimate_id: str) -> int:
+        with self._lock:
+            return len(self._subscribers.get(estimate_id, ()))
+
+    def publish(self, estimate_id: str, event_type: str, data: Dict):
+        """Publish an event to every subscriber of an estimate."""
+        with self._lock:
+            subs = list(self._subscribers.get(estimate_id, ()))
+        if not subs:
+            return
+
+        event = {
+            'id': next(self._seq),
+            'type': event_type,
+            'estimate_id': estimate_id,
+            'data': data,
+            'ts': datetime.utcnow().isoformat(),
+        }
+
+        for q in subs:
+            try:
+                q.put_nowait(event)
+            except queue.Full:
+                logger.warning(f"Dropping slow subscriber on estimate {estimate_id}")
+                q.resync = True
+                self.unsubscribe(estimate_id, q)
+
+    def stream(
+        self,
+        estimate_id: str,
+        heartbeat: float = HEARTBEAT_SECONDS,
+        q: Optional[SubscriberQueue] = None
+    ) -> Iterator[str]:
+        """
+        Yield SSE-formatted events for an estimate until the client goes away.
+        A comment line is sent every `heartbeat` seconds to keep proxies open.
+        If the bus dropped this subscriber, a `resync` event ends the stream.
+        """
+        q = q or self.subscribe(estimate_id)
+        try:
+            yield 'retry: 3000\n\n'
+            while True:
+                try:
+                    event = q.get(timeout=heartbeat)
+                except queue.Empty:
+                    event = None
+                if q.resync:
+                    # Events were lost; buffered ones are no use without them
+                    yield format_sse({
+                        'id': next(self._seq),
+                        'type': 'resync',
+                        'estimate_id': estimate_id,
+                        'data': {'reason': 'subscriber fell behind'},
+                        'ts': datetime.utcnow().isoformat(),
+                    })
+                    return
+                if event is None:
+                    yield ': keep-alive\n\n'
+                    continue
+                yield format_sse(event)
+                if event['type'] == 'estimate_deleted':
+                    return
+        finally:
+            self.unsubscribe(estimate_id, q)
+
+
+# =============================================================================
+# PAYLOAD HELPERS
+# =============================================================================
+
+def format_sse(event: Dict) -> str:
+    """Format an event dict as a text/event-stream frame."""
+    payload = json.dumps(event, separators=(',', ':'))
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {payload}\n\n"
+
+
+def totals_payload(estimate) -> Dict:
+    """Compact totals snapshot for an estimate."""
+    data = {}
+    for field in TOTALS_FIELDS:
+        value = getattr(estimate, field)
+        data[field] = float(value) if value is not None else None
+    return data
+
+
+# Process-wide bus used by EstimationService and the SSE route
+event_bus = EstimateEventBus()
@@ -0,0 +1,380 @@
+"""
+Ohmni Estimate - Fast Serializers
+Drop into: backend/services/estimate_serializers.py
+
+Serialization path for the estimation blueprint. Produces the same payloads as
+the models' `to_dict()` methods, but:
+
+- field specs are compiled once per model into (key, column, converter) tuples
+- line items can be projected straight from SQL row tuples, skipping ORM
+  instance construction and identity-map bookkeeping
+- JSON is encoded with orjson when installed (falls back to stdlib json)
+- large responses are gzip/brotli compressed when the client accepts it
+"""
+
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+from decimal import Decimal
+import gzip
+import json
+
+from flask import Response, request
+
+from backend.extensions import db
+from backend.models.estimate_models import Estimate, EstimateLineItem, PricingItem, Proposal
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+COMPRESSION_MIN_BYTES = 1400  # ~ one TCP segment; smaller bodies aren't worth it
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+
+# =============================================================================
+# CONVERTERS (mirror the `float(x) if x else ...` idiom in to_dict)
+# =============================================================================
+
+def _raw(value):
+    return value
+
+
+def _float_or_zero(value):
+    return float(value) if value else 0
+
+
+def _float_or_none(value):
+    return float(value) if value else None
+
+
+def _float_or(default: float) -> Callable:
+    def convert(value):
+        return float(value) if value else default
+    return convert
+
+
+def _isoformat(value):
+    return value.isoformat() if value else None
+
+
+# =============================================================================
+# FIELD SPECS
+# =============================================================================
+
+# (output key, model column, converter) — order matches to_dict()
+FieldSpec = Tuple[Tuple[str, object, Callable], ...]
+
+PRICING_ITEM_FIELDS: FieldSpec = (
+    ('id', PricingItem.id, _raw),
+    ('category', PricingItem.category, _raw),
+    ('subcategory', PricingItem.subcategory, _raw),
+    ('name', PricingItem.name, _raw),
+    ('description', PricingItem.description, _raw),
+    ('size', PricingItem.size, _raw),
+    ('material_cost', PricingItem.material_cost, _float_or_zero),
+    ('labor_hours', PricingItem.labor_hours, _float_or_zero),
+    ('unit_type', PricingItem.unit_type, _raw),
+    ('market_price', PricingItem.market_price, _float_or_none),
+)
+
+ESTIMATE_FIELDS: FieldSpec = (
+    ('id', Estimate.id, _raw),
+    ('user_id', Estimate.user_id, _raw),
+    ('chat_session_id', Estimate.chat_session_id, _raw),
+    ('project_name', Estimate.project_name, _raw),
+    ('project_number', Estimate.project_number, _raw),
+    ('project_location', Estimate.project_location, _raw),
+    ('gc_name', Estimate.gc_name, _raw),
+    ('contact_name', Estimate.contact_name, _raw),
+    ('square_footage', Estimate.square_footage, _raw),
+    ('project_type', Estimate.project_type, _raw),
+    ('region', Estimate.region, _raw),
+    ('labor_rate', Estimate.labor_rate, _float_or(118.00)),
+    ('material_tax_rate', Estimate.material_tax_rate, _float_or(0.1025)),
+    ('overhead_profit_rate', Estimate.overhead_profit_rate, _float_or_zero),
+    ('total_material', Estimate.total_material, _float_or_zero),
+    ('total_material_with_tax', Estimate.total_material_with_tax, _float_or_zero),
+    ('total_labor_hours', Estimate.total_labor_hours, _float_or_zero),
+    ('total_labor_cost', Estimate.total_labor_cost, _float_or_zero),
+    ('subtotal', Estimate.subtotal, _float_or_zero),
+    ('overhead_profit', Estimate.overhead_profit, _float_or_zero),
+    ('final_bid', Estimate.final_bid, _float_or_zero),
+    ('price_per_sqft', Estimate.price_per_sqft, _float_or_none),
+    ('status', Estimate.status, _raw),
+    ('created_at', Estimate.created_at, _isoformat),
+    ('updated_at', Estimate.updated_at, _isoformat),
+)
+
+LINE_ITEM_FIELDS: FieldSpec = (
+    ('id', EstimateLineItem.id, _raw),
+    ('estimate_id', EstimateLineItem.estimate_id, _raw),
+    ('pricing_item_id', EstimateLineItem.pricing_item_id, _raw),
+    ('category', EstimateLineItem.category, _raw),
+    ('description', EstimateLineItem.description, _raw),
+    ('quantity', EstimateLineItem.quantity, _float_or_zero),
+    ('unit_type', EstimateLineItem.unit_type, _raw),
+    ('material_unit_cost', EstimateLineItem.material_unit_cost, _float_or_zero),
+    ('labor_hours_per_unit', EstimateLineItem.labor_hours_per_unit, _float_or_zero),
+    ('material_extension', EstimateLineItem.material_extension, _float_or_zero),
+    ('labor_extension', EstimateLineItem.labor_extension, _float_or_zero),
+    ('total_cost', EstimateLineItem.total_cost, _float_or_zero),
+    ('source', EstimateLineItem.source, _raw),
+    ('ai_confidence', EstimateLineItem.ai_confidence, _float_or_none),
+    ('sort_order', EstimateLineItem.sort_order, _raw),
+)
+
+PROPOSAL_FIELDS: FieldSpec = (
+    ('id', Proposal.id, _raw),
+    ('estimate_id', Proposal.estimate_id, _raw),
+    ('title', Proposal.title, _raw),
+    ('content', Proposal.content, _raw),
+    ('scope_of_work', Proposal.scope_of_work, _raw),
+    ('exclusions', Proposal.exclusions, _raw),
+    ('pdf_url', Proposal.pdf_url, _raw),
+    ('valid_days', Proposal.valid_days, _raw),
+    ('valid_until', Proposal.valid_until, _isoformat),
+    ('version', Proposal.version, _raw),
+    ('render_status', Proposal.render_status, _raw),
+    ('source_revision', Proposal.source_revision, _raw),
+    ('render_error', Proposal.render_error, _raw),
+    ('rendered_at', Proposal.rendered_at, _isoformat),
+    ('created_at', Proposal.created_at, _isoformat),
+)
+
+
+class CompiledSerializer:
+    """
+    A field spec compiled into parallel tuples for tight serialization loops.
+
+    `dump(obj)` reads attributes off an ORM instance.
+    `dump_row(row)` converts a row tuple selected with `columns`.
+    """
+
+    def __init__(self, fields: FieldSpec):
+        self.fields = fields
+        self.keys: Tuple[str, ...] = tuple(f[0] for f in fields)
+        self.columns: Tuple = tuple(f[1] for f in fields)
+        self.converters: Tuple[Callable, ...] = tuple(f[2] for f in fields)
+        self.attrs: Tuple[str, ...] = tuple(c.key for c in self.columns)
+        self._plan = tuple(zip(self.keys, self.attrs, self.converters))
+        self._row_plan = tuple(zip(self.keys, self.converters))
+        self._subsets: Dict[FrozenSet[str], 'CompiledSerializer'] = {}
+
+    def subset(self, keys: Iterable[str]) -> 'CompiledSerializer':
+        """
+        Serializer restricted to `keys` (sparse fieldset). `id` is always kept.
+        Raises ValueError on unknown field names. Subsets are compiled once and cached.
+        """
+        wanted = {k.strip() for k in keys if k and k.strip()}
+        unknown = wanted - set(self.keys)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        wanted.add('id')
+
+        cache_key = frozenset(wanted)
+        compiled = self._subsets.get(cache_key)
+        if compiled is None:
+            compiled = CompiledSerializer(tuple(f for f in self.fields if f[0] in wanted))
+            self._subsets[cache_key] = compiled
+        return compiled
+
+    def dump(self, obj) -> Dict:
+        return {key: convert(getattr(obj, attr)) for key, attr, convert in self._plan}
+
+    def dump_many(self, objs: Iterable) -> List[Dict]:
+        dump = self.dump
+        return [dump(obj) for obj in objs]
+
+    def dump_row(self, row: Sequence) -> Dict:
+        return {key: convert(value) for (key, convert), value in zip(self._row_plan, row)}
+
+    def dump_rows(self, rows: Iterable[Sequence]) -> List[Dict]:
+        dump_row = self.dump_row
+        return [dump_row(row) for row in rows]
+
+
+pricing_item_serializer = CompiledSerializer(PRICING_ITEM_FIELDS)
+estimate_serializer = CompiledSerializer(ESTIMATE_FIELDS)
+line_item_serializer = CompiledSerializer(LINE_ITEM_FIELDS)
+proposal_serializer = CompiledSerializer(PROPOSAL_FIELDS)
+
+
+# =============================================================================
+# ROW-TUPLE PROJECTIONS
+# =============================================================================
+
+def project_estimate(
+    estimate_id: str,
+    user_id: str,
+    serializer: CompiledSerializer = estimate_serializer
+) -> Optional[Dict]:
+    """Select only the serializer's columns for one estimate (scoped to user)."""
+    row = db.session.query(*serializer.columns).filter(
+        Estimate.id == estimate_id,
+        Estimate.user_id == user_id,
+        Estimate.deleted_at.is_(None)
+    ).first()
+    return serializer.dump_row(row) if row else None
+
+
+def project_estimates(
+    user_id: str,
+    serializer: CompiledSerializer = estimate_serializer,
+    status: Optional[str] = None,
+    limit: int = 50
+) -> List[Dict]:
+    """Column-projected equivalent of EstimationService.get_user_estimates."""
+    query = db.session.query(*serializer.columns).filter(
+        Estimate.user_id == user_id,
+        Estimate.deleted_at.is_(None)
+    )
+    if status:
+        query = query.filter(Estimate.status == status)
+    rows = query.order_by(Estimate.updated_at.desc()).limit(limit).all()
+    return serializer.dump_rows(rows)
+
+
+def project_estimates_by_id(
+    user_id: str,
+    estimate_ids: Sequence[str],
+    serializer: CompiledSerializer = estimate_serializer
+) -> List[Dict]:
+    """Column-projected estimates for a set of ids (one IN query, scoped to user)."""
+    if not estimate_ids:
+        return []
+    rows = db.session.query(*serializer.columns).filter(
+        Estimate.user_id == user_id,
+        Estimate.id.in_(estimate_ids),
+        Estimate.deleted_at.is_(None)
+    ).all()
+    return serializer.dump_rows(rows)
+
+
+def project_line_items(
+    estimate_id: str,
+    serializer: CompiledSerializer = line_item_serializer
+) -> List[Dict]:
+    """Serialize an estimate's line items from row tuples (no ORM instances)."""
+    rows = db.session.query(*serializer.columns).filter(
+        EstimateLineItem.estimate_id == estimate_id
+    ).order_by(EstimateLineItem.sort_order).all()
+    return serializer.dump_rows(rows)
+
+
+def project_category_totals(estimate_id: str) -> Dict[str, float]:
+    """Category rollup computed in SQL (GROUP BY category)."""
+    rows = db.session.query(
+        EstimateLineItem.category,
+        db.func.sum(EstimateLineItem.total_cost)
+    ).filter(
+        EstimateLineItem.estimate_id == estimate_id
+    ).group_by(EstimateLineItem.category).all()
+    return {cat: float(total) if total else 0 for cat, total in rows}
+
+
+def project_category_rollups(estimate_ids: Sequence[str]) -> Dict[str, Dict[str, Dict]]:
+    """
+    Category rollups for many estimates in one grouped query.
+
+    Returns {estimate_id: {category: {"total": float, "item_count": int}}}.
+    Estimates without line items are absent from the result.
+    """
+    if not estimate_ids:
+        return {}
+    rows = db.session.query(
+        EstimateLineItem.estimate_id,
+        EstimateLineItem.category,
+        db.func.sum(EstimateLineItem.total_cost),
+        db.func.count(EstimateLineItem.id)
+    ).filter(
+        EstimateLineItem.estimate_id.in_(estimate_ids)
+    ).group_by(EstimateLineItem.estimate_id, EstimateLineItem.category).all()
+
+    rollups: Dict[str, Dict[str, Dict]] = {}
+    for estimate_id, cat, total, count in rows:
+        rollups.setdefault(estimate_id, {})[cat] = {
+            'total': float(total) if total else 0,
+            'item_count': count
+        }
+    return rollups
+
+
+def category_totals_from_items(items: Iterable[Dict]) -> Dict[str, float]:
+    """Category rollup computed from already-serialized line items."""
+    totals: Dict[str, float] = {}
+    for item in items:
+        cat = item['category']
+        totals[cat] = totals.get(cat, 0) + item['total_cost']
+    return totals
+
+
+def serialize_estimate(estimate: Estimate, include_line_items: bool = False) -> Dict:
+    """Fast equivalent of `estimate.to_dict(include_line_items)`."""
+    data = estimate_serializer.dump(estimate)
+    if include_line_items:
+        items = project_line_items(estimate.id)
+        data['line_items'] = items
+        data['category_totals'] = category_totals_from_items(items)
+    return data
+
+
+# =============================================================================
+# JSON ENCODING + COMPRESSION
+# =============================================================================
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(payload) -> bytes:
+    """Encode a payload to JSON bytes using the fastest available encoder."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, default=_json_default, separators=(',', ':')).encode('utf-8')
+
+
+def _choose_encoding(accept_encoding: str) -> Optional[str]:
+    accepted = {part.split(';')[0].strip().lower() for part in accept_encoding.split(',')}
+    if brotli is not None and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+
+def compress_body(body: bytes, accept_encoding: str,
+                  min_bytes: int = COMPRESSION_MIN_BYTES) -> Tuple[bytes, Optional[str]]:
+    """Compress a body if it is large enough and the client accepts it."""
+    if len(body) < min_bytes:
+        return body, None
+    encoding = _choose_encoding(accept_encoding or '')
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY), 'br'
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=GZIP_LEVEL), 'gzip'
+    return body, None
+
+
+def json_response(payload, status: int = 200) -> Response:
+    """Drop-in replacement for `jsonify(payload), status` on hot routes."""
+    body, encoding = compress_body(dumps(payload), request.headers.get('Accept-Encoding', ''))
+    response = Response(body, status=status, mimetype='application/json')
+    response.headers['Vary'] = 'Accept-Encoding'
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    return response
@@ -15,6 +15,20 @@ from backend.extensions import db
 from backend.models.estimate_models import (
     Estimate, EstimateLineItem, PricingItem, Proposal
 )
+from backend.services.estimate_archive import restore_estimate
+from backend.services.estimate_deletion import (
+    delete_estimates, soft_delete_estimates, undelete_estimates
+)
+from backend.services.estimate_events import event_bus, totals_payload
+from backend.services.outcome_stats import record_outcome_stats
+from backend.services.pricing_index import CatalogEntry, pricing_index
+from backend.services.pricing_import import SECTION_STATS_KEYS, iter_pricing_file, pricing_row
+from backend.services.price_history import get_price_as_of, get_prices_as_of
+from backend.services.quote_cache import NO_MATCH, quick_quote_cache
+from backend.services.pricing_matcher import get_pricing_matcher
+from backend.services.pricing_layers import estimate_overrides, pricing_layers
+from backend.services.proposal_rendering import estimate_revision, queue_render, render_stalled
+from backend.services.repricing import impact_report, reprice_line_items
 
 logger = logging.getLogger(__name__)
 
@@ -73,15 +87,23 @@ class EstimationService:
         gc_name: Optional[str] = None,
         project_location: Optional[str] = None,
         chat_session_id: Optional[str] = None,
-        labor_rate: float = DEFAULT_LABOR_RATE,
+        labor_rate: Optional[float] = None,
         material_tax_rate: float = DEFAULT_TAX_RATE,
-        overhead_profit_rate: float = DEFAULT_OP_RATE
+        overhead_profit_rate: float = DEFAULT_OP_RATE,
+        region: Optional[str] = None
     ) -> Estimate:
-        """Create a new estimate."""
+        """
+        Create a new estimate.
+        Without an explicit labor_rate, the region/project_type overlay rate (or the default) is used.
+        """
+        if labor_rate is None:
+            labor_rate = pricing_layers.labor_rate(region, project_type) or DEFAULT_LABOR_RATE
+
         estimate = Estimate(
             user_id=self.user_id,
             project_name=project_name,
             project_type=project_type,
+            region=region,
             square_footage=square_footage,
             gc_name=gc_name,
             project_location=project_location,
@@ -97,11 +119,16 @@ class EstimationService:
         return estimate
 
     def get_estimate(self, estimate_id: str) -> Optional[Estimate]:
-        """Get an estimate by ID (scoped to user)."""
-        return Estimate.query.filter_by(
+        """Get an estimate by ID (scoped to user), restoring it from the archive if needed."""
+        query = Estimate.query.filter_by(
             id=estimate_id,
-            user_id=self.user_id
-        ).first()
+            user_id=self.user_id,
+            deleted_at=None
+        )
+        estimate = query.first()
+        if estimate is None and restore_estimate(estimate_id, self.user_id):
+            estimate = query.first()
+        return estimate
 
     def get_user_estimates(
         self,
@@ -109,7 +136,7 @@ class EstimationService:
         limit: int = 50
     ) -> List[Estimate]:
         """Get all estimates for the current user."""
-        query = Estimate.query.filter_by(user_id=self.user_id)
+        query = Estimate.query.filter_by(user_id=self.user_id, deleted_at=None)
         if status:
             query = query.filter_by(status=status)
         return query.order_by(Estimate.updated_at.desc()).limit(limit).all()
@@ -127,7 +154,7 @@ class EstimationService:
         allowed_fields = [
             'project_name', 'project_number', 'project_location',
             'gc_name', 'contact_name', 'contact_email', 'contact_phone',
-            'square_footage', 'project_type',
+            'square_footage', 'project_type', 'region',
             'labor_rate', 'material_tax_rate', 'overhead_profit_rate',
             'status'
         ]
@@ -137,22 +164,67 @@ class EstimationService:
                 setattr(estimate, field, value)
 
         # Recalculate if pricing params changed
-        if any(f in kwargs for f in ['labor_rate', 'material_tax_rate', 'overhead_profit_rate']):
+        repriced = any(f in kwargs for f in ['labor_rate', 'material_tax_rate', 'overhead_profit_rate'])
+        if repriced:
             self._recalculate_all_line_items(estimate)
 
         estimate.recalculate_totals()
         db.session.commit()
+        event_bus.publish(estimate.id, 'estimate_updated', {
+            'fields': {f: kwargs[f] for f in kwargs if f in allowed_fields},
+            'line_items_repriced': repriced,
+            'totals': totals_payload(estimate)
+        })
         return estimate
 
-    def delete_estimate(self, estimate_id: str) -> bool:
-        """Delete an estimate and all related items."""
+    def delete_estimate(self, estimate_id: str, soft: bool = False) -> bool:
+        """
+        Delete an estimate and all related items with set-based DELETEs.
+        soft=True only marks it deleted; the background purger removes it later.
+        """
+        return bool(self.bulk_delete_estimates([estimate_id], soft=soft))
+
+    def bulk_delete_estimates(self, estimate_ids: List[str], soft: bool = False) -> List[str]:
+        """Delete many of the user's estimates. Returns the ids actually deleted."""
+        if soft:
+            return soft_delete_estimates(estimate_ids, user_id=self.user_id)
+        return delete_estimates(estimate_ids, user_id=self.user_id)
+
+    def undelete_estimates(self, estimate_ids: List[str]) -> List[str]:
+        """Bring back soft-deleted estimates that have not been purged yet."""
+        return undelete_estimates(estimate_ids, user_id=self.user_id)
+
+    def set_price_overrides(
+        self,
+        estimate_id: str,
+        overrides: Dict[str, Optional[Dict]]
+    ) -> Optional[Estimate]:
+        """
+        Pin estimate-level prices: {pricing_item_id: {material_cost, labor_hours}}.
+        A None value removes that item's override.
+        """
         estimate = self.get_estimate(estimate_id)
         if not estimate:
-            return False
-        db.session.delete(estimate)
+            return None
+
+        metadata = dict(estimate.estimate_metadata or {})
+        current = dict(metadata.get('price_overrides') or {})
+        for pricing_item_id, price in overrides.items():
+            if price is None:
+                current.pop(pricing_item_id, None)
+            else:
+                current[pricing_item_id] = {
+                    key: float(price[key]) for key in ('material_cost', 'labor_hours') if key in price
+                }
+        metadata['price_overrides'] = current
+        estimate.estimate_metadata = metadata
         db.session.commit()
-        logger.info(f"Deleted estimate {estimate_id}")
-        return True
+        event_bus.publish(estimate.id, 'estimate_updated', {
+            'fields': {'price_overrides': current},
+            'line_items_repriced': False,
+            'totals': totals_payload(estimate)
+        })
+        return estimate
 
     # -------------------------------------------------------------------------
     # LINE ITEM MANAGEMENT
@@ -209,6 +281,7 @@ class EstimationService:
         # Recalculate estimate totals
         estimate.recalculate_totals()
         db.session.commit()
+        self._publish_line_item(estimate, 'added', line_item.to_dict())
 
         logger.info(f"Added line item to estimate {estimate_id}: {description}")
         return line_item
@@ -218,21 +291,42 @@ class EstimationService:
         estimate_id: str,
         pricing_item_id: str,
         quantity: float,
-        source: str = 'manual'
+        source: str = 'manual',
+        as_of: Optional[datetime] = None
     ) -> Optional[EstimateLineItem]:
-        """Add a line item using a pricing item from the database."""
-        pricing_item = PricingItem.query.get(pricing_item_id)
-        if not pricing_item:
+        """
+        Add a line item using a pricing item from the database.
+        The price is resolved through the estimate's region/project_type
+        overlays and price overrides (see services/pricing_layers.py).
+        With `as_of`, the base is the price book in effect on that date.
+        """
+        estimate = self.get_estimate(estimate_id)
+        if not estimate:
             return None
 
+        entry = pricing_layers.flattened(estimate.region, estimate.project_type).entries.get(pricing_item_id)
+        base = None
+        if entry is None:
+            # Not in the active catalog (e.g. retired by a re-import): price from its own row
+            pricing_item = PricingItem.query.get(pricing_item_id)
+            if not pricing_item:
+                return None
+            entry = CatalogEntry.from_row(pricing_item)
+            base = (entry.material_cost, entry.labor_hours)
+
+        if as_of:
+            point = get_price_as_of(pricing_item_id, as_of)
+            base = (point.material_cost, point.labor_hours)
+        price = pricing_layers.resolve_for_estimate(estimate, pricing_item_id, base=base)
+
         return self.add_line_item(
             estimate_id=estimate_id,
-            category=pricing_item.category,
-            description=pricing_item.name,
+            category=entry.category,
+            description=entry.name,
             quantity=quantity,
-            material_unit_cost=float(pricing_item.material_cost),
-            labor_hours_per_unit=float(pricing_item.labor_hours),
-            unit_type=pricing_item.unit_type,
+            material_unit_cost=price.material_cost,
+            labor_hours_per_unit=price.labor_hours,
+            unit_type=entry.unit_type,
             pricing_item_id=pricing_item_id,
             source=source
         )
@@ -273,6 +367,7 @@ class EstimationService:
         )
         estimate.recalculate_totals()
         db.session.commit()
+        self._publish_line_item(estimate, 'updated', line_item.to_dict())
         return line_item
 
     def delete_line_item(self, line_item_id: str, estimate_id: str) -> bool:
@@ -291,6 +386,8 @@ class EstimationService:
             estimate.recalculate_totals()
 
         db.session.commit()
+        if estimate:
+            self._publish_line_item(estimate, 'deleted', {'id': line_item_id})
         return True
 
     def bulk_add_line_items(
@@ -331,10 +428,15 @@ class EstimationService:
     def search_pricing_items(
         query: str,
         category: Optional[str] = None,
-        limit: int = 20
+        limit: int = 20,
+        columns: Optional[Tuple] = None
     ) -> List[PricingItem]:
-        """Search pricing items by name/description."""
-        q = PricingItem.query.filter(PricingItem.is_active == True)
+        """
+        Search pricing items by name/description.
+        Pass `columns` to get row tuples of just those columns instead of models.
+        """
+        base = db.session.query(*columns) if columns else PricingItem.query
+        q = base.filter(PricingItem.is_active == True)
 
         if category:
             q = q.filter(PricingItem.category == category)
@@ -351,11 +453,27 @@ class EstimationService:
         return q.limit(limit).all()
 
     @staticmethod
-    def get_pricing_by_category(category: str) -> List[PricingItem]:
-        """Get all pricing items in a category."""
-        return PricingItem.query.filter_by(
-            category=category,
-            is_active=True
+    def match_pricing_items(
+        names: List[str],
+        limit: int = 3,
+        category: Optional[str] = None
+    ) -> List[List[Tuple]]:
+        """
+        Fuzzy-match free-text item names against the catalog (offline n-gram
+        similarity). Returns one ranked [(CatalogEntry, score), ...] per name.
+        """
+        return get_pricing_matcher().query_many(names, limit=limit, category=category)
+
+    @staticmethod
+    def get_pricing_by_category(
+        category: str,
+        columns: Optional[Tuple] = None
+    ) -> List[PricingItem]:
+        """Get all pricing items in a category (row tuples if `columns` given)."""
+        base = db.session.query(*columns) if columns else PricingItem.query
+        return base.filter(
+            PricingItem.category == category,
+            PricingItem.is_active == True
         ).order_by(PricingItem.name).all()
 
     @staticmethod
@@ -391,14 +509,27 @@ class EstimationService:
         conduit_size: str,
         length_feet: float,
         conductor_count: int = 4,
-        ampacity_multiplier: float = 1.0
+        ampacity_multiplier: float = 1.0,
+        region: Optional[str] = None,
+        project_type: Optional[str] = None,
+        estimate_id: Optional[str] = None
     ) -> Dict:
         """
         Calculate feeder pricing combining wire and conduit.
+        Prices are resolved through the region/project_type overlays, or
+        through an estimate's overlays and overrides when estimate_id is given.
         Returns dict with material_cost, labor_hours, description.
         """
-        wire = self.get_wire_pricing(wire_material, wire_size)
-        conduit = self.get_conduit_pricing(conduit_type, conduit_size)
+        overrides = None
+        if estimate_id:
+            estimate = self.get_estimate(estimate_id)
+            if estimate:
+                region, project_type = estimate.region, estimate.project_type
+                overrides = estimate_overrides(estimate)
+
+        view = pricing_layers.flattened(region, project_type)
+        wire = view.find('WIRE', f"{wire_material}_THHN", wire_size)
+        conduit = view.find('CONDUIT', conduit_type, conduit_size)
 
         if not wire or not conduit:
             return {
@@ -407,13 +538,16 @@ class EstimationService:
                 'labor_hours': 0
             }
 
+        wire_price = pricing_layers.resolve(wire.id, region, project_type, overrides)
+        conduit_price = pricing_layers.resolve(conduit.id, region, project_type, overrides)
+
         # Wire cost: (price per 1000ft × conductors) / 10 for per 100ft
-        wire_cost_per_100ft = (float(wire.material_cost) * conductor_count) / 10
-        wire_labor_per_100ft = (float(wire.labor_hours) * conductor_count) / 10
+        wire_cost_per_100ft = (wire_price.material_cost * conductor_count) / 10
+        wire_labor_per_100ft = (wire_price.labor_hours * conductor_count) / 10
 
         # Conduit is already per 100ft
-        conduit_cost_per_100ft = float(conduit.material_cost)
-        conduit_labor_per_100ft = float(conduit.labor_hours)
+        conduit_cost_per_100ft = conduit_price.material_cost
+        conduit_labor_per_100ft = conduit_price.labor_hours
 
         # Combined with multiplier
         total_cost_per_100ft = (wire_cost_per_100ft + conduit_cost_per_100ft) * ampacity_multiplier
@@ -430,7 +564,8 @@ class EstimationService:
             'labor_hours': round(labor_hours, 2),
             'description': description,
             'wire': wire.name,
-            'conduit': conduit.name
+            'conduit': conduit.name,
+            'pricing_layers': sorted(set(wire_price.layers) | set(conduit_price.layers))
         }
 
     # -------------------------------------------------------------------------
@@ -442,36 +577,54 @@ class EstimationService:
         items: List[Dict],
         labor_rate: float = DEFAULT_LABOR_RATE,
         tax_rate: float = DEFAULT_TAX_RATE,
-        op_rate: float = DEFAULT_OP_RATE
+        op_rate: float = DEFAULT_OP_RATE,
+        as_of: Optional[datetime] = None
     ) -> Dict:
         """
         Generate a quick quote without creating an estimate.
         Items format: [{'name': 'Duplex Receptacle', 'quantity': 10}, ...]
+
+        With `as_of`, items are priced from the price book in effect on that date.
+        Results and per-name matches are cached until the pricing catalog
+        version changes (see services/quote_cache.py).
         """
+        cache_key = quick_quote_cache.quote_key(items, labor_rate, tax_rate, op_rate, as_of)
+        cached = quick_quote_cache.get_quote(cache_key)
+        if cached is not None:
+            return cached
+        version = quick_quote_cache.version
+
         total_material = 0
         total_labor_hours = 0
         line_items = []
 
+        resolved_items = []
         for item in items:
-            # Try to find matching pricing item
-            pricing_items = self.search_pricing_items(item['name'], limit=1)
-            if not pricing_items:
-                continue
+            resolved = self._resolve_quote_item(item['name'])
+            if resolved:
+                resolved_items.append((item, resolved[0], resolved[1]))
 
-            pricing = pricing_items[0]
+        prices = {}
+        if as_of:
+            prices = get_prices_as_of([p.id for _, p, _ in resolved_items], as_of)
+
+        for item, pricing, match_score in resolved_items:
             qty = item.get('quantity', 1)
             unit_type = pricing.unit_type
+            point = prices.get(pricing.id)
+            material_cost = point.material_cost if point else float(pricing.material_cost)
+            labor_hours = point.labor_hours if point else float(pricing.labor_hours)
 
             # Calculate extensions
             if unit_type == 'C':
-                mat_ext = (qty * float(pricing.material_cost)) / 100
-                lbr_ext = (qty * float(pricing.labor_hours)) / 100
+                mat_ext = (qty * material_cost) / 100
+                lbr_ext = (qty * labor_hours) / 100
             elif unit_type == 'M':
-                mat_ext = (qty * float(pricing.material_cost)) / 1000
-                lbr_ext = (qty * float(pricing.labor_hours)) / 1000
+                mat_ext = (qty * material_cost) / 1000
+                lbr_ext = (qty * labor_hours) / 1000
             else:
-                mat_ext = qty * float(pricing.material_cost)
-                lbr_ext = qty * float(pricing.labor_hours)
+                mat_ext = qty * material_cost
+                lbr_ext = qty * labor_hours
 
             total_material += mat_ext
             total_labor_hours += lbr_ext
@@ -487,7 +640,8 @@ class EstimationService:
                 'unit_type': unit_type,
                 'material_extension': round(mat_ext, 2),
                 'labor_extension': round(lbr_ext, 2),
-                'total': round(line_total, 2)
+                'total': round(line_total, 2),
+                'match_score': match_score
             })
 
         # Calculate totals
@@ -497,7 +651,7 @@ class EstimationService:
         overhead = subtotal * op_rate
         final_total = round(subtotal + overhead)
 
-        return {
+        result = {
             'line_items': line_items,
             'total_material': round(total_material, 2),
             'total_material_with_tax': round(total_material_with_tax, 2),
@@ -509,9 +663,126 @@ class EstimationService:
             'parameters': {
                 'labor_rate': labor_rate,
                 'tax_rate': tax_rate,
-                'overhead_profit_rate': op_rate
+                'overhead_profit_rate': op_rate,
+                'as_of': as_of.isoformat() if as_of else None
             }
         }
+        quick_quote_cache.put_quote(cache_key, result, version)
+        return result
+
+    def _resolve_quote_item(self, name: str) -> Optional[Tuple[CatalogEntry, Optional[float]]]:
+        """
+        Find the pricing item for a quick-quote name: ILIKE search first, then
+        fuzzy match. Returns (entry, match_score) or None; memoized per name.
+        """
+        cached = quick_quote_cache.get_match(name)
+        if cached is NO_MATCH:
+            return None
+        if cached is not None:
+            return cached
+        version = quick_quote_cache.version
+
+        resolved = None
+        pricing_items = self.search_pricing_items(name, limit=1)
+        if pricing_items:
+            resolved = (CatalogEntry.from_row(pricing_items[0]), None)
+        else:
+            matches = self.match_pricing_items([name], limit=1)[0]
+            if matches:
+                resolved = matches[0]
+
+        quick_quote_cache.put_match(name, resolved if resolved else NO_MATCH, version)
+        return resolved
+
+    # -------------------------------------------------------------------------
+    # REPRICING
+    # -------------------------------------------------------------------------
+
+    def pricing_impact(
+        self,
+        pricing_item_ids: List[str],
+        prices: Optional[Dict[str, Dict]] = None
+    ) -> Dict:
+        """Dollar impact of catalog price changes on this user's open estimates."""
+        return impact_report(pricing_item_ids, user_id=self.user_id, prices=prices)
+
+    def reprice_open_estimates(
+        self,
+        pricing_item_ids: List[str],
+        prices: Optional[Dict[str, Dict]] = None
+    ) -> Dict:
+        """Push new unit costs into the affected line items of open estimates."""
+        return reprice_line_items(pricing_item_ids, user_id=self.user_id, prices=prices)
+
+    # -------------------------------------------------------------------------
+    # PROPOSALS
+    # -------------------------------------------------------------------------
+
+    def generate_proposal(
+        self,
+        app,
+        estimate_id: str,
+        title: Optional[str] = None,
+        scope_of_work: Optional[str] = None,
+        exclusions: Optional[List[str]] = None,
+        valid_days: Optional[int] = None,
+        force: bool = False
+    ) -> Tuple[Optional[Proposal], bool]:
+        """
+        Queue a proposal render. The latest proposal is reused while the
+        estimate revision is unchanged (or it is still rendering), unless force
+        or custom content is given. A render stuck pending/rendering past
+        RENDER_TIMEOUT_SECONDS is marked failed and queued again as a new
+        version. Returns (proposal, queued).
+        """
+        estimate = self.get_estimate(estimate_id)
+        if not estimate:
+            return None, False
+
+        revision = estimate_revision(estimate_id)
+        latest = estimate.proposals.order_by(Proposal.version.desc()).first()
+        custom = title or scope_of_work or exclusions or valid_days
+        if latest and not force and not custom:
+            if render_stalled(latest):
+                logger.warning(f"Proposal {latest.id} stuck {latest.render_status}; re-queueing")
+                latest.render_status = 'failed'
+                latest.render_error = 'Render timed out'
+                db.session.commit()
+            elif latest.render_status in ('pending', 'rendering'):
+                return latest, False
+            if latest.render_status == 'ready' and latest.source_revision == revision:
+                return latest, False
+
+        proposal = Proposal(
+            estimate_id=estimate_id,
+            user_id=self.user_id,
+            title=title or f"Electrical Proposal - {estimate.project_name}",
+            scope_of_work=scope_of_work,
+            exclusions='\n'.join(exclusions) if exclusions else None,
+            valid_days=valid_days or 30,
+            version=(latest.version + 1) if latest else 1,
+            render_status='pending',
+            source_revision=revision
+        )
+        db.session.add(proposal)
+        db.session.commit()
+
+        queue_render(app, proposal.id, CATEGORY_ORDER)
+        logger.info(f"Queued proposal v{proposal.version} for estimate {estimate_id}")
+        return proposal, True
+
+    def get_proposals(self, estimate_id: str) -> Optional[List[Proposal]]:
+        estimate = self.get_estimate(estimate_id)
+        if not estimate:
+            return None
+        return estimate.proposals.order_by(Proposal.version.desc()).all()
+
+    def get_proposal(self, estimate_id: str, proposal_id: str) -> Optional[Proposal]:
+        return Proposal.query.filter_by(
+            id=proposal_id,
+            estimate_id=estimate_id,
+            user_id=self.user_id
+        ).first()
 
     # -------------------------------------------------------------------------
     # OUTCOME TRACKING (for AI learning)
@@ -540,7 +811,19 @@ class EstimationService:
             metadata['outcome_notes'] = notes
             estimate.estimate_metadata = metadata
 
+        # Win-rate / $/sqft buckets, committed with the outcome
+        record_outcome_stats(estimate, won)
+
         db.session.commit()
+        event_bus.publish(estimate.id, 'estimate_updated', {
+            'fields': {
+                'status': estimate.status,
+                'outcome_at': estimate.outcome_at.isoformat(),
+                'won_amount': float(estimate.won_amount) if estimate.won_amount is not None else None
+            },
+            'line_items_repriced': False,
+            'totals': totals_payload(estimate)
+        })
         logger.info(f"Recorded outcome for estimate {estimate_id}: {'won' if won else 'lost'}")
         return estimate
 
@@ -557,6 +840,15 @@ class EstimationService:
         for item in estimate.line_items:
             item.calculate(labor_rate, tax_rate, op_rate)
 
+    @staticmethod
+    def _publish_line_item(estimate: Estimate, op: str, item: Dict):
+        """Push a line item patch plus the resulting totals."""
+        event_bus.publish(estimate.id, 'line_item', {
+            'op': op,
+            'item': item,
+            'totals': totals_payload(estimate)
+        })
+
 
 # =============================================================================
 # PRICING IMPORT UTILITY
@@ -566,53 +858,19 @@ def import_pricing_database(json_path: str) -> Dict:
     """
     Import pricing data from JSON file.
     Run once during setup: import_pricing_database('flask_integration/data/pricing_database.json')
-    """
-    with open(json_path, 'r') as f:
-        data = json.load(f)
 
+    For large price books use the background job in services/pricing_import.py
+    (POST /api/estimates/admin/import-pricing), which streams the file and
+    swaps the catalog in atomically.
+    """
     stats = {'conduit': 0, 'wire': 0, 'line_items': 0}
 
-    # Import conduit
-    for item in data.get('conduit', []):
-        pricing = PricingItem(
-            category='CONDUIT',
-            subcategory=item['type'],
-            name=item['name'],
-            size=item['size'],
-            material_cost=item['materialCostPer100ft'],
-            labor_hours=item['laborHoursPer100ft'],
-            unit_type='C'
-        )
-        db.session.add(pricing)
-        stats['conduit'] += 1
-
-    # Import wire
-    for item in data.get('wire', []):
-        pricing = PricingItem(
-            category='WIRE',
-            subcategory=f"{item['material']}_{item['type']}",
-            name=item['name'],
-            size=item['size'],
-            material_cost=item['materialCostPer1000ft'],
-            labor_hours=item['laborHoursPer1000ft'],
-            unit_type='M',
-            market_price=item.get('marketPricePer1000ft')
-        )
-        db.session.add(pricing)
-        stats['wire'] += 1
-
-    # Import line items (equipment, devices, fixtures)
-    for item in data.get('lineItems', []):
-        pricing = PricingItem(
-            category=item['category'],
-            name=item['name'],
-            material_cost=item['materialUnitCost'],
-            labor_hours=item['laborHoursPerUnit'],
-            unit_type=item.get('unitType', 'E')
-        )
-        db.session.add(pricing)
-        stats['line_items'] += 1
+    with open(json_path, 'rb') as f:
+        for section, item in iter_pricing_file(f):
+            db.session.add(PricingItem(**pricing_row(section, item)))
+            stats[SECTION_STATS_KEYS[section]] += 1
 
     db.session.commit()
+    pricing_index.rebuild()
     logger.info(f"Imported pricing database: {stats}")
     return stats
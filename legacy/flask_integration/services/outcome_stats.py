@@ -0,0 +1,332 @@
+"""
+Ohmni Estimate - Online Outcome Statistics
+Drop into: backend/services/outcome_stats.py
+
+Win rate and $/sqft statistics maintained incrementally as outcomes are
+recorded, so bid calibration questions ("win rate on warehouses under
+$18/sqft?") are answered from a handful of rows instead of scanning estimates.
+
+Each outcome updates four buckets per user: all, project_type, gc_name and the
+outcome month. A bucket keeps counts and sums plus three quantile sketches:
+
+    ppsf_all   price_per_sqft of every decided bid
+    ppsf_won   price_per_sqft of won bids
+    won_ratio  won_amount / final_bid of won bids
+
+The sketches are log-bucketed histograms (DDSketch style): a value lands in
+bin ceil(log_gamma(x)), so quantiles come back within RELATIVE_ACCURACY of the
+true value, an update is O(1), and removing a value is the same as adding it
+with weight -1. That lets a re-recorded outcome back out its earlier
+contribution, which is remembered in estimate_metadata['outcome_stats'].
+Deleting an estimate backs its stored contribution out the same way (see
+estimate_deletion.py), and a rebuild reads archived estimates too.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import datetime
+import logging
+import math
+
+from sqlalchemy import bindparam
+
+from backend.extensions import db
+from backend.models.estimate_models import Estimate, OutcomeStatsBucket, estimates_archive
+
+logger = logging.getLogger(__name__)
+
+RELATIVE_ACCURACY = 0.01
+DIMENSIONS = ('all', 'project_type', 'gc_name', 'month')
+SKETCHES = ('ppsf_all', 'ppsf_won', 'won_ratio')
+SUMMARY_QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+CLOSED_STATUSES = ('won', 'lost')
+REBUILD_BATCH_SIZE = 500
+UNKNOWN_KEY = '(none)'
+
+
+# =============================================================================
+# QUANTILE SKETCH
+# =============================================================================
+
+class QuantileSketch:
+    """Relative-error quantile sketch over positive values; bins = {index: count}."""
+
+    MIN_VALUE = 1e-9
+
+    def __init__(self, relative_accuracy: float = RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _index(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+    def add(self, value: float, weight: int = 1):
+        """Add a value (weight=-1 removes one previously added)."""
+        if value is None:
+            return
+        if value <= self.MIN_VALUE:
+            self.zero_count += weight
+        else:
+            index = self._index(value)
+            count = self.bins.get(index, 0) + weight
+            if count > 0:
+                self.bins[index] = count
+            else:
+                self.bins.pop(index, None)
+        self.count += weight
+
+    def quantile(self, q: float) -> Optional[float]:
+        if self.count <= 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if seen > rank:
+                return self._value(index)
+        return self._value(max(self.bins)) if self.bins else 0.0
+
+    def rank(self, value: float) -> int:
+        """Approximate number of values <= value."""
+        if value <= self.MIN_VALUE:
+            return self.zero_count
+        limit = self._index(value)
+        return self.zero_count + sum(c for i, c in self.bins.items() if i <= limit)
+
+    def to_dict(self) -> Dict:
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'zero_count': self.zero_count,
+            'count': self.count,
+            'bins': {str(i): c for i, c in self.bins.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> 'QuantileSketch':
+        data = data or {}
+        sketch = cls(data.get('relative_accuracy', RELATIVE_ACCURACY))
+        sketch.zero_count = data.get('zero_count', 0)
+        sketch.count = data.get('count', 0)
+        sketch.bins = {int(i): c for i, c in (data.get('bins') or {}).items()}
+        return sketch
+
+
+# =============================================================================
+# CONTRIBUTIONS
+# =============================================================================
+
+def _contribution(estimate: Estimate, won: bool) -> Dict:
+    """What one outcome adds to its buckets (stored so it can be backed out later)."""
+    final_bid = float(estimate.final_bid) if estimate.final_bid else 0.0
+    won_amount = float(estimate.won_amount) if won and estimate.won_amount else None
+    outcome_at = estimate.outcome_at or datetime.utcnow()
+    return {
+        'won': won,
+        'final_bid': final_bid,
+        'won_amount': won_amount,
+        'price_per_sqft': float(estimate.price_per_sqft) if estimate.price_per_sqft else None,
+        'buckets': [
+            ['all', 'all'],
+            ['project_type', estimate.project_type or UNKNOWN_KEY],
+            ['gc_name', estimate.gc_name or UNKNOWN_KEY],
+            ['month', outcome_at.strftime('%Y-%m')],
+        ],
+    }
+
+
+def _get_bucket(user_id: str, dimension: str, bucket_key: str) -> OutcomeStatsBucket:
+    bucket = OutcomeStatsBucket.query.filter_by(
+        user_id=user_id, dimension=dimension, bucket_key=bucket_key
+    ).with_for_update().first()
+    if bucket is None:
+        bucket = OutcomeStatsBucket(
+            user_id=user_id, dimension=dimension, bucket_key=bucket_key,
+            outcomes=0, wins=0, final_bid_sum=0, won_bid_sum=0, won_amount_sum=0,
+            price_per_sqft_count=0, price_per_sqft_sum=0, sketches={}
+        )
+        db.session.add(bucket)
+    return bucket
+
+
+def _apply(bucket: OutcomeStatsBucket, c: Dict, sign: int):
+    won = c['won']
+    ppsf = c['price_per_sqft']
+
+    bucket.outcomes += sign
+    bucket.final_bid_sum = float(bucket.final_bid_sum or 0) + sign * c['final_bid']
+    if won:
+        bucket.wins += sign
+        bucket.won_bid_sum = float(bucket.won_bid_sum or 0) + sign * c['final_bid']
+        bucket.won_amount_sum = float(bucket.won_amount_sum or 0) + sign * (c['won_amount'] or 0)
+    if ppsf is not None:
+        bucket.price_per_sqft_count += sign
+        bucket.price_per_sqft_sum = float(bucket.price_per_sqft_sum or 0) + sign * ppsf
+
+    stored = bucket.sketches or {}
+    sketches = {name: QuantileSketch.from_dict(stored.get(name)) for name in SKETCHES}
+    if ppsf is not None:
+        sketches['ppsf_all'].add(ppsf, sign)
+        if won:
+            sketches['ppsf_won'].add(ppsf, sign)
+    if won and c['won_amount'] and c['final_bid']:
+        sketches['won_ratio'].add(c['won_amount'] / c['final_bid'], sign)
+    # Reassign so the JSONB change is flushed
+    bucket.sketches = {name: sketch.to_dict() for name, sketch in sketches.items()}
+
+
+def record_outcome_stats(estimate: Estimate, won: bool):
+    """
+    Fold one outcome into the user's buckets. Call before committing the
+    outcome; a previously recorded outcome for the estimate is backed out first.
+    """
+    metadata = dict(estimate.estimate_metadata or {})
+    previous = metadata.get('outcome_stats')
+    current = _contribution(estimate, won)
+
+    if previous:
+        for dimension, key in previous['buckets']:
+            _apply(_get_bucket(estimate.user_id, dimension, key), previous, -1)
+    for dimension, key in current['buckets']:
+        _apply(_get_bucket(estimate.user_id, dimension, key), current, 1)
+
+    metadata['outcome_stats'] = current
+    estimate.estimate_metadata = metadata
+
+
+def _apply_stored(rows: Iterable[Tuple[str, Optional[Dict]]], sign: int):
+    for user_id, metadata in rows:
+        stored = (metadata or {}).get('outcome_stats')
+        if stored:
+            for dimension, key in stored['buckets']:
+                _apply(_get_bucket(user_id, dimension, key), stored, sign)
+
+
+def retract_outcome_stats(rows: Iterable[Tuple[str, Optional[Dict]]]):
+    """
+    Back out the stored contributions of estimates being deleted, given
+    (user_id, estimate_metadata) pairs. Caller commits.
+    """
+    _apply_stored(rows, -1)
+
+
+def restore_outcome_stats(rows: Iterable[Tuple[str, Optional[Dict]]]):
+    """Re-add stored contributions (undeleted estimates). Caller commits."""
+    _apply_stored(rows, 1)
+
+
+def rebuild_outcome_stats(user_id: str) -> int:
+    """
+    Recompute a user's buckets from scratch (backfill) from hot and archived
+    estimates. Returns outcomes folded in.
+    """
+    OutcomeStatsBucket.query.filter_by(user_id=user_id).delete(synchronize_session=False)
+    count = 0
+    estimates = Estimate.query.filter(
+        Estimate.user_id == user_id,
+        Estimate.status.in_(CLOSED_STATUSES),
+        Estimate.deleted_at.is_(None)
+    ).yield_per(REBUILD_BATCH_SIZE)
+    for estimate in estimates:
+        metadata = dict(estimate.estimate_metadata or {})
+        metadata.pop('outcome_stats', None)
+        estimate.estimate_metadata = metadata
+        record_outcome_stats(estimate, estimate.status == 'won')
+        count += 1
+
+    # Archived rows have the same columns, so _contribution reads them as is
+    archived = db.session.query(estimates_archive).filter(
+        estimates_archive.c.user_id == user_id,
+        estimates_archive.c.status.in_(CLOSED_STATUSES),
+        estimates_archive.c.deleted_at.is_(None)
+    ).yield_per(REBUILD_BATCH_SIZE)
+    updates = []
+    for row in archived:
+        contribution = _contribution(row, row.status == 'won')
+        for dimension, key in contribution['buckets']:
+            _apply(_get_bucket(user_id, dimension, key), contribution, 1)
+        metadata = dict(row.estimate_metadata or {})
+        metadata['outcome_stats'] = contribution
+        updates.append({'_id': row.id, '_metadata': metadata})
+        count += 1
+    update_metadata = estimates_archive.update().where(
+        estimates_archive.c.id == bindparam('_id')
+    ).values(estimate_metadata=bindparam('_metadata'))
+    for i in range(0, len(updates), REBUILD_BATCH_SIZE):
+        db.session.execute(update_metadata, updates[i:i + REBUILD_BATCH_SIZE])
+    db.session.commit()
+    logger.info(f"Rebuilt outcome stats for user {user_id} from {count} outcomes")
+    return count
+
+
+# =============================================================================
+# QUERIES
+# =============================================================================
+
+def _round(value: Optional[float], places: int = 4) -> Optional[float]:
+    return round(value, places) if value is not None else None
+
+
+def summarize_bucket(bucket: OutcomeStatsBucket, max_price_per_sqft: Optional[float] = None) -> Dict:
+    stored = bucket.sketches or {}
+    sketches = {name: QuantileSketch.from_dict(stored.get(name)) for name in SKETCHES}
+    outcomes = bucket.outcomes or 0
+    wins = bucket.wins or 0
+    won_bid_sum = float(bucket.won_bid_sum or 0)
+
+    summary = {
+        'dimension': bucket.dimension,
+        'key': bucket.bucket_key,
+        'outcomes': outcomes,
+        'wins': wins,
+        'losses': outcomes - wins,
+        'win_rate': _round(wins / outcomes) if outcomes else None,
+        'avg_final_bid': _round(float(bucket.final_bid_sum or 0) / outcomes, 2) if outcomes else None,
+        'avg_price_per_sqft': _round(
+            float(bucket.price_per_sqft_sum or 0) / bucket.price_per_sqft_count, 2
+        ) if bucket.price_per_sqft_count else None,
+        'won_to_bid_ratio': _round(float(bucket.won_amount_sum or 0) / won_bid_sum) if won_bid_sum else None,
+        'price_per_sqft_quantiles': {
+            str(q): _round(sketches['ppsf_all'].quantile(q), 2) for q in SUMMARY_QUANTILES
+        },
+        'won_price_per_sqft_quantiles': {
+            str(q): _round(sketches['ppsf_won'].quantile(q), 2) for q in SUMMARY_QUANTILES
+        },
+        'won_ratio_quantiles': {
+            str(q): _round(sketches['won_ratio'].quantile(q)) for q in SUMMARY_QUANTILES
+        },
+    }
+
+    if max_price_per_sqft is not None:
+        bids = sketches['ppsf_all'].rank(max_price_per_sqft)
+        won = sketches['ppsf_won'].rank(max_price_per_sqft)
+        summary['below_price_per_sqft'] = {
+            'max_price_per_sqft': max_price_per_sqft,
+            'outcomes': bids,
+            'wins': won,
+            'win_rate': _round(won / bids) if bids else None,
+        }
+    return summary
+
+
+def get_outcome_stats(
+    user_id: str,
+    dimension: str = 'all',
+    key: Optional[str] = None,
+    max_price_per_sqft: Optional[float] = None
+) -> List[Dict]:
+    """Summaries for one bucket (key given) or every bucket in a dimension."""
+    if dimension not in DIMENSIONS:
+        raise ValueError(f"dimension must be one of: {', '.join(DIMENSIONS)}")
+    query = OutcomeStatsBucket.query.filter_by(user_id=user_id, dimension=dimension)
+    if key is not None:
+        query = query.filter_by(bucket_key=key)
+    buckets = query.order_by(OutcomeStatsBucket.bucket_key).all()
+    return [summarize_bucket(b, max_price_per_sqft) for b in buckets]
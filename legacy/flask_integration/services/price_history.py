@@ -0,0 +1,300 @@
+"""
+Ohmni Estimate - Effective-Dated Price Books
+Drop into: backend/services/price_history.py
+
+Point-in-time pricing: "what did item X cost on date D?"
+
+Price rows live in `pricing_item_prices` (see PricingItemPrice). A lookup
+loads only the requested items' rows, on first use, into a bounded LRU: per
+pricing item, a sorted list of effective dates with a parallel list of
+prices, so a lookup is one bisect (O(log n) in that item's history). Items
+with no history on or before D fall back to their current PricingItem price.
+
+A price book records only items whose price differs from the one already in
+effect, so re-snapshotting an unchanged catalog writes nothing.
+
+Record a price book (snapshot of the live catalog, or explicit prices):
+    record_price_book('2025-Q1', effective_from=datetime(2025, 1, 1))
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from bisect import bisect_right
+from datetime import datetime
+import logging
+import threading
+import time
+
+from backend.extensions import db
+from backend.models.estimate_models import PricingItem, PricingItemPrice, generate_uuid
+from backend.services.quote_cache import LRUCache, quick_quote_cache
+
+logger = logging.getLogger(__name__)
+
+# Other workers pick up price books recorded elsewhere after this long
+RELOAD_SECONDS = 300
+# Pricing items whose history is held in memory
+HISTORY_CACHE_SIZE = 20000
+HISTORY_QUERY_BATCH = 500
+
+
+class PricePoint(NamedTuple):
+    pricing_item_id: str
+    material_cost: float
+    labor_hours: float
+    effective_from: Optional[datetime]  # None = current catalog price (no history)
+    price_book: Optional[str]
+
+    def to_dict(self) -> Dict:
+        data = self._asdict()
+        data['effective_from'] = self.effective_from.isoformat() if self.effective_from else None
+        return data
+
+
+# =============================================================================
+# HISTORY CACHE
+# =============================================================================
+
+class ItemHistory(NamedTuple):
+    """One item's price rows: sorted effective dates + parallel price tuples."""
+    dates: List[datetime]
+    points: List[Tuple]
+    loaded_at: float
+
+    def lookup(self, pricing_item_id: str, as_of: datetime) -> Optional[PricePoint]:
+        """Price in effect at `as_of`, or None if the item has no history by then."""
+        i = bisect_right(self.dates, as_of)
+        if i == 0:
+            return None
+        effective_from, material_cost, labor_hours, price_book = self.points[i - 1]
+        return PricePoint(pricing_item_id, material_cost, labor_hours, effective_from, price_book)
+
+
+class PriceHistoryHolder:
+    """
+    Per-item histories, loaded on demand for the items being looked up (one
+    IN query per HISTORY_QUERY_BATCH uncached ids) and kept in a bounded LRU.
+    """
+
+    def __init__(self, maxsize: int = HISTORY_CACHE_SIZE, reload_seconds: float = RELOAD_SECONDS):
+        self.reload_seconds = reload_seconds
+        self._items = LRUCache(maxsize)
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def _load(self, pricing_item_ids: List[str]) -> Dict[str, ItemHistory]:
+        now = time.monotonic()
+        grouped: Dict[str, List[Tuple]] = {item_id: [] for item_id in pricing_item_ids}
+        for start in range(0, len(pricing_item_ids), HISTORY_QUERY_BATCH):
+            rows = db.session.query(
+                PricingItemPrice.pricing_item_id,
+                PricingItemPrice.effective_from,
+                PricingItemPrice.material_cost,
+                PricingItemPrice.labor_hours,
+                PricingItemPrice.price_book
+            ).filter(
+                PricingItemPrice.pricing_item_id.in_(pricing_item_ids[start:start + HISTORY_QUERY_BATCH])
+            ).all()
+            for item_id, effective_from, material_cost, labor_hours, price_book in rows:
+                grouped[item_id].append((
+                    effective_from,
+                    float(material_cost) if material_cost else 0,
+                    float(labor_hours) if labor_hours else 0,
+                    price_book
+                ))
+
+        histories = {}
+        for item_id, points in grouped.items():
+            points.sort(key=lambda p: p[0])
+            histories[item_id] = ItemHistory([p[0] for p in points], points, now)
+        return histories
+
+    def histories(self, pricing_item_ids: Iterable[str]) -> Dict[str, ItemHistory]:
+        """History per id (empty for items without any), loading what isn't cached."""
+        now = time.monotonic()
+        found, missing = {}, []
+        for item_id in pricing_item_ids:
+            history = self._items.get(item_id)
+            if history is None or now - history.loaded_at > self.reload_seconds:
+                missing.append(item_id)
+            else:
+                found[item_id] = history
+
+        if missing:
+            generation = self._generation
+            loaded = self._load(missing)
+            found.update(loaded)
+            with self._lock:
+                # Don't cache rows read before a price book was recorded
+                if generation == self._generation:
+                    for item_id, history in loaded.items():
+                        self._items.put(item_id, history)
+        return found
+
+    def lookup_many(self, pricing_item_ids: Iterable[str], as_of: datetime) -> Dict[str, PricePoint]:
+        found = {}
+        for item_id, history in self.histories(pricing_item_ids).items():
+            point = history.lookup(item_id, as_of)
+            if point:
+                found[item_id] = point
+        return found
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._items.clear()
+
+
+price_history = PriceHistoryHolder()
+
+
+# =============================================================================
+# LOOKUPS
+# =============================================================================
+
+def get_prices_as_of(
+    pricing_item_ids: Sequence[str],
+    as_of: Optional[datetime] = None
+) -> Dict[str, PricePoint]:
+    """
+    Batch point-in-time lookup. Items without history on or before `as_of`
+    (or all items when as_of is None) use their current catalog price, loaded
+    with one IN query. Unknown ids are omitted.
+    """
+    ids = list(dict.fromkeys(pricing_item_ids))
+    found = price_history.lookup_many(ids, as_of) if as_of else {}
+
+    missing = [i for i in ids if i not in found]
+    if missing:
+        rows = db.session.query(
+            PricingItem.id, PricingItem.material_cost, PricingItem.labor_hours
+        ).filter(PricingItem.id.in_(missing)).all()
+        for item_id, material_cost, labor_hours in rows:
+            found[item_id] = PricePoint(
+                item_id,
+                float(material_cost) if material_cost else 0,
+                float(labor_hours) if labor_hours else 0,
+                None,
+                None
+            )
+    return found
+
+
+def get_price_as_of(pricing_item_id: str, as_of: Optional[datetime] = None) -> Optional[PricePoint]:
+    return get_prices_as_of([pricing_item_id], as_of).get(pricing_item_id)
+
+
+# =============================================================================
+# RECORDING
+# =============================================================================
+
+def _price_key(material_cost, labor_hours) -> Tuple[float, float]:
+    """Prices at column scale, for comparing against stored rows."""
+    return (round(float(material_cost or 0), 2), round(float(labor_hours or 0), 3))
+
+
+def _prices_in_effect(
+    effective_from: datetime,
+    pricing_item_ids: Optional[List[str]] = None
+) -> Dict[str, Tuple[float, float]]:
+    """Latest recorded price on or before effective_from, per item (all items when ids is None)."""
+    batches = [None] if pricing_item_ids is None else [
+        pricing_item_ids[i:i + HISTORY_QUERY_BATCH]
+        for i in range(0, len(pricing_item_ids), HISTORY_QUERY_BATCH)
+    ]
+    found = {}
+    for ids in batches:
+        latest = db.session.query(
+            PricingItemPrice.pricing_item_id,
+            db.func.max(PricingItemPrice.effective_from).label('effective_from')
+        ).filter(PricingItemPrice.effective_from <= effective_from)
+        if ids is not None:
+            latest = latest.filter(PricingItemPrice.pricing_item_id.in_(ids))
+        latest = latest.group_by(PricingItemPrice.pricing_item_id).subquery()
+
+        rows = db.session.query(
+            PricingItemPrice.pricing_item_id, PricingItemPrice.material_cost, PricingItemPrice.labor_hours
+        ).join(latest, db.and_(
+            PricingItemPrice.pricing_item_id == latest.c.pricing_item_id,
+            PricingItemPrice.effective_from == latest.c.effective_from
+        ))
+        for item_id, material_cost, labor_hours in rows:
+            found[item_id] = _price_key(material_cost, labor_hours)
+    return found
+
+
+def record_price_book(
+    price_book: str,
+    effective_from: Optional[datetime] = None,
+    prices: Optional[List[Dict]] = None,
+    commit: bool = True
+) -> int:
+    """
+    Record a price book version.
+
+    prices: [{"pricing_item_id": ..., "material_cost": ..., "labor_hours": ...}]
+            When omitted, the live catalog (all active items) is snapshotted.
+            A missing material_cost or labor_hours keeps the item's current
+            catalog value (e.g. a material-only book).
+
+    Items whose price equals the one already in effect at effective_from are
+    skipped. Returns the number of price rows written.
+    """
+    effective_from = effective_from or datetime.utcnow()
+    now = datetime.utcnow()
+
+    if prices is None:
+        source = db.session.query(
+            PricingItem.id, PricingItem.material_cost, PricingItem.labor_hours
+        ).filter(PricingItem.is_active == True).all()
+        rows = [
+            {
+                'id': generate_uuid(),
+                'pricing_item_id': item_id,
+                'price_book': price_book,
+                'effective_from': effective_from,
+                'material_cost': material_cost or 0,
+                'labor_hours': labor_hours or 0,
+                'created_at': now,
+            }
+            for item_id, material_cost, labor_hours in source
+        ]
+    else:
+        partial = list({
+            p['pricing_item_id'] for p in prices
+            if p.get('material_cost') is None or p.get('labor_hours') is None
+        })
+        current = {
+            item_id: (material_cost or 0, labor_hours or 0)
+            for item_id, material_cost, labor_hours in db.session.query(
+                PricingItem.id, PricingItem.material_cost, PricingItem.labor_hours
+            ).filter(PricingItem.id.in_(partial))
+        } if partial else {}
+        rows = []
+        for p in prices:
+            material_cost, labor_hours = current.get(p['pricing_item_id'], (0, 0))
+            rows.append({
+                'id': generate_uuid(),
+                'pricing_item_id': p['pricing_item_id'],
+                'price_book': price_book,
+                'effective_from': effective_from,
+                'material_cost': material_cost if p.get('material_cost') is None else p['material_cost'],
+                'labor_hours': labor_hours if p.get('labor_hours') is None else p['labor_hours'],
+                'created_at': now,
+            })
+
+    in_effect = _prices_in_effect(
+        effective_from, None if prices is None else [r['pricing_item_id'] for r in rows]
+    )
+    rows = [
+        r for r in rows
+        if in_effect.get(r['pricing_item_id']) != _price_key(r['material_cost'], r['labor_hours'])
+    ]
+
+    if rows:
+        db.session.bulk_insert_mappings(PricingItemPrice, rows)
+    if commit:
+        db.session.commit()
+    price_history.invalidate()
+    quick_quote_cache.clear()
+    logger.info(f"Recorded price book '{price_book}' effective {effective_from}: {len(rows)} prices")
+    return len(rows)
@@ -0,0 +1,444 @@
+"""
+Ohmni Estimate - Pricing Import Jobs
+Drop into: backend/services/pricing_import.py
+
+Background import of pricing_database.json:
+
+1. The file is parsed incrementally (one array element at a time), so a large
+   price book never has to fit in memory as a single document.
+2. Rows are inserted in batches as inactive rows tagged with the job id.
+3. On success the new catalog is swapped in with one transaction. Staged
+   rows are matched to existing rows by natural key (category, subcategory,
+   name, size): matches update the existing row in place, so its id - and
+   every line item, overlay, override and price history row keyed on it -
+   stays valid. Only truly new rows are activated and only rows missing from
+   the file are deactivated. Then the in-memory pricing index is rebuilt.
+   On failure the staged rows are removed and the live catalog is untouched.
+
+Progress (bytes parsed, rows inserted per section) is available through
+get_import_job() while the job runs.
+"""
+
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import codecs
+import json
+import logging
+import os
+import threading
+import uuid
+
+from backend.extensions import db
+from backend.models.estimate_models import PricingItem, generate_uuid
+from backend.services.pricing_index import pricing_index
+from backend.services.price_history import record_price_book
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+IMPORT_BATCH_SIZE = 500
+READ_CHUNK_BYTES = 64 * 1024
+MAX_TRACKED_JOBS = 20
+
+SECTIONS = ('conduit', 'wire', 'lineItems')
+SECTION_STATS_KEYS = {'conduit': 'conduit', 'wire': 'wire', 'lineItems': 'line_items'}
+
+# Columns an import may change on an existing row (everything pricing_row sets)
+UPDATABLE_COLUMNS = (
+    'description', 'material_cost', 'labor_hours', 'unit_type', 'market_price', 'markup_percent'
+)
+
+
+# =============================================================================
+# ROW MAPPING (mirrors scripts/pricing/import_pricing.mjs)
+# =============================================================================
+
+def _wire_material_cost(item: Dict) -> float:
+    if item.get('materialCostPer1000ft'):
+        return item['materialCostPer1000ft']
+    return item['marketPricePer1000ft'] * (1 + item.get('markupPercent', 0))
+
+
+def pricing_row(section: str, item: Dict) -> Dict:
+    """Map one pricing_database.json entry to PricingItem column values."""
+    if section == 'conduit':
+        return {
+            'category': 'CONDUIT',
+            'subcategory': item['type'],
+            'name': item['name'],
+            'size': item['size'],
+            'material_cost': item['materialCostPer100ft'],
+            'labor_hours': item['laborHoursPer100ft'],
+            'unit_type': 'C',
+        }
+    if section == 'wire':
+        return {
+            'category': 'WIRE',
+            'subcategory': f"{item['material']}_{item['type']}",
+            'name': item.get('name') or f"{item['material']} {item['type']} {item['size']}",
+            'size': item['size'],
+            'material_cost': _wire_material_cost(item),
+            'labor_hours': item['laborHoursPer1000ft'],
+            'unit_type': 'M',
+            'market_price': item.get('marketPricePer1000ft'),
+            'markup_percent': item.get('markupPercent'),
+        }
+    if section == 'lineItems':
+        return {
+            'category': item['category'],
+            'name': item.get('name') or item['description'],
+            'description': item.get('description'),
+            'material_cost': item['materialUnitCost'],
+            'labor_hours': item['laborHoursPerUnit'],
+            'unit_type': item.get('unitType', 'E'),
+        }
+    raise ValueError(f"Unknown pricing section: {section}")
+
+
+# =============================================================================
+# INCREMENTAL JSON READER
+# =============================================================================
+
+class _JSONStream:
+    """
+    Minimal pull parser for `{"key": value, ..., "conduit": [ {...}, ... ]}`.
+    Array elements in the wanted sections are decoded one at a time with
+    JSONDecoder.raw_decode; everything else is decoded and discarded.
+    """
+
+    WHITESPACE = ' \t\r\n'
+
+    def __init__(self, f: BinaryIO, chunk_size: int = READ_CHUNK_BYTES):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.utf8 = codecs.getincrementaldecoder('utf-8')()
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.bytes_read = 0
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        raw = self.f.read(self.chunk_size)
+        self.bytes_read += len(raw)
+        if not raw:
+            self.eof = True
+            self.buf = self.buf[self.pos:] + self.utf8.decode(b'', final=True)
+        else:
+            self.buf = self.buf[self.pos:] + self.utf8.decode(raw)
+        self.pos = 0
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in self.WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON input")
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise ValueError(f"Expected '{char}' at offset {self.bytes_read}")
+        self.pos += 1
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the very end of the buffer may continue in the next chunk
+            if end == len(self.buf) and not self.eof:
+                self._fill()
+                continue
+            self.pos = end
+            return value
+
+    def iter_sections(self, sections=SECTIONS) -> Iterator[Tuple[str, Dict]]:
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            if key in sections and self._peek() == '[':
+                self.pos += 1
+                if self._peek() == ']':
+                    self.pos += 1
+                else:
+                    while True:
+                        yield key, self._value()
+                        if self._peek() == ',':
+                            self.pos += 1
+                            continue
+                        self._expect(']')
+                        break
+            else:
+                self._value()
+
+            if self._peek() == ',':
+                self.pos += 1
+                continue
+            self._expect('}')
+            return
+
+
+def iter_pricing_file(f: BinaryIO) -> Iterator[Tuple[str, Dict]]:
+    """Yield (section, item) pairs from an open pricing_database.json (binary mode)."""
+    return _JSONStream(f).iter_sections()
+
+
+# =============================================================================
+# IMPORT JOBS
+# =============================================================================
+
+class PricingImportJob:
+    """State and progress of one background import."""
+
+    def __init__(self, json_path: str, batch_size: int = IMPORT_BATCH_SIZE):
+        self.id = str(uuid.uuid4())
+        self.json_path = json_path
+        self.batch_size = batch_size
+        self.status = 'queued'  # queued, running, swapping, completed, failed
+        self.stats = {key: 0 for key in SECTION_STATS_KEYS.values()}
+        self.changes = {'updated': 0, 'added': 0, 'deactivated': 0}
+        self.rows_inserted = 0
+        self.bytes_read = 0
+        self.bytes_total = 0
+        self.error: Optional[str] = None
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+
+    @property
+    def progress(self) -> float:
+        if self.status == 'completed':
+            return 1.0
+        if not self.bytes_total:
+            return 0.0
+        return round(min(self.bytes_read / self.bytes_total, 1.0), 4)
+
+    def to_dict(self) -> Dict:
+        return {
+            'id': self.id,
+            'json_path': self.json_path,
+            'status': self.status,
+            'progress': self.progress,
+            'rows_inserted': self.rows_inserted,
+            'imported': dict(self.stats),
+            'catalog_changes': dict(self.changes),
+            'bytes_read': self.bytes_read,
+            'bytes_total': self.bytes_total,
+            'error': self.error,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+# One import at a time; jobs queue behind each other
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pricing-import')
+_jobs: Dict[str, PricingImportJob] = {}
+_jobs_lock = threading.Lock()
+
+
+def _track(job: PricingImportJob):
+    with _jobs_lock:
+        _jobs[job.id] = job
+        if len(_jobs) > MAX_TRACKED_JOBS:
+            finished = sorted(
+                (j for j in _jobs.values() if j.status in ('completed', 'failed')),
+                key=lambda j: j.created_at
+            )
+            for old in finished[:len(_jobs) - MAX_TRACKED_JOBS]:
+                del _jobs[old.id]
+
+
+def get_import_job(job_id: str) -> Optional[PricingImportJob]:
+    with _jobs_lock:
+        return _jobs.get(job_id)
+
+
+def list_import_jobs() -> List[PricingImportJob]:
+    with _jobs_lock:
+        return sorted(_jobs.values(), key=lambda j: j.created_at, reverse=True)
+
+
+def start_import_job(app, json_path: str, batch_size: int = IMPORT_BATCH_SIZE) -> PricingImportJob:
+    """
+    Queue a background import. `app` is the Flask app (use
+    current_app._get_current_object() inside a request).
+    """
+    if not os.path.isfile(json_path):
+        raise FileNotFoundError(f"Pricing file not found: {json_path}")
+
+    job = PricingImportJob(json_path, batch_size=batch_size)
+    _track(job)
+    _executor.submit(_run_job, app, job)
+    logger.info(f"Queued pricing import {job.id} from {json_path}")
+    return job
+
+
+def _run_job(app, job: PricingImportJob):
+    with app.app_context():
+        try:
+            job.status = 'running'
+            job.started_at = datetime.utcnow()
+            job.bytes_total = os.path.getsize(job.json_path)
+
+            _stage_rows(job)
+
+            job.status = 'swapping'
+            job.changes = _swap_catalog(job.id, effective_from=job.started_at)
+        except Exception as e:
+            db.session.rollback()
+            job.status = 'failed'
+            job.error = str(e)
+            logger.error(f"Pricing import {job.id} failed: {e}")
+            _discard_staged(job.id)
+            job.finished_at = datetime.utcnow()
+            db.session.remove()
+            return
+
+        # The new catalog (and its price book) is committed, so the job has
+        # succeeded. If the rebuild fails, drop the index so the next read
+        # rebuilds it.
+        try:
+            pricing_index.rebuild()
+        except Exception as e:
+            db.session.rollback()
+            pricing_index.invalidate()
+            job.error = f"Catalog imported; search index rebuild failed: {e}"
+            logger.warning(f"Pricing import {job.id}: index rebuild failed: {e}")
+        finally:
+            job.status = 'completed'
+            job.finished_at = datetime.utcnow()
+            db.session.remove()
+        logger.info(f"Pricing import {job.id} completed: {job.stats}")
+
+
+def _stage_rows(job: PricingImportJob):
+    """Insert the file's rows in batches as inactive rows tagged with the job id."""
+    now = datetime.utcnow()
+    batch: List[Dict] = []
+
+    with open(job.json_path, 'rb') as f:
+        stream = _JSONStream(f)
+        for section, item in stream.iter_sections():
+            row = pricing_row(section, item)
+            row.update(
+                id=generate_uuid(),
+                is_active=False,
+                import_batch=job.id,
+                created_at=now,
+                updated_at=now
+            )
+            batch.append(row)
+            job.stats[SECTION_STATS_KEYS[section]] += 1
+
+            if len(batch) >= job.batch_size:
+                _flush(job, batch)
+                job.bytes_read = stream.bytes_read
+                batch = []
+
+        if batch:
+            _flush(job, batch)
+        job.bytes_read = stream.bytes_read
+
+
+def _flush(job: PricingImportJob, batch: List[Dict]):
+    db.session.bulk_insert_mappings(PricingItem, batch)
+    db.session.commit()
+    job.rows_inserted += len(batch)
+
+
+def _batches(items: List) -> Iterator[List]:
+    for i in range(0, len(items), IMPORT_BATCH_SIZE):
+        yield items[i:i + IMPORT_BATCH_SIZE]
+
+
+def _natural_key(category, subcategory, name, size) -> Tuple:
+    return (category, subcategory or None, name, size or None)
+
+
+def _swap_catalog(job_id: str, effective_from: Optional[datetime] = None) -> Dict[str, int]:
+    """
+    Merge the staged rows into the catalog in one transaction, keeping the
+    ids of rows that already exist, and record the result as price book
+    "import-<job_id>" in the same transaction. Returns counts of updated,
+    added and deactivated rows.
+    """
+    now = datetime.utcnow()
+    key_columns = (PricingItem.category, PricingItem.subcategory, PricingItem.name, PricingItem.size)
+
+    # Existing rows by natural key; an active row wins over an inactive one,
+    # so an item that was dropped and comes back keeps its old id.
+    existing: Dict[Tuple, Tuple[str, bool]] = {}
+    live = set()  # active ids; whatever the file doesn't match is deactivated
+    for item_id, is_active, *key in db.session.query(
+        PricingItem.id, PricingItem.is_active, *key_columns
+    ).filter(
+        db.or_(PricingItem.import_batch.is_(None), PricingItem.import_batch != job_id)
+    ).order_by(PricingItem.updated_at):
+        key = _natural_key(*key)
+        if is_active:
+            live.add(item_id)
+        if is_active or not existing.get(key, (None, False))[1]:
+            existing[key] = (item_id, bool(is_active))
+
+    updates, merged, added = [], [], []
+    staged = db.session.query(
+        PricingItem.id, *key_columns, *(getattr(PricingItem, c) for c in UPDATABLE_COLUMNS)
+    ).filter(PricingItem.import_batch == job_id)
+    for row in staged:
+        staged_id, key, values = row[0], _natural_key(*row[1:5]), row[5:]
+        # pop: a key repeated in the file becomes a second row, as before
+        match = existing.pop(key, None)
+        if match is None:
+            added.append(staged_id)
+            continue
+        update = dict(zip(UPDATABLE_COLUMNS, values))
+        update.update(id=match[0], is_active=True, updated_at=now)
+        updates.append(update)
+        merged.append(staged_id)
+        live.discard(match[0])
+
+    for batch in _batches(updates):
+        db.session.bulk_update_mappings(PricingItem, batch)
+    for ids in _batches(merged):
+        PricingItem.query.filter(PricingItem.id.in_(ids)).delete(synchronize_session=False)
+    for ids in _batches(added):
+        PricingItem.query.filter(PricingItem.id.in_(ids)).update(
+            {'is_active': True, 'updated_at': now}, synchronize_session=False
+        )
+    for ids in _batches(list(live)):
+        PricingItem.query.filter(PricingItem.id.in_(ids)).update(
+            {'is_active': False, 'updated_at': now}, synchronize_session=False
+        )
+    record_price_book(f"import-{job_id}", effective_from=effective_from or now, commit=False)
+    db.session.commit()
+    return {'updated': len(updates), 'added': len(added), 'deactivated': len(live)}
+
+
+def _discard_staged(job_id: str):
+    try:
+        PricingItem.query.filter(
+            PricingItem.import_batch == job_id,
+            PricingItem.is_active == False
+        ).delete(synchronize_session=False)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Could not remove staged rows for import {job_id}: {e}")
@@ -0,0 +1,275 @@
+"""
+Ohmni Estimate - Pricing Autocomplete Index
+Drop into: backend/services/pricing_index.py
+
+In-memory prefix index over the pricing catalog for the search-as-you-type box.
+Tokens from name, size, category and description are kept in one sorted array;
+a prefix lookup is a bisect into that array plus a walk over the matching
+posting lists, so keystrokes never hit the database.
+
+Build once at startup, and rebuild whenever the catalog is re-imported:
+    from backend.services.pricing_index import pricing_index
+    pricing_index.rebuild()
+
+Other workers notice the change on their own: every CATALOG_CHECK_SECONDS
+`current` compares the active catalog's (max updated_at, row count) with the
+one the index was built from and rebuilds when it differs.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from bisect import bisect_left
+import heapq
+import logging
+import re
+import threading
+import time
+
+from backend.extensions import db
+from backend.models.estimate_models import PricingItem
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Field weights: a hit in the item name beats a hit in its description
+FIELD_WEIGHTS = {
+    'name': 4,
+    'size': 3,
+    'category': 2,
+    'description': 1,
+}
+EXACT_TOKEN_BONUS = 2  # multiplier when a query term equals the token
+
+# How often `current` checks whether another worker changed the catalog
+CATALOG_CHECK_SECONDS = 30
+
+# Keep size notation intact: "3/4", "#12", "500", "1-1/2"
+TOKEN_RE = re.compile(r"[a-z0-9#/.\-]+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase tokens for indexing and querying."""
+    if not text:
+        return []
+    return TOKEN_RE.findall(text.lower().replace('_', ' '))
+
+
+class CatalogEntry(NamedTuple):
+    """Lightweight copy of the PricingItem columns autocomplete returns."""
+    id: str
+    category: str
+    subcategory: Optional[str]
+    name: str
+    description: Optional[str]
+    size: Optional[str]
+    material_cost: float
+    labor_hours: float
+    unit_type: str
+
+    def to_dict(self) -> Dict:
+        return self._asdict()
+
+    @classmethod
+    def from_row(cls, row) -> 'CatalogEntry':
+        """Snapshot a PricingItem (or a row selected with ENTRY_COLUMNS)."""
+        return cls(
+            id=row.id, category=row.category, subcategory=row.subcategory, name=row.name,
+            description=row.description, size=row.size,
+            material_cost=float(row.material_cost) if row.material_cost else 0,
+            labor_hours=float(row.labor_hours) if row.labor_hours else 0,
+            unit_type=row.unit_type
+        )
+
+
+ENTRY_COLUMNS = (
+    PricingItem.id, PricingItem.category, PricingItem.subcategory, PricingItem.name,
+    PricingItem.description, PricingItem.size, PricingItem.material_cost,
+    PricingItem.labor_hours, PricingItem.unit_type
+)
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+class PricingAutocompleteIndex:
+    """
+    Immutable prefix index over a list of CatalogEntry rows.
+
+    tokens:   sorted unique tokens
+    postings: parallel list; postings[i] is a tuple of (entry_idx, weight)
+    """
+
+    def __init__(self, entries: Sequence[CatalogEntry], version: int = 0):
+        self.entries: Tuple[CatalogEntry, ...] = tuple(entries)
+        self.version = version
+
+        weights: Dict[str, Dict[int, int]] = {}
+        for idx, entry in enumerate(self.entries):
+            for field, weight in FIELD_WEIGHTS.items():
+                for token in tokenize(getattr(entry, field)):
+                    per_token = weights.setdefault(token, {})
+                    if per_token.get(idx, 0) < weight:
+                        per_token[idx] = weight
+
+        self.tokens: List[str] = sorted(weights)
+        self.postings: List[Tuple[Tuple[int, int], ...]] = [
+            tuple(weights[t].items()) for t in self.tokens
+        ]
+        self._name_len = tuple(len(e.name) for e in self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _term_scores(self, term: str) -> Dict[int, int]:
+        """Best weighted hit per entry for one query term (treated as a prefix)."""
+        scores: Dict[int, int] = {}
+        tokens = self.tokens
+        i = bisect_left(tokens, term)
+        while i < len(tokens) and tokens[i].startswith(term):
+            bonus = EXACT_TOKEN_BONUS if tokens[i] == term else 1
+            for idx, weight in self.postings[i]:
+                score = weight * bonus
+                if scores.get(idx, 0) < score:
+                    scores[idx] = score
+            i += 1
+        return scores
+
+    def search(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        limit: int = 10
+    ) -> List[Tuple[CatalogEntry, int]]:
+        """
+        Top-k entries matching every query term as a token prefix.
+        Returns (entry, score) pairs, best first.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+
+        # Rarest-looking (longest) terms first so the candidate set shrinks fast
+        terms.sort(key=len, reverse=True)
+        totals: Optional[Dict[int, int]] = None
+        for term in terms:
+            scores = self._term_scores(term)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {idx: s + scores[idx] for idx, s in totals.items() if idx in scores}
+            if not totals:
+                return []
+
+        entries = self.entries
+        if category:
+            totals = {idx: s for idx, s in totals.items() if entries[idx].category == category}
+
+        name_len = self._name_len
+        best = heapq.nsmallest(
+            limit, totals.items(),
+            key=lambda kv: (-kv[1], name_len[kv[0]], entries[kv[0]].name)
+        )
+        return [(entries[idx], score) for idx, score in best]
+
+
+# =============================================================================
+# PROCESS-WIDE HOLDER
+# =============================================================================
+
+class PricingIndexHolder:
+    """
+    Owns the current index and swaps in rebuilt ones atomically.
+    Readers grab `current` once per request and never see a half-built index.
+    """
+
+    def __init__(self, check_seconds: float = CATALOG_CHECK_SECONDS):
+        self.check_seconds = check_seconds
+        self._index: Optional[PricingAutocompleteIndex] = None
+        self._lock = threading.Lock()
+        self._version = 0
+        self._signature: Optional[Tuple] = None
+        self._checked_at = 0.0
+
+    @property
+    def version(self) -> int:
+        """Catalog version; bumps on every rebuild."""
+        return self._version
+
+    @property
+    def current(self) -> PricingAutocompleteIndex:
+        index = self._index
+        if index is None:
+            index = self.rebuild()
+        elif time.monotonic() - self._checked_at > self.check_seconds:
+            index = self._check()
+        return index
+
+    @staticmethod
+    def _catalog_signature() -> Tuple:
+        """Changes whenever an active row is added, updated or deactivated."""
+        return tuple(db.session.query(
+            db.func.max(PricingItem.updated_at), db.func.count(PricingItem.id)
+        ).filter(PricingItem.is_active == True).one())
+
+    def _check(self) -> PricingAutocompleteIndex:
+        # One thread checks; the others keep serving the current index meanwhile
+        if not self._lock.acquire(blocking=False):
+            return self._index
+        try:
+            self._checked_at = time.monotonic()
+            signature = self._catalog_signature()
+        except Exception as e:
+            logger.warning(f"Pricing catalog version check failed: {e}")
+            return self._index
+        finally:
+            self._lock.release()
+        if signature != self._signature:
+            logger.info("Pricing catalog changed in another worker; rebuilding index")
+            return self.rebuild()
+        return self._index
+
+    def rebuild(self) -> PricingAutocompleteIndex:
+        """Load active pricing items and replace the index."""
+        start = time.perf_counter()
+        signature = self._catalog_signature()
+        rows = db.session.query(*ENTRY_COLUMNS).filter(PricingItem.is_active == True).all()
+        entries = [CatalogEntry.from_row(r) for r in rows]
+
+        with self._lock:
+            self._version += 1
+            index = PricingAutocompleteIndex(entries, version=self._version)
+            self._index = index
+            self._signature = signature
+            self._checked_at = time.monotonic()
+
+        logger.info(
+            f"Built pricing index v{index.version}: {len(index)} items, "
+            f"{len(index.tokens)} tokens in {(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+        return index
+
+    def invalidate(self):
+        """Drop the index; the next read rebuilds it."""
+        with self._lock:
+            self._index = None
+            self._version += 1
+
+
+pricing_index = PricingIndexHolder()
+
+
+def init_pricing_index(app):
+    """
+    Build the index at startup. Call from the app factory after db.init_app:
+        init_pricing_index(app)
+    """
+    with app.app_context():
+        try:
+            pricing_index.rebuild()
+        except Exception as e:
+            # Tables may not exist yet (fresh install before migrations)
+            logger.warning(f"Pricing index not built at startup: {e}")
@@ -0,0 +1,283 @@
+"""
+Ohmni Estimate - Layered Pricing Resolver
+Drop into: backend/services/pricing_layers.py
+
+Effective price of a catalog item, resolved bottom to top:
+
+    base catalog -> region overlay -> project_type overlay -> estimate override
+
+Overlays (PricingOverlay rows) adjust material as base × multiplier + adder and
+labor hours as base × multiplier. Within a layer an item-specific row beats a
+category row, which beats a layer-wide row. Estimate overrides come from
+estimate_metadata['price_overrides'] and replace the price outright.
+
+The first three layers are flattened into one dict per
+(region, project_type, catalog_version) and memoized, so a lookup is a single
+dict access. Estimate overrides are applied on top at lookup time.
+
+invalidate() reloads overlays in the worker that edited them; other workers
+compare the overlay table's (max updated_at, row count) every
+OVERLAY_CHECK_SECONDS and reload when it changed.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Tuple
+import logging
+import threading
+import time
+
+from backend.extensions import db
+from backend.models.estimate_models import PricingOverlay
+from backend.services.pricing_index import CatalogEntry, pricing_index
+from backend.services.quote_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+FLATTENED_CACHE_SIZE = 32
+OVERLAY_CHECK_SECONDS = 30
+
+
+class Adjustment(NamedTuple):
+    material_multiplier: float = 1.0
+    material_adder: float = 0.0
+    labor_multiplier: float = 1.0
+
+    def apply(self, material_cost: float, labor_hours: float) -> Tuple[float, float]:
+        return (
+            material_cost * self.material_multiplier + self.material_adder,
+            labor_hours * self.labor_multiplier
+        )
+
+
+class ResolvedPrice(NamedTuple):
+    pricing_item_id: str
+    material_cost: float
+    labor_hours: float
+    layers: Tuple[str, ...]  # layers that changed the base price, bottom to top
+
+    def to_dict(self) -> Dict:
+        data = self._asdict()
+        data['layers'] = list(self.layers)
+        return data
+
+
+class LayerOverlay:
+    """Compiled overlay rows for one (layer, layer_key)."""
+
+    def __init__(self):
+        self.items: Dict[str, Adjustment] = {}
+        self.categories: Dict[str, Adjustment] = {}
+        self.default: Optional[Adjustment] = None
+        self.labor_rate: Optional[float] = None
+
+    def adjustment(self, entry: CatalogEntry) -> Optional[Adjustment]:
+        return self.items.get(entry.id) or self.categories.get(entry.category) or self.default
+
+
+class FlattenedPrices:
+    """Base catalog with region and project_type overlays already applied."""
+
+    def __init__(
+        self,
+        entries: Tuple[CatalogEntry, ...],
+        overlays: List[Tuple[str, Optional[LayerOverlay]]],
+        catalog_version: int
+    ):
+        self.catalog_version = catalog_version
+        self.entries: Dict[str, CatalogEntry] = {}
+        self.prices: Dict[str, ResolvedPrice] = {}
+        # (category, subcategory, size) -> pricing item id, for feeder lookups
+        self.by_spec: Dict[Tuple, str] = {}
+        self.labor_rate: Optional[float] = None
+
+        active = [(name, overlay) for name, overlay in overlays if overlay]
+        for _, overlay in active:
+            if overlay.labor_rate is not None:
+                self.labor_rate = overlay.labor_rate
+
+        for entry in entries:
+            material_cost, labor_hours = entry.material_cost, entry.labor_hours
+            applied = []
+            for name, overlay in active:
+                adjustment = overlay.adjustment(entry)
+                if adjustment:
+                    material_cost, labor_hours = adjustment.apply(material_cost, labor_hours)
+                    applied.append(name)
+            self.entries[entry.id] = entry
+            self.prices[entry.id] = ResolvedPrice(entry.id, material_cost, labor_hours, tuple(applied))
+            self.by_spec.setdefault((entry.category, entry.subcategory, entry.size), entry.id)
+
+    def find(self, category: str, subcategory: Optional[str], size: Optional[str]) -> Optional[CatalogEntry]:
+        item_id = self.by_spec.get((category, subcategory, size))
+        return self.entries.get(item_id) if item_id else None
+
+
+class PricingLayerResolver:
+    """Process-wide resolver; overlays load lazily and reload on invalidate()."""
+
+    def __init__(self, cache_size: int = FLATTENED_CACHE_SIZE, check_seconds: float = OVERLAY_CHECK_SECONDS):
+        self.check_seconds = check_seconds
+        self._overlays: Optional[Dict[Tuple[str, str], LayerOverlay]] = None
+        self._overlay_version = 0
+        self._overlay_signature: Optional[Tuple] = None
+        self._checked_at = 0.0
+        self._flattened = LRUCache(cache_size)
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # OVERLAYS
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _overlays_signature() -> Tuple:
+        """Changes whenever an overlay row is added, edited, deactivated or deleted."""
+        return tuple(db.session.query(
+            db.func.max(PricingOverlay.updated_at), db.func.count(PricingOverlay.id)
+        ).one())
+
+    def _check(self):
+        # One thread checks; the others keep using the loaded overlays meanwhile
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._checked_at = time.monotonic()
+            changed = self._overlays_signature() != self._overlay_signature
+        except Exception as e:
+            logger.warning(f"Pricing overlay version check failed: {e}")
+            return
+        finally:
+            self._lock.release()
+        if changed:
+            logger.info("Pricing overlays changed in another worker; reloading")
+            self.invalidate()
+
+    def _load_overlays(self) -> Dict[Tuple[str, str], LayerOverlay]:
+        if self._overlays is not None and time.monotonic() - self._checked_at > self.check_seconds:
+            self._check()
+        overlays = self._overlays
+        if overlays is None:
+            with self._lock:
+                overlays = self._overlays
+                if overlays is None:
+                    signature = self._overlays_signature()
+                    overlays = {}
+                    for row in PricingOverlay.query.filter_by(is_active=True).all():
+                        overlay = overlays.setdefault((row.layer, row.layer_key), LayerOverlay())
+                        adjustment = Adjustment(
+                            float(row.material_multiplier) if row.material_multiplier is not None else 1.0,
+                            float(row.material_adder) if row.material_adder else 0.0,
+                            float(row.labor_multiplier) if row.labor_multiplier is not None else 1.0
+                        )
+                        if row.pricing_item_id:
+                            overlay.items[row.pricing_item_id] = adjustment
+                        elif row.category:
+                            overlay.categories[row.category] = adjustment
+                        else:
+                            overlay.default = adjustment
+                            if row.labor_rate is not None:
+                                overlay.labor_rate = float(row.labor_rate)
+                    self._overlays = overlays
+                    self._overlay_signature = signature
+                    self._checked_at = time.monotonic()
+                    logger.info(f"Loaded {len(overlays)} pricing overlay layers")
+        return overlays
+
+    def _layer_overlays(self, region: Optional[str], project_type: Optional[str]):
+        overlays = self._load_overlays()
+        return [
+            ('region', overlays.get(('region', region)) if region else None),
+            ('project_type', overlays.get(('project_type', project_type)) if project_type else None),
+        ]
+
+    def invalidate(self):
+        """Reload overlays and drop flattened views (call after editing overlays)."""
+        with self._lock:
+            self._overlays = None
+            self._overlay_version += 1
+        self._flattened.clear()
+
+    # -------------------------------------------------------------------------
+    # RESOLUTION
+    # -------------------------------------------------------------------------
+
+    def flattened(self, region: Optional[str] = None, project_type: Optional[str] = None) -> FlattenedPrices:
+        index = pricing_index.current
+        self._load_overlays()  # picks up overlay edits from other workers first
+        key = (region, project_type, index.version, self._overlay_version)
+        view = self._flattened.get(key)
+        if view is None:
+            view = FlattenedPrices(
+                index.entries, self._layer_overlays(region, project_type), index.version
+            )
+            self._flattened.put(key, view)
+        return view
+
+    def resolve(
+        self,
+        pricing_item_id: str,
+        region: Optional[str] = None,
+        project_type: Optional[str] = None,
+        overrides: Optional[Dict[str, Dict]] = None,
+        base: Optional[Tuple[float, float]] = None
+    ) -> Optional[ResolvedPrice]:
+        """
+        Effective price for one pricing item.
+
+        base: explicit (material_cost, labor_hours) to layer over instead of the
+              live catalog price, e.g. a past price book. Overlays still apply
+              when the item is in the current catalog.
+        Returns None when there is no base price (item not in the active catalog).
+        """
+        if base is None:
+            price = self.flattened(region, project_type).prices.get(pricing_item_id)
+        else:
+            price = self._layer_over(pricing_item_id, base, region, project_type)
+
+        if price and overrides and pricing_item_id in overrides:
+            override = overrides[pricing_item_id]
+            price = ResolvedPrice(
+                pricing_item_id,
+                float(override.get('material_cost', price.material_cost)),
+                float(override.get('labor_hours', price.labor_hours)),
+                price.layers + ('estimate',)
+            )
+        return price
+
+    def resolve_for_estimate(
+        self,
+        estimate,
+        pricing_item_id: str,
+        base: Optional[Tuple[float, float]] = None
+    ) -> Optional[ResolvedPrice]:
+        return self.resolve(
+            pricing_item_id, estimate.region, estimate.project_type,
+            estimate_overrides(estimate), base=base
+        )
+
+    def _layer_over(
+        self,
+        pricing_item_id: str,
+        base: Tuple[float, float],
+        region: Optional[str],
+        project_type: Optional[str]
+    ) -> ResolvedPrice:
+        material_cost, labor_hours = base
+        applied = []
+        entry = self.flattened().entries.get(pricing_item_id)
+        if entry is not None:
+            for name, overlay in self._layer_overlays(region, project_type):
+                adjustment = overlay.adjustment(entry) if overlay else None
+                if adjustment:
+                    material_cost, labor_hours = adjustment.apply(material_cost, labor_hours)
+                    applied.append(name)
+        return ResolvedPrice(pricing_item_id, material_cost, labor_hours, tuple(applied))
+
+    def labor_rate(self, region: Optional[str] = None, project_type: Optional[str] = None) -> Optional[float]:
+        """Layer-wide labor rate (project_type beats region), or None."""
+        return self.flattened(region, project_type).labor_rate
+
+
+def estimate_overrides(estimate) -> Dict[str, Dict]:
+    return (estimate.estimate_metadata or {}).get('price_overrides') or {}
+
+
+pricing_layers = PricingLayerResolver()
@@ -0,0 +1,198 @@
+"""
+Ohmni Estimate - Pricing Similarity Matcher
+Drop into: backend/services/pricing_matcher.py
+
+Offline fuzzy matcher for free-text takeoff names ("dup recpt", "2x4 troffer",
+"quad outlet") against the pricing catalog. No network model: each item is a
+TF-IDF vector over character trigrams plus whole words, and queries run
+against an inverted index of those features.
+
+Search is approximate: only the heaviest query features (covering most of the
+query's weight) are used to gather candidates, which are then rescored with
+the full cosine similarity.
+
+The matcher is built from the autocomplete index's catalog snapshot, so it is
+rebuilt automatically whenever the pricing index is.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+import math
+import threading
+
+from backend.services.pricing_index import CatalogEntry, pricing_index, tokenize
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+NGRAM = 3
+WORD_WEIGHT = 2.0           # whole-word features count double vs trigrams
+CANDIDATE_MASS = 0.9        # fraction of query weight used to gather candidates
+MAX_CANDIDATES = 200
+DEFAULT_MIN_SCORE = 0.25
+
+# Trade shorthand seen in takeoffs -> catalog wording
+ABBREVIATIONS = {
+    'dup': 'duplex', 'dplx': 'duplex',
+    'recpt': 'receptacle', 'recep': 'receptacle', 'rcpt': 'receptacle',
+    'recept': 'receptacle', 'rec': 'receptacle',
+    'outlet': 'receptacle outlet',
+    'quad': 'double duplex',
+    'gfci': 'gfi', 'sw': 'switch', 'sp': 'single pole', '3way': 'three way',
+    'troffer': 'led troffer', 'emer': 'emergency', 'em': 'emergency',
+    'xfmr': 'transformer', 'pnl': 'panelboard', 'panel': 'panel panelboard',
+    'disc': 'disconnect', 'ltg': 'lighting', 'fa': 'fire alarm',
+    'occ': 'motion sensor', 'mh': 'metal halide',
+}
+
+def normalize(text: Optional[str]) -> List[str]:
+    """Lowercase words with trade abbreviations expanded."""
+    words = []
+    for word in tokenize(text):
+        words.extend(ABBREVIATIONS.get(word, word).split())
+    return words
+
+
+def features(text: Optional[str]) -> Dict[str, float]:
+    """Raw term frequencies: padded character trigrams plus whole words."""
+    counts: Dict[str, float] = {}
+    for word in normalize(text):
+        counts['w:' + word] = counts.get('w:' + word, 0) + WORD_WEIGHT
+        padded = f" {word} "
+        for i in range(len(padded) - NGRAM + 1):
+            gram = padded[i:i + NGRAM]
+            counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+def _entry_text(entry: CatalogEntry) -> str:
+    return ' '.join(p for p in (entry.name, entry.size, entry.description) if p)
+
+
+# =============================================================================
+# MATCHER
+# =============================================================================
+
+class PricingMatcher:
+    """
+    Inverted index of L2-normalized TF-IDF vectors.
+
+    postings[feature] is a list of (entry_idx, weight); vectors[entry_idx] is
+    the full sparse vector used to rescore candidates.
+    """
+
+    def __init__(self, entries: Sequence[CatalogEntry], version: int = 0):
+        self.entries: Tuple[CatalogEntry, ...] = tuple(entries)
+        self.version = version
+
+        raw = [features(_entry_text(e)) for e in self.entries]
+
+        doc_freq: Dict[str, int] = {}
+        for vec in raw:
+            for feat in vec:
+                doc_freq[feat] = doc_freq.get(feat, 0) + 1
+
+        n_docs = max(len(raw), 1)
+        self.idf: Dict[str, float] = {
+            feat: math.log((1 + n_docs) / (1 + df)) + 1 for feat, df in doc_freq.items()
+        }
+
+        self.vectors: List[Dict[str, float]] = []
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        for idx, vec in enumerate(raw):
+            weighted = self._weigh(vec)
+            self.vectors.append(weighted)
+            for feat, w in weighted.items():
+                self.postings.setdefault(feat, []).append((idx, w))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _weigh(self, counts: Dict[str, float]) -> Dict[str, float]:
+        """TF-IDF weight and L2-normalize; unknown features are dropped."""
+        idf = self.idf
+        vec = {f: (1 + math.log(tf)) * idf[f] for f, tf in counts.items() if f in idf}
+        norm = math.sqrt(sum(w * w for w in vec.values()))
+        if not norm:
+            return {}
+        return {f: w / norm for f, w in vec.items()}
+
+    def query(
+        self,
+        text: str,
+        limit: int = 5,
+        category: Optional[str] = None,
+        min_score: float = DEFAULT_MIN_SCORE
+    ) -> List[Tuple[CatalogEntry, float]]:
+        """Ranked (entry, cosine similarity) candidates for one free-text name."""
+        qvec = self._weigh(features(text))
+        if not qvec:
+            return []
+
+        # Gather candidates from the heaviest query features only
+        ordered = sorted(qvec.items(), key=lambda kv: kv[1], reverse=True)
+        total = sum(w * w for _, w in ordered)
+        covered = 0.0
+        partial: Dict[int, float] = {}
+        for feat, qw in ordered:
+            for idx, dw in self.postings.get(feat, ()):
+                partial[idx] = partial.get(idx, 0.0) + qw * dw
+            covered += qw * qw
+            if covered >= CANDIDATE_MASS * total:
+                break
+
+        # Filter before truncating, so other categories can't crowd the cap
+        if category:
+            partial = {idx: s for idx, s in partial.items() if self.entries[idx].category == category}
+        candidates = sorted(partial, key=partial.get, reverse=True)[:MAX_CANDIDATES]
+
+        # Rescore with the full cosine
+        scored = []
+        for idx in candidates:
+            dvec = self.vectors[idx]
+            score = sum(qw * dvec.get(f, 0.0) for f, qw in qvec.items())
+            if score >= min_score:
+                scored.append((score, idx))
+
+        scored.sort(key=lambda s: (-s[0], len(self.entries[s[1]].name)))
+        return [(self.entries[idx], round(score, 4)) for score, idx in scored[:limit]]
+
+    def query_many(
+        self,
+        texts: Sequence[str],
+        limit: int = 3,
+        category: Optional[str] = None,
+        min_score: float = DEFAULT_MIN_SCORE
+    ) -> List[List[Tuple[CatalogEntry, float]]]:
+        """Batch query; repeated names (common in takeoffs) are resolved once."""
+        seen: Dict[str, List[Tuple[CatalogEntry, float]]] = {}
+        results = []
+        for text in texts:
+            key = ' '.join(normalize(text))
+            if key not in seen:
+                seen[key] = self.query(text, limit=limit, category=category, min_score=min_score)
+            results.append(seen[key])
+        return results
+
+
+# =============================================================================
+# PROCESS-WIDE ACCESSOR
+# =============================================================================
+
+_lock = threading.Lock()
+_matcher: Optional[PricingMatcher] = None
+
+
+def get_pricing_matcher() -> PricingMatcher:
+    """Matcher for the current catalog version (rebuilt lazily after imports)."""
+    global _matcher
+    index = pricing_index.current
+    matcher = _matcher
+    if matcher is None or matcher.version != index.version:
+        with _lock:
+            matcher = _matcher
+            if matcher is None or matcher.version != index.version:
+                matcher = PricingMatcher(index.entries, version=index.version)
+                _matcher = matcher
+    return matcher
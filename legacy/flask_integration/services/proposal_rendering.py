@@ -0,0 +1,347 @@
+"""
+Ohmni Estimate - Background Proposal Rendering
+Drop into: backend/services/proposal_rendering.py
+
+Proposals are rendered off the request thread:
+
+1. EstimationService.generate_proposal() creates a pending Proposal row and
+   queues it here; the route returns 202 and the client polls the proposal.
+2. A small worker pool renders templates/proposal.html from the estimate's
+   category rollups (one grouped query, no line items loaded), so a 5k-line
+   estimate renders as fast as a 50-line one.
+3. The Jinja environment is built once per process; compiled templates stay
+   in its cache and, when PROPOSAL_TEMPLATE_CACHE_DIR is set, in a bytecode
+   cache shared across workers and restarts.
+4. Output goes to ProposalStorage (local disk by default). Proposal.pdf_url
+   holds the storage URL ("local://<key>"), resolved by storage.path().
+   PDFs need weasyprint; without it the HTML document is stored instead.
+
+Each rendered proposal records the estimate revision it was built from, so
+generate_proposal() reuses the latest proposal until the estimate changes.
+
+Configure from the app factory (optional, defaults shown):
+    PROPOSAL_STORAGE_DIR = <instance_path>/proposals
+    PROPOSAL_TEMPLATE_CACHE_DIR = None
+    init_proposal_rendering(app)
+"""
+
+from typing import Dict, List, Optional, Sequence
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import hashlib
+import logging
+import os
+import threading
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+try:
+    from weasyprint import HTML
+except ImportError:
+    HTML = None
+
+from backend.extensions import db
+from backend.models.estimate_models import Estimate, EstimateLineItem, Proposal
+from backend.services.estimate_serializers import project_category_rollups
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+PROPOSAL_WORKERS = 2
+# A pending/rendering proposal untouched this long lost its job (restart, other worker)
+RENDER_TIMEOUT_SECONDS = 10 * 60
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates')
+PROPOSAL_TEMPLATE = 'proposal.html'
+TEMPLATE_CACHE_SIZE = 50
+
+# Standard exclusions (ELECTRICAL_BID_LOGIC.md, PROPOSAL GENERATION)
+STANDARD_EXCLUSIONS = [
+    'Permit or bond fees',
+    'Dumpster fees',
+    'Excess utility company charges',
+    'Spoil removal',
+    'Low voltage cabling/equipment (except fire alarm)',
+    'Site sleeving',
+    'Temperature control wiring/starters',
+    'Coring, sawcutting, patching',
+    'Concrete encasements/pads',
+    'Premium time',
+    'Code/inspector required additions',
+    'Heating/cooling units',
+]
+
+# Estimate columns that show up on (or change the numbers of) a proposal
+_REVISION_COLUMNS = (
+    Estimate.project_name, Estimate.project_number, Estimate.project_location,
+    Estimate.gc_name, Estimate.contact_name, Estimate.square_footage,
+    Estimate.labor_rate, Estimate.material_tax_rate, Estimate.overhead_profit_rate,
+    Estimate.final_bid, Estimate.price_per_sqft,
+)
+
+
+# =============================================================================
+# STORAGE
+# =============================================================================
+
+class ProposalStorage(ABC):
+    """Where rendered documents live. URLs are what gets stored in pdf_url."""
+
+    @abstractmethod
+    def save(self, key: str, data: bytes) -> str:
+        """Store the document and return its URL."""
+        pass
+
+    @abstractmethod
+    def path(self, url: str) -> Optional[str]:
+        """Local file for a URL returned by save(), or None if it isn't ours/missing."""
+        pass
+
+
+class LocalDiskStorage(ProposalStorage):
+    """Files under `root`; URLs look like local://<estimate_id>/<proposal>.pdf"""
+
+    SCHEME = 'local://'
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+
+    def save(self, key: str, data: bytes) -> str:
+        target = self._resolve(key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        # Write then rename so readers never see a partial file
+        tmp = f"{target}.{threading.get_ident()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, target)
+        return f"{self.SCHEME}{key}"
+
+    def path(self, url: str) -> Optional[str]:
+        if not url or not url.startswith(self.SCHEME):
+            return None
+        try:
+            target = self._resolve(url[len(self.SCHEME):])
+        except ValueError:
+            return None
+        return target if os.path.isfile(target) else None
+
+    def _resolve(self, key: str) -> str:
+        target = os.path.abspath(os.path.join(self.root, key))
+        if os.path.commonpath([self.root, target]) != self.root:
+            raise ValueError(f"Storage key escapes storage root: {key}")
+        return target
+
+
+_storage: Optional[ProposalStorage] = None
+_storage_lock = threading.Lock()
+
+
+def get_storage(app) -> ProposalStorage:
+    global _storage
+    with _storage_lock:
+        if _storage is None:
+            root = app.config.get('PROPOSAL_STORAGE_DIR') or os.path.join(app.instance_path, 'proposals')
+            _storage = LocalDiskStorage(root)
+        return _storage
+
+
+def set_storage(storage: ProposalStorage):
+    """Swap the storage backend (e.g. an object store implementation)."""
+    global _storage
+    with _storage_lock:
+        _storage = storage
+
+
+# =============================================================================
+# TEMPLATES
+# =============================================================================
+
+def _money(value) -> str:
+    return f"${float(value or 0):,.2f}"
+
+
+def _build_environment(bytecode_dir: Optional[str] = None) -> Environment:
+    bytecode_cache = None
+    if bytecode_dir:
+        os.makedirs(bytecode_dir, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(bytecode_dir)
+    env = Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=select_autoescape(['html']),
+        cache_size=TEMPLATE_CACHE_SIZE,
+        auto_reload=False,
+        bytecode_cache=bytecode_cache,
+    )
+    env.filters['money'] = _money
+    return env
+
+
+_env = _build_environment()
+
+
+def category_label(category: str) -> str:
+    return category.replace('_', ' ').title()
+
+
+def _sections(rollups: Dict[str, Dict], category_order: Sequence[str]) -> List[Dict]:
+    rank = {cat: i for i, cat in enumerate(category_order)}
+    ordered = sorted(rollups, key=lambda cat: (rank.get(cat, len(rank)), cat))
+    return [
+        {
+            'category': cat,
+            'label': category_label(cat),
+            'total': rollups[cat]['total'],
+            'item_count': rollups[cat]['item_count'],
+        }
+        for cat in ordered
+    ]
+
+
+def default_scope_of_work(estimate: Estimate, sections: List[Dict]) -> str:
+    labels = ', '.join(s['label'].lower() for s in sections) or 'electrical work'
+    return (
+        f"Furnish and install all labor and material for the electrical scope of "
+        f"{estimate.project_name}, including {labels}, per plans and specifications."
+    )
+
+
+def render_proposal_html(estimate: Estimate, proposal: Proposal, sections: List[Dict],
+                         scope_of_work: str, exclusions: List[str]) -> str:
+    template = _env.get_template(PROPOSAL_TEMPLATE)
+    return template.render(
+        estimate=estimate,
+        proposal=proposal,
+        sections=sections,
+        scope_of_work=scope_of_work,
+        exclusions=exclusions,
+        generated_on=datetime.utcnow().strftime('%B %d, %Y'),
+        valid_until=proposal.valid_until.strftime('%B %d, %Y') if proposal.valid_until else None,
+    )
+
+
+# =============================================================================
+# REVISIONS
+# =============================================================================
+
+def estimate_revision(estimate_id: str) -> Optional[str]:
+    """
+    Fingerprint of everything a proposal is built from: header columns,
+    totals and a line item aggregate. Two queries, no rows loaded.
+    """
+    header = db.session.query(*_REVISION_COLUMNS).filter(Estimate.id == estimate_id).first()
+    if header is None:
+        return None
+    items = db.session.query(
+        db.func.count(EstimateLineItem.id),
+        db.func.max(EstimateLineItem.updated_at),
+        db.func.sum(EstimateLineItem.total_cost),
+        db.func.sum(EstimateLineItem.quantity)
+    ).filter(EstimateLineItem.estimate_id == estimate_id).one()
+
+    digest = hashlib.sha1()
+    for value in tuple(header) + tuple(items):
+        digest.update(repr(value).encode())
+        digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+# =============================================================================
+# WORKER POOL
+# =============================================================================
+
+_executor = ThreadPoolExecutor(max_workers=PROPOSAL_WORKERS, thread_name_prefix='proposal-render')
+_in_flight = set()
+_in_flight_lock = threading.Lock()
+
+
+def queue_render(app, proposal_id: str, category_order: Sequence[str]) -> bool:
+    """
+    Render a pending proposal in the background. `app` is the Flask app (use
+    current_app._get_current_object() inside a request). Returns False if the
+    proposal is already queued.
+    """
+    with _in_flight_lock:
+        if proposal_id in _in_flight:
+            return False
+        _in_flight.add(proposal_id)
+    _executor.submit(_run_render, app, proposal_id, tuple(category_order))
+    return True
+
+
+def render_stalled(proposal: Proposal, timeout_seconds: float = RENDER_TIMEOUT_SECONDS) -> bool:
+    """True if a pending/rendering proposal has not progressed within the timeout."""
+    if proposal.render_status not in ('pending', 'rendering'):
+        return False
+    # updated_at moves when the render starts; created_at covers older rows
+    touched = proposal.updated_at or proposal.created_at
+    return touched is not None and datetime.utcnow() - touched > timedelta(seconds=timeout_seconds)
+
+
+def _run_render(app, proposal_id: str, category_order: Sequence[str]):
+    with app.app_context():
+        try:
+            _render(app, proposal_id, category_order)
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Proposal render {proposal_id} failed: {e}")
+            Proposal.query.filter_by(id=proposal_id).update(
+                {'render_status': 'failed', 'render_error': str(e)}, synchronize_session=False
+            )
+            db.session.commit()
+        finally:
+            with _in_flight_lock:
+                _in_flight.discard(proposal_id)
+            db.session.remove()
+
+
+def _render(app, proposal_id: str, category_order: Sequence[str]):
+    proposal = Proposal.query.get(proposal_id)
+    if proposal is None:
+        return
+    estimate = Estimate.query.get(proposal.estimate_id)
+    if estimate is None:
+        raise ValueError(f"Estimate {proposal.estimate_id} not found")
+
+    proposal.render_status = 'rendering'
+    db.session.commit()
+
+    # Revision first: if the estimate changes mid-render the next request re-renders
+    revision = estimate_revision(estimate.id)
+    sections = _sections(project_category_rollups([estimate.id]).get(estimate.id, {}), category_order)
+    scope_of_work = proposal.scope_of_work or default_scope_of_work(estimate, sections)
+    exclusions = proposal.exclusions.splitlines() if proposal.exclusions else STANDARD_EXCLUSIONS
+    proposal.valid_until = datetime.utcnow() + timedelta(days=proposal.valid_days or 30)
+
+    html = render_proposal_html(estimate, proposal, sections, scope_of_work, exclusions)
+    storage = get_storage(app)
+    key = f"{estimate.id}/{proposal.id}-v{proposal.version}"
+    url = storage.save(f"{key}.html", html.encode('utf-8'))
+    if HTML is not None:
+        url = storage.save(f"{key}.pdf", HTML(string=html, base_url=TEMPLATE_DIR).write_pdf())
+
+    proposal.content = html
+    proposal.scope_of_work = scope_of_work
+    proposal.exclusions = '\n'.join(exclusions)
+    proposal.pdf_url = url
+    proposal.source_revision = revision
+    proposal.render_status = 'ready'
+    proposal.render_error = None
+    proposal.rendered_at = datetime.utcnow()
+    db.session.commit()
+    logger.info(f"Rendered proposal {proposal.id} v{proposal.version} for estimate {estimate.id}")
+
+
+def init_proposal_rendering(app):
+    """
+    Configure storage and the template bytecode cache. Call from the app factory:
+        init_proposal_rendering(app)
+    """
+    global _env
+    get_storage(app)
+    cache_dir = app.config.get('PROPOSAL_TEMPLATE_CACHE_DIR')
+    if cache_dir:
+        _env = _build_environment(cache_dir)
@@ -0,0 +1,173 @@
+"""
+Ohmni Estimate - Quick Quote Cache
+Drop into: backend/services/quote_cache.py
+
+Bounded LRU caches for `EstimationService.quick_quote`:
+
+- matches: normalized item name -> resolved catalog entry (or a miss)
+- quotes:  (normalized item list, rates) -> full quote result
+
+Both are dropped whenever the pricing catalog version changes (read through
+pricing_index.current, so imports in other workers are noticed too), and a
+result computed against an older version is not stored, so a re-import never
+serves stale prices.
+"""
+
+from typing import Dict, Hashable, List, Optional, Tuple
+from collections import OrderedDict
+import copy
+import re
+import threading
+
+from backend.services.pricing_index import pricing_index
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+MATCH_CACHE_SIZE = 4096
+QUOTE_CACHE_SIZE = 512
+
+# Cached "no pricing item found" result (distinct from a cache miss)
+NO_MATCH = object()
+
+_WS_RE = re.compile(r"\s+")
+
+
+def normalize_name(name: str) -> str:
+    """Case/whitespace-insensitive key for an item name."""
+    return _WS_RE.sub(' ', (name or '').strip().lower())
+
+
+# =============================================================================
+# LRU CACHE
+# =============================================================================
+
+class LRUCache:
+    """Thread-safe bounded LRU with hit/miss counters."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# =============================================================================
+# QUICK QUOTE CACHE
+# =============================================================================
+
+class QuickQuoteCache:
+    """Match + quote caches tied to the pricing catalog version."""
+
+    def __init__(self, match_size: int = MATCH_CACHE_SIZE, quote_size: int = QUOTE_CACHE_SIZE):
+        self.matches = LRUCache(match_size)
+        self.quotes = LRUCache(quote_size)
+        self._version = pricing_index.version
+        self._lock = threading.Lock()
+        self.invalidations = 0
+
+    def _sync_version(self):
+        # .current runs the cross-worker catalog check; .version alone doesn't
+        version = pricing_index.current.version
+        if version != self._version:
+            with self._lock:
+                if version != self._version:
+                    self.matches.clear()
+                    self.quotes.clear()
+                    self._version = version
+                    self.invalidations += 1
+
+    @property
+    def version(self) -> int:
+        """Catalog version of the cached entries; read after a get, pass to put."""
+        return self._version
+
+    def _current(self, version: int) -> bool:
+        return version == self._version == pricing_index.version
+
+    @staticmethod
+    def quote_key(
+        items: List[Dict],
+        labor_rate: float,
+        tax_rate: float,
+        op_rate: float,
+        as_of=None
+    ) -> Tuple:
+        return (
+            tuple((normalize_name(i['name']), float(i.get('quantity', 1))) for i in items),
+            float(labor_rate), float(tax_rate), float(op_rate),
+            as_of.isoformat() if as_of else None
+        )
+
+    def get_match(self, name: str):
+        """Cached resolution for a name: an entry tuple, NO_MATCH, or None if unknown."""
+        self._sync_version()
+        return self.matches.get(normalize_name(name))
+
+    def put_match(self, name: str, resolved, version: int):
+        """Store a resolution made against `version`; dropped if the catalog changed since."""
+        if self._current(version):
+            self.matches.put(normalize_name(name), resolved)
+
+    def get_quote(self, key: Tuple) -> Optional[Dict]:
+        self._sync_version()
+        result = self.quotes.get(key)
+        return copy.deepcopy(result) if result is not None else None
+
+    def put_quote(self, key: Tuple, result: Dict, version: int):
+        """Store a quote computed against `version`; dropped if the catalog changed since."""
+        if self._current(version):
+            self.quotes.put(key, copy.deepcopy(result))
+
+    def clear(self):
+        self.matches.clear()
+        self.quotes.clear()
+
+    def stats(self) -> Dict:
+        return {
+            'catalog_version': self._version,
+            'invalidations': self.invalidations,
+            'matches': self.matches.stats(),
+            'quotes': self.quotes.stats(),
+        }
+
+
+quick_quote_cache = QuickQuoteCache()
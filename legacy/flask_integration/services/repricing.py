@@ -0,0 +1,307 @@
+"""
+Ohmni Estimate - Targeted Repricing
+Drop into: backend/services/repricing.py
+
+When catalog prices move (e.g. copper and the WIRE items), find the open
+estimates that use those pricing items and show or apply the dollar impact.
+New unit costs go through each estimate's pricing layers (region and
+project_type overlays, then its own price overrides), the same as
+add_line_item_from_pricing.
+
+Lookups go pricing item -> line items through idx_line_item_pricing_item
+(pricing_item_id, estimate_id), joined to estimates filtered by status, so only
+the affected rows are read. Repricing writes only those line items and then
+recomputes totals for the estimates they belong to from one grouped SUM.
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from datetime import datetime
+import logging
+
+from backend.extensions import db
+from backend.models.estimate_models import Estimate, EstimateLineItem, calculate_line
+from backend.services.estimate_events import event_bus, totals_payload
+from backend.services.price_history import get_prices_as_of
+from backend.services.pricing_layers import estimate_overrides, pricing_layers
+
+logger = logging.getLogger(__name__)
+
+# Estimates whose prices may still change
+OPEN_STATUSES = ('draft', 'submitted')
+
+# Scale of EstimateLineItem.material_unit_cost / labor_hours_per_unit
+MATERIAL_COST_PLACES = 2
+LABOR_HOURS_PLACES = 3
+
+
+class AffectedLine(NamedTuple):
+    """A line item linked to a repriced pricing item, with its estimate's rates."""
+    line_item_id: str
+    estimate_id: str
+    pricing_item_id: str
+    quantity: float
+    unit_type: str
+    material_unit_cost: float
+    labor_hours_per_unit: float
+    total_cost: float
+    labor_rate: float
+    tax_rate: float
+    op_rate: float
+    region: Optional[str]
+    project_type: Optional[str]
+
+
+def _float(value, default=0.0) -> float:
+    return float(value) if value is not None else default
+
+
+def find_affected_line_items(
+    pricing_item_ids: Iterable[str],
+    user_id: Optional[str] = None,
+    statuses: Sequence[str] = OPEN_STATUSES
+) -> List[AffectedLine]:
+    """Line items in open estimates that reference any of the pricing items."""
+    ids = list(dict.fromkeys(pricing_item_ids))
+    if not ids:
+        return []
+
+    query = db.session.query(
+        EstimateLineItem.id,
+        EstimateLineItem.estimate_id,
+        EstimateLineItem.pricing_item_id,
+        EstimateLineItem.quantity,
+        EstimateLineItem.unit_type,
+        EstimateLineItem.material_unit_cost,
+        EstimateLineItem.labor_hours_per_unit,
+        EstimateLineItem.total_cost,
+        Estimate.labor_rate,
+        Estimate.material_tax_rate,
+        Estimate.overhead_profit_rate,
+        Estimate.region,
+        Estimate.project_type
+    ).join(
+        Estimate, Estimate.id == EstimateLineItem.estimate_id
+    ).filter(
+        EstimateLineItem.pricing_item_id.in_(ids),
+        Estimate.status.in_(list(statuses)),
+        Estimate.deleted_at.is_(None)
+    )
+    if user_id:
+        query = query.filter(Estimate.user_id == user_id)
+
+    return [
+        AffectedLine(
+            line_item_id, estimate_id, pricing_item_id,
+            _float(quantity), unit_type,
+            _float(material_unit_cost), _float(labor_hours_per_unit), _float(total_cost),
+            _float(labor_rate, 118.00), _float(tax_rate, 0.1025), _float(op_rate),
+            region, project_type
+        )
+        for (line_item_id, estimate_id, pricing_item_id, quantity, unit_type,
+             material_unit_cost, labor_hours_per_unit, total_cost,
+             labor_rate, tax_rate, op_rate, region, project_type) in query.all()
+    ]
+
+
+def _target_prices(
+    pricing_item_ids: Sequence[str],
+    prices: Optional[Dict[str, Dict]] = None
+) -> Dict[str, Tuple[float, float]]:
+    """
+    New (material_cost, labor_hours) per pricing item: the live catalog price,
+    overridden by `prices` for what-if reports.
+    """
+    targets = {
+        item_id: (point.material_cost, point.labor_hours)
+        for item_id, point in get_prices_as_of(pricing_item_ids).items()
+    }
+    for item_id, override in (prices or {}).items():
+        current = targets.get(item_id, (0.0, 0.0))
+        targets[item_id] = (
+            float(override.get('material_cost', current[0])),
+            float(override.get('labor_hours', current[1]))
+        )
+    return targets
+
+
+def _line_targets(
+    lines: List[AffectedLine],
+    targets: Dict[str, Tuple[float, float]]
+) -> Dict[str, Tuple[float, float]]:
+    """Per line item: the base target layered through its estimate's pricing layers."""
+    estimate_ids = list({line.estimate_id for line in lines})
+    overrides = {}
+    if estimate_ids:
+        overrides = {
+            estimate.id: estimate_overrides(estimate)
+            for estimate in db.session.query(Estimate.id, Estimate.estimate_metadata).filter(
+                Estimate.id.in_(estimate_ids)
+            ).all()
+        }
+
+    line_targets = {}
+    for line in lines:
+        base = targets.get(line.pricing_item_id)
+        if base is None:
+            continue
+        price = pricing_layers.resolve(
+            line.pricing_item_id, line.region, line.project_type,
+            overrides.get(line.estimate_id), base=base
+        )
+        # Rounded to the column scale, so a target compares equal to the value
+        # it would be stored as
+        line_targets[line.line_item_id] = (
+            round(price.material_cost, MATERIAL_COST_PLACES), round(price.labor_hours, LABOR_HOURS_PLACES)
+        )
+    return line_targets
+
+
+def _reprice(line: AffectedLine, material_cost: float, labor_hours: float) -> Tuple[float, float, float]:
+    return calculate_line(
+        line.quantity, material_cost, labor_hours, line.unit_type,
+        line.labor_rate, line.tax_rate, line.op_rate
+    )
+
+
+def impact_report(
+    pricing_item_ids: Iterable[str],
+    user_id: Optional[str] = None,
+    prices: Optional[Dict[str, Dict]] = None,
+    statuses: Sequence[str] = OPEN_STATUSES
+) -> Dict:
+    """
+    Dollar impact of moving the given pricing items to their catalog price
+    (or to `prices`: {pricing_item_id: {"material_cost": ..., "labor_hours": ...}}).
+    Nothing is written.
+    """
+    ids = list(dict.fromkeys(pricing_item_ids))
+    lines = find_affected_line_items(ids, user_id=user_id, statuses=statuses)
+    return _build_report(ids, statuses, lines, _line_targets(lines, _target_prices(ids, prices)))
+
+
+def _build_report(
+    ids: List[str],
+    statuses: Sequence[str],
+    lines: List[AffectedLine],
+    line_targets: Dict[str, Tuple[float, float]]
+) -> Dict:
+    per_estimate: Dict[str, Dict] = {}
+    for line in lines:
+        if line.line_item_id not in line_targets:
+            continue
+        material_cost, labor_hours = line_targets[line.line_item_id]
+        _, _, new_total = _reprice(line, material_cost, labor_hours)
+        entry = per_estimate.setdefault(line.estimate_id, {
+            'line_items': 0, 'line_items_changed': 0, 'current_total': 0.0, 'repriced_total': 0.0
+        })
+        entry['line_items'] += 1
+        entry['current_total'] += line.total_cost
+        entry['repriced_total'] += new_total
+        if (material_cost, labor_hours) != (line.material_unit_cost, line.labor_hours_per_unit):
+            entry['line_items_changed'] += 1
+
+    estimates = []
+    if per_estimate:
+        rows = db.session.query(
+            Estimate.id, Estimate.project_name, Estimate.status, Estimate.final_bid
+        ).filter(Estimate.id.in_(list(per_estimate))).all()
+        for estimate_id, project_name, status, final_bid in rows:
+            entry = per_estimate[estimate_id]
+            delta = round(entry['repriced_total'] - entry['current_total'], 2)
+            estimates.append({
+                'estimate_id': estimate_id,
+                'project_name': project_name,
+                'status': status,
+                'line_items': entry['line_items'],
+                'line_items_changed': entry['line_items_changed'],
+                'current_total': round(entry['current_total'], 2),
+                'repriced_total': round(entry['repriced_total'], 2),
+                'delta': delta,
+                'final_bid': _float(final_bid),
+                'projected_final_bid': round(_float(final_bid) + delta, 2),
+            })
+        estimates.sort(key=lambda e: abs(e['delta']), reverse=True)
+
+    return {
+        'pricing_item_ids': ids,
+        'statuses': list(statuses),
+        'line_items_affected': sum(e['line_items'] for e in estimates),
+        'estimates': estimates,
+        'total_delta': round(sum(e['delta'] for e in estimates), 2),
+    }
+
+
+def reprice_line_items(
+    pricing_item_ids: Iterable[str],
+    user_id: Optional[str] = None,
+    prices: Optional[Dict[str, Dict]] = None,
+    statuses: Sequence[str] = OPEN_STATUSES
+) -> Dict:
+    """
+    Apply catalog (or `prices`) unit costs to the affected line items only,
+    then recompute totals for the estimates that own them. Returns the impact
+    report computed before the write.
+    """
+    ids = list(dict.fromkeys(pricing_item_ids))
+    lines = find_affected_line_items(ids, user_id=user_id, statuses=statuses)
+    line_targets = _line_targets(lines, _target_prices(ids, prices))
+    report = _build_report(ids, statuses, lines, line_targets)
+    now = datetime.utcnow()
+
+    mappings = []
+    for line in lines:
+        target = line_targets.get(line.line_item_id)
+        if target is None or target == (line.material_unit_cost, line.labor_hours_per_unit):
+            continue
+        material_extension, labor_extension, total_cost = _reprice(line, *target)
+        mappings.append({
+            'id': line.line_item_id,
+            'material_unit_cost': target[0],
+            'labor_hours_per_unit': target[1],
+            'material_extension': material_extension,
+            'labor_extension': labor_extension,
+            'total_cost': total_cost,
+            'updated_at': now,
+        })
+
+    changed_ids = {m['id'] for m in mappings}
+    estimate_ids = sorted({line.estimate_id for line in lines if line.line_item_id in changed_ids})
+
+    if mappings:
+        db.session.bulk_update_mappings(EstimateLineItem, mappings)
+        _recalculate_totals(estimate_ids)
+        db.session.commit()
+
+        for estimate in Estimate.query.filter(Estimate.id.in_(estimate_ids)).all():
+            event_bus.publish(estimate.id, 'estimate_updated', {
+                'fields': {},
+                'line_items_repriced': True,
+                'totals': totals_payload(estimate)
+            })
+
+    logger.info(
+        f"Repriced {len(mappings)} line items across {len(estimate_ids)} estimates "
+        f"for {len(ids)} pricing items"
+    )
+    report['line_items_repriced'] = len(mappings)
+    report['estimates_repriced'] = estimate_ids
+    return report
+
+
+def _recalculate_totals(estimate_ids: Sequence[str]):
+    """Estimate.recalculate_totals for many estimates from one grouped SUM."""
+    if not estimate_ids:
+        return
+    sums = dict(
+        (estimate_id, (material, labor_hours))
+        for estimate_id, material, labor_hours in db.session.query(
+            EstimateLineItem.estimate_id,
+            db.func.coalesce(db.func.sum(EstimateLineItem.material_extension), 0),
+            db.func.coalesce(db.func.sum(EstimateLineItem.labor_extension), 0)
+        ).filter(
+            EstimateLineItem.estimate_id.in_(list(estimate_ids))
+        ).group_by(EstimateLineItem.estimate_id).all()
+    )
+    for estimate in Estimate.query.filter(Estimate.id.in_(list(estimate_ids))).all():
+        material, labor_hours = sums.get(estimate.id, (0, 0))
+        estimate.apply_totals(float(material), float(labor_hours))
@@ -0,0 +1,268 @@
+"""
+Ohmni Estimate - Supplier Adapters
+Drop into: backend/services/supplier_adapters.py
+
+The quote type and adapter interface shared by SupplierPricingService
+(supplier_pricing_service.py) and its adapters, plus the live distributor
+APIs. Graybar/WESCO speak a typical B2B REST pattern over a pooled keep-alive
+transport (supplier_transport.py); they need API credentials from the
+suppliers and raise SupplierNotConfigured without them.
+benchmarks/supplier_stub_server.py serves the same endpoints locally for
+testing. The CSV price file adapter is in supplier_csv_adapter.py.
+"""
+
+import os
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from urllib.parse import quote as quote_path
+
+from backend.services.supplier_rate_limit import MAX_CONCURRENCY, SupplierThrottle
+from backend.services.supplier_transport import (
+    SupplierHTTPError, SupplierNotConfigured, SupplierTransport, get_transport
+)
+
+DEFAULT_BULK_BATCH_SIZE = 100  # SKUs per get_bulk_prices call
+
+# Items per supplier unit of measure
+UOM_QUANTITIES = {'EA': 1, 'E': 1, 'FT': 1, 'C': 100, 'M': 1000}
+
+
+def per_each_cost(quote: 'PriceQuote') -> Optional[float]:
+    """Unit price per each/foot, or None for a UOM we can't convert."""
+    quantity = UOM_QUANTITIES.get((quote.unit_of_measure or 'EA').upper())
+    return quote.unit_price / quantity if quantity else None
+
+
+@dataclass
+class PriceQuote:
+    """Represents a price quote from a supplier."""
+    supplier: str
+    sku: str
+    description: str
+    unit_price: float
+    unit_of_measure: str  # EA, C (100), M (1000), FT
+    quantity_available: Optional[int]
+    lead_time_days: Optional[int]
+    quote_valid_until: Optional[datetime]  # naive UTC, like fetched_at
+    fetched_at: datetime
+
+
+
+_throttle_lock = threading.Lock()
+
+
+class SupplierAdapter(ABC):
+    """Abstract base class for supplier API adapters."""
+
+    # Per-call timeout in seconds (None = service default)
+    timeout: Optional[float] = None
+    # Max SKUs per get_bulk_prices call
+    bulk_batch_size: int = DEFAULT_BULK_BATCH_SIZE
+    # Fixed requests/second (None = none) and ceiling for the adaptive
+    # concurrency limit; max_concurrency None turns throttling off
+    rate_limit: Optional[float] = None
+    max_concurrency: Optional[int] = MAX_CONCURRENCY
+
+    @property
+    def name(self) -> str:
+        return self.__class__.__name__
+
+    @property
+    def throttle(self) -> Optional[SupplierThrottle]:
+        """This adapter's rate/concurrency limiter (see supplier_rate_limit.py)."""
+        if self.max_concurrency is None:
+            return None
+        throttle = self.__dict__.get('_throttle')
+        if throttle is None:
+            with _throttle_lock:
+                throttle = self.__dict__.get('_throttle')
+                if throttle is None:
+                    throttle = self._throttle = SupplierThrottle(
+                        self.name, rate=self.rate_limit, max_concurrency=self.max_concurrency
+                    )
+        return throttle
+
+    @abstractmethod
+    def search_product(self, query: str) -> List[PriceQuote]:
+        """Search for products by description or part number."""
+        pass
+
+    @abstractmethod
+    def get_price(self, sku: str, quantity: int = 1) -> Optional[PriceQuote]:
+        """Get current price for a specific SKU."""
+        pass
+
+    @abstractmethod
+    def get_bulk_prices(self, skus: List[str]) -> Dict[str, PriceQuote]:
+        """Get prices for multiple SKUs at once."""
+        pass
+
+
+# =============================================================================
+# LIVE API ADAPTERS
+# =============================================================================
+
+def _parse_datetime(value) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+class HTTPSupplierAdapter(SupplierAdapter):
+    """
+    Base for distributor REST APIs, over a shared pooled transport
+    (supplier_transport.get_transport: keep-alive, gzip, token cache).
+
+    Product JSON (typical B2B pattern):
+        {"sku", "description", "unit_price", "uom", "quantity_available",
+         "lead_time_days", "valid_until"}
+    """
+
+    supplier_name = ''
+    search_path = '/api/products/search'
+    price_path = '/api/products/{sku}/price'
+    bulk_path = '/api/quotes'
+
+    def __init__(self, base_url: str, account_number: Optional[str] = None):
+        self.base_url = base_url
+        self.account_number = account_number
+        # e.g. GRAYBAR_RATE_LIMIT=10 for a published 10 req/s limit
+        self.rate_limit = float(os.getenv(f"{self.supplier_name.upper()}_RATE_LIMIT") or 0) or None
+
+    @property
+    @abstractmethod
+    def configured(self) -> bool:
+        """True when the adapter's API credentials are set."""
+        pass
+
+    def _setup_transport(self, transport: SupplierTransport):
+        """Attach credentials to a newly created transport."""
+
+    def _transport(self) -> SupplierTransport:
+        if not self.configured:
+            raise SupplierNotConfigured(f"{self.supplier_name} API credentials not configured")
+        transport = get_transport(self.supplier_name, self.base_url)
+        self._setup_transport(transport)
+        return transport
+
+    def _params(self, **params) -> Dict:
+        if self.account_number:
+            params['account'] = self.account_number
+        return params
+
+    def _quote(self, data: Dict, fetched_at: datetime) -> PriceQuote:
+        return PriceQuote(
+            supplier=self.supplier_name,
+            sku=data['sku'],
+            description=data.get('description') or '',
+            unit_price=float(data['unit_price']),
+            unit_of_measure=data.get('uom') or 'EA',
+            quantity_available=data.get('quantity_available'),
+            lead_time_days=data.get('lead_time_days'),
+            quote_valid_until=_parse_datetime(data.get('valid_until')),
+            fetched_at=fetched_at
+        )
+
+    def search_product(self, query: str) -> List[PriceQuote]:
+        data = self._transport().get_json(self.search_path, params=self._params(q=query))
+        now = datetime.utcnow()
+        return [self._quote(p, now) for p in (data or {}).get('products', [])]
+
+    def get_price(self, sku: str, quantity: int = 1) -> Optional[PriceQuote]:
+        path = self.price_path.format(sku=quote_path(sku, safe=''))
+        try:
+            data = self._transport().get_json(path, params=self._params(quantity=quantity))
+        except SupplierHTTPError as e:
+            if e.status == 404:
+                return None
+            raise
+        return self._quote(data, datetime.utcnow()) if data else None
+
+    def get_bulk_prices(self, skus: List[str]) -> Dict[str, PriceQuote]:
+        payload = {'skus': list(skus)}
+        if self.account_number:
+            payload['account'] = self.account_number
+        data = self._transport().post_json(self.bulk_path, payload)
+        now = datetime.utcnow()
+        return {sku: self._quote(p, now) for sku, p in ((data or {}).get('prices') or {}).items()}
+
+
+class GraybarAdapter(HTTPSupplierAdapter):
+    """
+    Graybar Electric API Adapter
+
+    To get API access:
+    1. Contact your Graybar account rep
+    2. Request API access through Graybar's eBusiness team
+    3. They'll provide OAuth credentials
+
+    API Documentation (requires login):
+    https://www.graybar.com/store/en/gb/cms/customer-solutions/ecommerce-solutions
+
+    Endpoints (typical B2B pattern):
+    - POST /oauth/token - Get access token
+    - GET /api/products/search - Search products
+    - GET /api/products/{sku}/price - Get price
+    - POST /api/quotes - Request quote for bulk items
+    """
+
+    supplier_name = 'Graybar'
+
+    def __init__(self):
+        super().__init__(
+            os.getenv("GRAYBAR_API_URL", "https://api.graybar.com"),
+            os.getenv("GRAYBAR_ACCOUNT_NUMBER")
+        )
+        self.client_id = os.getenv("GRAYBAR_CLIENT_ID")
+        self.client_secret = os.getenv("GRAYBAR_CLIENT_SECRET")
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.client_id and self.client_secret)
+
+    def _setup_transport(self, transport: SupplierTransport):
+        # OAuth client credentials; the token is cached on the shared transport
+        transport.use_oauth('/oauth/token', self.client_id, self.client_secret)
+
+
+class WESCOAdapter(HTTPSupplierAdapter):
+    """
+    WESCO International API Adapter
+
+    To get API access:
+    1. Contact WESCO Digital Solutions team
+    2. Request API integration through your account manager
+    3. They use a similar OAuth/REST pattern
+
+    WESCO also offers:
+    - EDI integration (traditional)
+    - Punch-out catalog (for procurement systems)
+    - CSV price file updates (weekly)
+
+    The CSV option might be easiest for initial integration.
+    """
+
+    supplier_name = 'WESCO'
+
+    def __init__(self):
+        super().__init__(
+            os.getenv("WESCO_API_URL", "https://api.wesco.com"),
+            os.getenv("WESCO_ACCOUNT_NUMBER")
+        )
+        self.api_key = os.getenv("WESCO_API_KEY")
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.api_key)
+
+    def _setup_transport(self, transport: SupplierTransport):
+        transport.headers['X-API-Key'] = self.api_key
@@ -0,0 +1,188 @@
+"""
+Ohmni Estimate - Supplier Bulk Price Refresh
+Drop into: backend/services/supplier_bulk_refresh.py
+
+Prices many SKUs at every supplier at once and writes the cheapest back to
+the pricing catalog. Used by SupplierPricingService.fetch_bulk_prices,
+refresh_database_prices and ingest_price_file.
+"""
+
+import functools
+import logging
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, wait
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from backend.extensions import db
+from backend.models.estimate_models import PricingItem
+from backend.services.price_history import record_price_book
+from backend.services.pricing_index import pricing_index
+from backend.services.supplier_adapters import PriceQuote, per_each_cost
+from backend.services.supplier_fan_out import SupplierFanOut
+from backend.services.supplier_quote_cache import SupplierQuoteCache, price_key
+from backend.services.supplier_rate_limit import is_throttle_error
+from backend.services.supplier_transport import SupplierNotConfigured
+
+logger = logging.getLogger(__name__)
+
+REFRESH_QUERY_CHUNK = 500   # names per PricingItem IN (...) query
+MAX_THROTTLE_RETRIES = 3    # bulk chunk retries after a 429/503
+
+# Items per PricingItem.unit_type
+UNIT_TYPE_QUANTITIES = {'E': 1, 'C': 100, 'M': 1000, 'Lot': 1}
+
+
+def fetch_bulk_prices(
+    fan_out: SupplierFanOut,
+    quote_cache: SupplierQuoteCache,
+    skus: List[str]
+) -> Dict[str, PriceQuote]:
+    """
+    Cheapest quote per SKU across all suppliers, via get_bulk_prices in
+    adapter-sized chunks run concurrently on the fan-out's worker pool.
+    Quotes are compared per each (see UOM_QUANTITIES) and cached for
+    get_price().
+
+    Each supplier gets at most its throttle window of chunks in flight, so
+    the pool is shared fairly and a throttled supplier backs off without
+    holding workers; chunks rejected with 429/503 are retried.
+    """
+    skus = list(dict.fromkeys(skus))
+    pool = fan_out.pool()
+
+    queues = {
+        adapter: deque((skus[i:i + adapter.bulk_batch_size], 0) for i in range(0, len(skus), adapter.bulk_batch_size))
+        for adapter in fan_out.adapters
+    }
+    inflight = {adapter: 0 for adapter in fan_out.adapters}
+    futures = {}
+    bulk_call = functools.partial(fan_out.call, block=True)
+
+    def top_up():
+        # Round-robin so one slow distributor doesn't hold every worker
+        # while the others wait in the queue.
+        submitted = True
+        while submitted:
+            submitted = False
+            for adapter, queue in queues.items():
+                throttle = adapter.throttle
+                if queue and (throttle is None or inflight[adapter] < throttle.window):
+                    chunk, attempt = queue.popleft()
+                    future = pool.submit(
+                        fan_out.timed, fan_out.health(adapter), 'bulk',
+                        bulk_call, adapter, adapter.get_bulk_prices, chunk
+                    )
+                    futures[future] = (adapter, chunk, attempt)
+                    inflight[adapter] += 1
+                    submitted = True
+
+    best: Dict[str, PriceQuote] = {}
+    unavailable = set()
+    top_up()
+    while futures:
+        done, _ = wait(list(futures), return_when=FIRST_COMPLETED)
+        for future in done:
+            adapter, chunk, attempt = futures.pop(future)
+            inflight[adapter] -= 1
+            try:
+                quotes = future.result()
+            except SupplierNotConfigured:
+                unavailable.add(adapter.name)
+                queues[adapter].clear()
+                continue
+            except Exception as e:
+                if is_throttle_error(e) and attempt < MAX_THROTTLE_RETRIES:
+                    queues[adapter].append((chunk, attempt + 1))
+                else:
+                    logger.warning(f"Bulk price chunk failed for {adapter.name}: {e}")
+                continue
+
+            for sku, quote in quotes.items():
+                quote_cache.put(price_key(adapter.name, sku, 1), quote)
+                cost = per_each_cost(quote)
+                if cost is None:
+                    continue
+                current = best.get(sku)
+                if current is None or cost < per_each_cost(current):
+                    best[sku] = quote
+        top_up()
+
+    if unavailable:
+        logger.info(f"Bulk pricing skipped unconfigured suppliers: {', '.join(sorted(unavailable))}")
+    return best
+
+
+def refresh_database_prices(
+    fan_out: SupplierFanOut,
+    quote_cache: SupplierQuoteCache,
+    sku_mapping: Dict[str, str],
+    write: bool = True,
+    price_book: Optional[str] = None
+) -> Dict[str, float]:
+    """
+    Refresh prices in our database from supplier APIs.
+
+    SKUs are priced in bulk (fetch_bulk_prices), converted to each
+    PricingItem's unit (E/C/M/Lot), and the items whose material_cost
+    changed are written back in one bulk update. Pass price_book to also
+    record the changes as an effective-dated price book.
+
+    Args:
+        sku_mapping: Dict mapping our item names to supplier SKUs
+                     {"Duplex Receptacle": "LEV-5320-W", ...}
+        write: False to only compute prices (dry run)
+
+    Returns:
+        Dict of updated prices (item name -> material_cost in the item's unit)
+    """
+    quotes = fetch_bulk_prices(fan_out, quote_cache, list(sku_mapping.values()))
+    names = [name for name, sku in sku_mapping.items() if sku in quotes]
+    if not names:
+        return {}
+
+    items = []
+    for i in range(0, len(names), REFRESH_QUERY_CHUNK):
+        items.extend(db.session.query(
+            PricingItem.id, PricingItem.name, PricingItem.unit_type, PricingItem.material_cost
+        ).filter(
+            PricingItem.name.in_(names[i:i + REFRESH_QUERY_CHUNK]),
+            PricingItem.is_active == True
+        ).all())
+
+    updated: Dict[str, float] = {}
+    changes = []
+    now = datetime.utcnow()
+    for item_id, name, unit_type, material_cost in items:
+        quote = quotes[sku_mapping[name]]
+        new_cost = round(per_each_cost(quote) * UNIT_TYPE_QUANTITIES.get(unit_type, 1), 2)
+        updated[name] = new_cost
+        if material_cost is None or abs(float(material_cost) - new_cost) >= 0.005:
+            changes.append({'id': item_id, 'material_cost': new_cost, 'updated_at': now})
+
+    if write and changes:
+        try:
+            db.session.bulk_update_mappings(PricingItem, changes)
+            if price_book:
+                record_price_book(price_book, effective_from=now, prices=[
+                    {'pricing_item_id': c['id'], 'material_cost': c['material_cost'],
+                     'labor_hours': labor_hours}
+                    for c, labor_hours in zip(changes, _labor_hours([c['id'] for c in changes]))
+                ], commit=False)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        pricing_index.rebuild()
+        logger.info(f"Supplier refresh updated {len(changes)} of {len(items)} pricing items")
+
+    return updated
+
+
+def _labor_hours(item_ids: List[str]) -> List[float]:
+    hours = {}
+    for i in range(0, len(item_ids), REFRESH_QUERY_CHUNK):
+        hours.update(db.session.query(PricingItem.id, PricingItem.labor_hours).filter(
+            PricingItem.id.in_(item_ids[i:i + REFRESH_QUERY_CHUNK])
+        ).all())
+    return [float(hours.get(item_id) or 0) for item_id in item_ids]
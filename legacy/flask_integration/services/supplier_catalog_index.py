@@ -0,0 +1,239 @@
+"""
+Ohmni Estimate - Supplier Catalog Search Index
+Drop into: backend/services/supplier_catalog_index.py
+
+Search index for supplier price files (CSVPriceAdapter), built at load time
+so a query no longer scans every SKU:
+
+- SKU exact/prefix: bisect over the price table's sorted SKU order
+                    ("LEV-53" finds "LEV-5320-W"; see SupplierPriceTable)
+- tokens:           inverted lists over description tokens and inner SKU
+                    parts; every query term must match a token or SKU
+                    prefix, as in pricing_index.PricingAutocompleteIndex
+
+Doc ids are price table row ids. Postings are packed as array('I') of
+(row << 2 | weight), about 4 bytes per token occurrence. Rows removed from
+the table are skipped at query time and dropped by compact().
+
+snapshot_sections/from_snapshot store the postings as one array plus
+per-token offsets, so a mapped snapshot serves queries without rebuilding a
+dict of arrays (see supplier_price_snapshot.py).
+
+Results are ranked: exact SKU, then SKU prefix, then weighted token hits,
+then shorter descriptions.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from array import array
+from bisect import bisect_left
+import heapq
+import re
+import threading
+
+from backend.services.pricing_index import EXACT_TOKEN_BONUS, tokenize
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+SKU_EXACT_SCORE = 1000
+SKU_PREFIX_SCORE = 100
+SKU_PART_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+MAX_PREFIX_SKUS = 1000  # SKU prefix matches considered per query
+WEIGHT_BITS = 2
+WEIGHT_MASK = (1 << WEIGHT_BITS) - 1
+
+SKU_PART_RE = re.compile(r"[a-z0-9]+")
+
+
+def sku_tokens(sku: str) -> List[str]:
+    """
+    Inner SKU parts ("lev-5320-w" -> 5320, w). The whole SKU and its leading
+    part are found through the price table's SKU prefix search instead, which
+    saves a posting list per SKU.
+    """
+    return SKU_PART_RE.findall(sku.lower())[1:]
+
+
+# =============================================================================
+# INDEX
+# =============================================================================
+
+class _MappedPostings:
+    """Read-only token -> postings over snapshot sections (sorted tokens)."""
+
+    def __init__(self, tokens: List[str], offsets, data):
+        self._tokens = tokens
+        self._offsets = offsets
+        self._data = data
+
+    def get(self, token: str, default=None):
+        tokens = self._tokens
+        i = bisect_left(tokens, token)
+        if i < len(tokens) and tokens[i] == token:
+            return self._data[self._offsets[i]:self._offsets[i + 1]]
+        return default
+
+    def __iter__(self):
+        return iter(self._tokens)
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def thaw(self) -> Dict[str, array]:
+        postings = {}
+        for token in self._tokens:
+            posting = postings[token] = array('I')
+            posting.frombytes(self.get(token).cast('B'))
+        return postings
+
+
+class SupplierCatalogIndex:
+    """Token index over a SupplierPriceTable."""
+
+    def __init__(self, table):
+        self.table = table
+        self._postings: Dict[str, array] = {}
+
+        self._lock = threading.Lock()
+        self._tokens: List[str] = []
+        self._dirty = False
+
+    def snapshot_sections(self) -> Dict[str, object]:
+        self._refresh()
+        offsets = array('L', [0])
+        data = array('I')
+        for token in self._tokens:
+            data.extend(self._postings.get(token))
+            offsets.append(len(data))
+        return {
+            'tokens': bytearray('\n'.join(self._tokens).encode('utf-8')),
+            'token_off': offsets,
+            'postings': data,
+        }
+
+    @classmethod
+    def from_snapshot(cls, table, sections: Dict[str, memoryview]) -> 'SupplierCatalogIndex':
+        index = cls(table)
+        blob = bytes(sections['tokens']).decode('utf-8')
+        index._tokens = blob.split('\n') if blob else []
+        index._postings = _MappedPostings(index._tokens, sections['token_off'], sections['postings'])
+        return index
+
+    def _thaw(self):
+        if isinstance(self._postings, _MappedPostings):
+            self._postings = self._postings.thaw()
+
+    def add(self, row: int, sku: str, description: Optional[str]):
+        """Index a table row (call after SupplierPriceTable.append)."""
+        self._thaw()
+        weights: Dict[str, int] = {}
+        for token in tokenize(description):
+            weights[token] = max(weights.get(token, 0), DESCRIPTION_WEIGHT)
+        for token in sku_tokens(sku):
+            weights[token] = max(weights.get(token, 0), SKU_PART_WEIGHT)
+
+        postings = self._postings
+        packed = row << WEIGHT_BITS
+        for token, weight in weights.items():
+            posting = postings.get(token)
+            if posting is None:
+                posting = postings[token] = array('I')
+                self._dirty = True
+            posting.append(packed | weight)
+
+    def compact(self):
+        """Drop postings of removed rows (worth it after large removals)."""
+        is_live = self.table.is_live
+        with self._lock:
+            self._thaw()
+            for token in list(self._postings):
+                live = array('I', (p for p in self._postings[token] if is_live(p >> WEIGHT_BITS)))
+                if live:
+                    self._postings[token] = live
+                else:
+                    del self._postings[token]
+            self._dirty = True
+
+    def _refresh(self):
+        if not self._dirty:
+            return
+        with self._lock:
+            if self._dirty:
+                self._tokens = sorted(self._postings)
+                self._dirty = False
+
+    def _term_range(self, term: str) -> Tuple[int, int, int]:
+        """(first, last, posting count) of the tokens starting with term."""
+        tokens = self._tokens
+        first = i = bisect_left(tokens, term)
+        size = 0
+        while i < len(tokens) and tokens[i].startswith(term):
+            size += len(self._postings.get(tokens[i], ()))
+            i += 1
+        return first, i, size
+
+    def _term_scores(self, term: str, token_range: Tuple[int, int, int],
+                     within: Optional[Dict[int, int]] = None) -> Dict[int, int]:
+        """Best weighted hit per row for one query term (treated as a prefix)."""
+        scores: Dict[int, int] = {}
+        tokens = self._tokens
+        is_live = self.table.is_live
+        first, last, _ = token_range
+        for i in range(first, last):
+            bonus = EXACT_TOKEN_BONUS if tokens[i] == term else 1
+            for packed in self._postings.get(tokens[i], ()):
+                row = packed >> WEIGHT_BITS
+                if within is not None:
+                    if row not in within:
+                        continue
+                elif not is_live(row):
+                    continue
+                score = (packed & WEIGHT_MASK) * bonus
+                if scores.get(row, 0) < score:
+                    scores[row] = score
+
+        # The term may also be the start of a SKU ("lev" -> LEV-5320-W)
+        for row, exact in self.table.prefix(term, MAX_PREFIX_SKUS):
+            if within is not None and row not in within:
+                continue
+            score = SKU_PART_WEIGHT * (EXACT_TOKEN_BONUS if exact else 1)
+            if scores.get(row, 0) < score:
+                scores[row] = score
+        return scores
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """Table rows matching the query, best first."""
+        self._refresh()
+        query = (query or '').strip()
+        if not query:
+            return []
+
+        totals = {
+            row: SKU_EXACT_SCORE if exact else SKU_PREFIX_SCORE
+            for row, exact in self.table.prefix(query, MAX_PREFIX_SKUS)
+        }
+
+        # Rarest terms (fewest postings) first so the candidate set shrinks fast
+        ranges = sorted(
+            ((term, self._term_range(term)) for term in set(tokenize(query))),
+            key=lambda tr: tr[1][2]
+        )
+        matched: Optional[Dict[int, int]] = None
+        for term, token_range in ranges:
+            scores = self._term_scores(term, token_range, matched)
+            if matched is None:
+                matched = scores
+            else:
+                matched = {row: s + matched[row] for row, s in scores.items()}
+            if not matched:
+                break
+        for row, score in (matched or {}).items():
+            totals[row] = totals.get(row, 0) + score
+
+        table = self.table
+        key = lambda kv: (-kv[1], table.description_length(kv[0]), kv[0])
+        ranked = heapq.nsmallest(limit, totals.items(), key=key) if limit else sorted(totals.items(), key=key)
+        return [row for row, _ in ranked]
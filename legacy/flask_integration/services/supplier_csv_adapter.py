@@ -0,0 +1,223 @@
+"""
+Ohmni Estimate - Supplier CSV Price File Adapter
+Drop into: backend/services/supplier_csv_adapter.py
+
+Serves quotes from a supplier's CSV price file (SUPPLIER_CSV_PATH for
+SupplierPricingService), the simplest supplier integration. Rows live in a
+SupplierPriceTable searched through a SupplierCatalogIndex; parsed files are
+snapshotted (supplier_price_snapshot.py) and new files are applied as deltas
+(supplier_price_delta.py).
+"""
+
+import io
+import itertools
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from backend.services.supplier_adapters import PriceQuote, SupplierAdapter
+from backend.services.supplier_catalog_index import SupplierCatalogIndex
+from backend.services.supplier_price_delta import PriceFileDelta, diff_price_records, sorted_price_records
+from backend.services.supplier_price_snapshot import file_digest, load_snapshot, save_snapshot, snapshot_path
+from backend.services.supplier_price_table import SupplierPriceTable
+
+logger = logging.getLogger(__name__)
+
+CSV_CHUNK_ROWS = 5000
+COMPACT_DEAD_RATIO = 0.25  # compact the CSV index past this share of dead rows
+
+
+class CSVPriceAdapter(SupplierAdapter):
+    """
+    CSV Price File Adapter
+
+    This is the simplest approach - most suppliers can provide weekly
+    or monthly price files in CSV format. Upload them and the system
+    updates automatically.
+
+    Expected CSV format:
+    sku,description,unit_price,uom,category
+    "EMT-075","3/4\" EMT Conduit 10ft",18.45,EA,CONDUIT
+    "THHN-6-BLK","#6 THHN Copper Black 500ft",450.00,EA,WIRE
+
+    Usage:
+    1. Get CSV price file from supplier
+    2. Upload to /api/pricing/upload-csv
+    3. Prices are updated in database
+
+    Rows are kept in a compact SupplierPriceTable (column arrays, interned
+    UOM/supplier strings) and loaded in streaming chunks; PriceQuote objects
+    are only built for the rows a lookup returns. Searches go through a
+    SupplierCatalogIndex built while loading (exact SKU, SKU prefix and
+    description tokens), not a scan of every row.
+
+    A price file path (SUPPLIER_CSV_PATH for the service) is parsed once per
+    file version: the table and index are saved to a snapshot keyed by the
+    file's SHA-256, and later processes map it instead of re-parsing.
+    """
+
+    supplier_name = "CSV Import"
+    bulk_batch_size = CSV_CHUNK_ROWS
+    max_concurrency = None  # in-memory, nothing to throttle
+
+    def __init__(self, csv_path: Optional[str] = None):
+        self.csv_path = csv_path
+        self._table = SupplierPriceTable()
+        self._index = SupplierCatalogIndex(self._table)
+        self._lock = threading.Lock()
+        if csv_path:
+            self.load_from_csv(csv_path)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def load_from_csv(self, csv_path, chunk_rows: int = CSV_CHUNK_ROWS, snapshot: bool = True) -> int:
+        """
+        Load prices from a CSV file path or file object (e.g. an upload).
+        Rows stream in chunks of chunk_rows; a SKU loaded again replaces the
+        earlier price. Returns the number of rows read.
+
+        A path loaded into an empty adapter goes through the snapshot cache
+        (supplier_price_snapshot.py) unless snapshot=False.
+        """
+        import csv
+
+        if isinstance(csv_path, (str, os.PathLike)):
+            if snapshot and self._table.row_count == 0:
+                return self._load_with_snapshot(os.fspath(csv_path), chunk_rows)
+            with open(csv_path, 'r', newline='') as f:
+                return self.load_from_csv(f, chunk_rows)
+
+        f = csv_path
+        if isinstance(f.read(0), bytes):
+            f = io.TextIOWrapper(f, encoding='utf-8', newline='')
+        reader = csv.DictReader(f)
+        batch = self._table.new_batch(time.time())
+        count = 0
+        while True:
+            chunk = list(itertools.islice(reader, chunk_rows))
+            if not chunk:
+                break
+            with self._lock:
+                for row in chunk:
+                    sku = row['sku']
+                    description = row['description']
+                    index_row = self._table.append(
+                        sku, description, float(row['unit_price']),
+                        row.get('uom') or 'EA', row.get('supplier') or self.supplier_name, batch
+                    )
+                    self._index.add(index_row, sku, description)
+            count += len(chunk)
+        return count
+
+    def _load_with_snapshot(self, path: str, chunk_rows: int) -> int:
+        snap = snapshot_path(file_digest(path))
+        loaded = load_snapshot(snap)
+        if loaded is not None and loaded[1].get('supplier') == self.supplier_name:
+            sections, meta = loaded
+            table = SupplierPriceTable.from_snapshot(
+                {k[len('table.'):]: v for k, v in sections.items() if k.startswith('table.')}, meta['table']
+            )
+            index = SupplierCatalogIndex.from_snapshot(
+                table, {k[len('index.'):]: v for k, v in sections.items() if k.startswith('index.')}
+            )
+            with self._lock:
+                self._table, self._index = table, index
+            logger.info(f"Mapped price snapshot {snap} for {path} ({len(table)} SKUs)")
+            return meta['rows_read']
+
+        with open(path, 'r', newline='') as f:
+            count = self.load_from_csv(f, chunk_rows)
+        self._save_snapshot(snap, path, count)
+        return count
+
+    def _save_snapshot(self, snap: str, path: str, rows_read: int):
+        try:
+            with self._lock:
+                table_sections, table_meta = self._table.snapshot_sections()
+                sections = {f"table.{k}": v for k, v in table_sections.items()}
+                sections.update({f"index.{k}": v for k, v in self._index.snapshot_sections().items()})
+                save_snapshot(snap, sections, {
+                    'supplier': self.supplier_name, 'source': path, 'rows_read': rows_read, 'table': table_meta,
+                })
+        except OSError as e:
+            logger.warning(f"Could not write price snapshot {snap}: {e}")
+
+    def apply_price_file(self, path: str) -> PriceFileDelta:
+        """
+        Replace the loaded prices with a new full price file, applying only
+        what changed (supplier_price_delta.py). A re-priced row is updated in
+        place; a new description or SKU spelling replaces the row. The result
+        is snapshotted under the new file's hash for other workers.
+        With nothing loaded yet this is a plain load (delta.full_load).
+        """
+        start = time.perf_counter()
+        path = os.fspath(path)
+        if self._table.row_count == 0:
+            delta = PriceFileDelta(full_load=True)
+            delta.file_skus = self.load_from_csv(path)
+            delta.elapsed_ms = (time.perf_counter() - start) * 1000
+            return delta
+
+        with open(path, 'r', newline='') as f:
+            delta = diff_price_records(self._table, sorted_price_records(f, self.supplier_name))
+
+        table, index = self._table, self._index
+        with self._lock:
+            batch = table.new_batch(time.time())
+            for row, _ in delta.removed:
+                table.remove_row(row)
+            for row, record in delta.changed:
+                if table.sku(row) == record.sku and table.description(row) == record.description:
+                    table.update(row, record.unit_price, record.uom, record.supplier, batch)
+                    continue
+                table.remove_row(row)
+                new_row = table.append(*record, batch)
+                index.add(new_row, record.sku, record.description)
+            for record in delta.added:
+                new_row = table.append(*record, batch)
+                index.add(new_row, record.sku, record.description)
+        if table.dead_ratio() > COMPACT_DEAD_RATIO:
+            index.compact()
+
+        snap = snapshot_path(file_digest(path))
+        if delta.added or delta.removed or delta.changed or not os.path.exists(snap):
+            self._save_snapshot(snap, path, delta.file_skus)
+        delta.elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"Applied price file {path}: {delta.to_dict()}")
+        return delta
+
+    def _quote(self, row: int) -> PriceQuote:
+        sku, description, unit_price, uom, supplier, fetched_at = self._table.row(row)
+        return PriceQuote(
+            supplier=supplier,
+            sku=sku,
+            description=description,
+            unit_price=unit_price,
+            unit_of_measure=uom,
+            quantity_available=None,
+            lead_time_days=None,
+            quote_valid_until=None,
+            fetched_at=datetime.utcfromtimestamp(fetched_at)
+        )
+
+    def search_product(self, query: str, limit: Optional[int] = None) -> List[PriceQuote]:
+        """Search loaded prices, most relevant first."""
+        return [self._quote(row) for row in self._index.search(query, limit)]
+
+    def get_price(self, sku: str, quantity: int = 1) -> Optional[PriceQuote]:
+        """Get price from loaded data."""
+        row = self._table.find(sku)
+        return self._quote(row) if row is not None else None
+
+    def get_bulk_prices(self, skus: List[str]) -> Dict[str, PriceQuote]:
+        """Get multiple prices from loaded data."""
+        prices = {}
+        for sku in skus:
+            row = self._table.find(sku)
+            if row is not None:
+                prices[sku] = self._quote(row)
+        return prices
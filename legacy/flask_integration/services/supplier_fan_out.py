@@ -0,0 +1,279 @@
+"""
+Ohmni Estimate - Supplier Fan-Out
+Drop into: backend/services/supplier_fan_out.py
+
+Runs one call against every supplier adapter concurrently for
+SupplierPricingService: whatever answers arrive before the global deadline
+are returned, and the suppliers that timed out are listed. A slow
+distributor costs at most its timeout instead of stalling the whole quote.
+
+Each adapter has a SupplierHealth (supplier_resilience.py): rolling latency
+histograms per operation, hedged duplicates for reads still running at the
+adapter's p95, and a circuit breaker that skips an adapter after repeated
+failures and probes it back later. Calls go through the adapter's throttle
+(supplier_rate_limit.py).
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from backend.services.supplier_adapters import PriceQuote, SupplierAdapter, per_each_cost
+from backend.services.supplier_rate_limit import SupplierThrottled
+from backend.services.supplier_resilience import SupplierHealth
+from backend.services.supplier_transport import SupplierHTTPError, SupplierNotConfigured
+
+logger = logging.getLogger(__name__)
+
+# Fan-out limits (seconds); adapters may set their own `timeout`
+DEFAULT_DEADLINE_SECONDS = 5.0
+DEFAULT_ADAPTER_TIMEOUT_SECONDS = 3.0
+MAX_SUPPLIER_WORKERS = 16
+
+
+@dataclass
+class SupplierSearchResult:
+    """Quotes gathered from every adapter within the deadline."""
+    quotes: List[PriceQuote] = field(default_factory=list)
+    responded: List[str] = field(default_factory=list)
+    timed_out: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)  # circuit open
+    elapsed_ms: float = 0.0
+
+    @property
+    def best(self) -> Optional[PriceQuote]:
+        """Cheapest quote per each/foot; quotes with an unconvertible UOM are skipped."""
+        best, best_cost = None, None
+        for quote in self.quotes:
+            cost = per_each_cost(quote)
+            if cost is not None and (best_cost is None or cost < best_cost):
+                best, best_cost = quote, cost
+        return best
+
+    @property
+    def complete(self) -> bool:
+        return not self.timed_out and not self.skipped
+
+    def to_dict(self) -> Dict:
+        best = self.best
+        return {
+            'best': {
+                'supplier': best.supplier, 'sku': best.sku, 'unit_price': best.unit_price,
+                'unit_of_measure': best.unit_of_measure
+            } if best else None,
+            'quote_count': len(self.quotes),
+            'responded': self.responded,
+            'timed_out': self.timed_out,
+            'failed': self.failed,
+            'skipped': self.skipped,
+            'elapsed_ms': round(self.elapsed_ms, 1),
+        }
+
+
+
+_OK, _FAILED, _UNCONFIGURED = 'ok', 'failed', 'unconfigured'
+
+
+class _PendingCall:
+    """One adapter's call in a fan-out: the original request plus any hedge."""
+
+    __slots__ = ('futures', 'expires', 'hedge_at', 'error')
+
+    def __init__(self, future: Future, expires: float, hedge_at: Optional[float]):
+        self.futures: Dict[Future, bool] = {future: False}  # future -> is hedge
+        self.expires = expires
+        self.hedge_at = hedge_at
+        self.error: Optional[Exception] = None
+
+    def add(self, future: Future, hedged: bool):
+        self.futures[future] = hedged
+
+    def poll(self):
+        """(status, value or error, hedged) once decided, else None."""
+        for future, hedged in list(self.futures.items()):
+            if not future.done():
+                continue
+            del self.futures[future]
+            try:
+                return _OK, future.result(), hedged
+            except SupplierNotConfigured:
+                return _UNCONFIGURED, None, hedged
+            except Exception as e:
+                self.error = e  # the other attempt may still answer
+        if not self.futures and self.error is not None:
+            return _FAILED, self.error, False
+        return None
+
+    def cancel(self):
+        for future in self.futures:
+            future.cancel()
+
+
+class SupplierFanOut:
+    """Worker pool, per-adapter health and throttled calls shared by every fan-out."""
+
+    def __init__(
+        self,
+        adapters: List[SupplierAdapter],
+        deadline_seconds: float = DEFAULT_DEADLINE_SECONDS,
+        adapter_timeout_seconds: float = DEFAULT_ADAPTER_TIMEOUT_SECONDS
+    ):
+        self.adapters = adapters
+        self.deadline_seconds = deadline_seconds
+        self.adapter_timeout_seconds = adapter_timeout_seconds
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._health_by_name: Dict[str, SupplierHealth] = {}
+
+    def pool(self) -> ThreadPoolExecutor:
+        # Sized for every adapter to have a call in flight plus a straggler
+        # still running after its timeout, and for a throttled adapter's
+        # concurrency limit to grow during bulk refreshes.
+        with self._executor_lock:
+            if self._executor is None:
+                windows = sum(a.max_concurrency or 1 for a in self.adapters)
+                workers = min(MAX_SUPPLIER_WORKERS, max(4, 2 * len(self.adapters), windows))
+                self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='supplier')
+            return self._executor
+
+    def adapter_timeout(self, adapter: SupplierAdapter) -> float:
+        return adapter.timeout if adapter.timeout is not None else self.adapter_timeout_seconds
+
+    def call(self, adapter: SupplierAdapter, method, *args, block: bool = False):
+        """
+        Call an adapter method through its throttle. Interactive calls give up
+        (SupplierThrottled) if no slot frees within the adapter timeout; bulk
+        calls (block=True) queue for as long as it takes.
+        """
+        throttle = adapter.throttle
+        if throttle is None:
+            return method(*args)
+        return throttle.call(method, *args, timeout=None if block else self.adapter_timeout(adapter))
+
+    def throttle_stats(self) -> Dict[str, Dict]:
+        return {a.name: a.throttle.stats() for a in self.adapters if a.throttle is not None}
+
+    def health(self, adapter: SupplierAdapter) -> SupplierHealth:
+        health = self._health_by_name.get(adapter.name)
+        if health is None:
+            with self._executor_lock:
+                health = self._health_by_name.setdefault(adapter.name, SupplierHealth())
+        return health
+
+    def health_stats(self) -> Dict[str, Dict]:
+        """Breaker state, hedge counts and rolling latency percentiles per adapter."""
+        return {name: health.stats() for name, health in list(self._health_by_name.items())}
+
+    @staticmethod
+    def timed(health: SupplierHealth, operation: str, fn, *args):
+        # Recorded when the call finishes, even if the fan-out already gave up on it
+        start = time.perf_counter()
+        value = fn(*args)
+        health.record_latency(operation, (time.perf_counter() - start) * 1000)
+        return value
+
+    def run(
+        self,
+        call,
+        deadline_seconds: Optional[float] = None,
+        adapters: Optional[List[SupplierAdapter]] = None,
+        operation: str = 'call',
+        hedge: bool = True
+    ) -> Dict:
+        """
+        Run call(adapter) for every adapter (or the given ones) concurrently. Returns
+        {"results": {adapter: value}, "timed_out": [...], "failed": {...},
+         "skipped": [...], "elapsed_ms": ...}.
+
+        Adapters whose circuit is open are skipped. With hedge=True (call must be
+        idempotent), a call still running at the adapter's p95 for `operation`
+        gets a duplicate and the first answer wins. A timed-out call keeps
+        running on its worker; its result is discarded.
+        """
+        start = time.monotonic()
+        deadline = start + (self.deadline_seconds if deadline_seconds is None else deadline_seconds)
+        pool = self.pool()
+
+        pending: Dict[SupplierAdapter, _PendingCall] = {}
+        skipped = []
+        for adapter in (self.adapters if adapters is None else adapters):
+            health = self.health(adapter)
+            if not health.breaker.allow():
+                skipped.append(adapter.name)
+                continue
+            health.count_call()
+            delay = health.hedge_delay(operation) if hedge else None
+            pending[adapter] = _PendingCall(
+                pool.submit(self.timed, health, operation, call, adapter),
+                expires=min(deadline, start + self.adapter_timeout(adapter)),
+                hedge_at=start + delay if delay is not None else None
+            )
+
+        results, timed_out, failed = {}, [], {}
+        while pending:
+            now = time.monotonic()
+            for adapter, call_state in list(pending.items()):
+                health = self.health(adapter)
+                outcome = call_state.poll()
+                if outcome is None:
+                    if call_state.expires <= now:
+                        call_state.cancel()
+                        del pending[adapter]
+                        timed_out.append(adapter.name)
+                        health.breaker.record_failure()
+                    elif call_state.hedge_at is not None and call_state.hedge_at <= now:
+                        call_state.hedge_at = None
+                        if health.try_hedge():
+                            call_state.add(pool.submit(self.timed, health, operation, call, adapter), hedged=True)
+                    continue
+
+                del pending[adapter]
+                call_state.cancel()
+                status, value, hedged = outcome
+                if status == _OK:
+                    results[adapter] = value
+                    health.breaker.record_success()
+                    if hedged:
+                        health.count_hedge_win()
+                elif status == _FAILED:
+                    # Log error but continue with other adapters
+                    logger.warning(f"Error from {adapter.name}: {value}")
+                    failed[adapter.name] = str(value)
+                    # 429s and local throttling mean busy, not down; 503s count
+                    rate_limited = isinstance(value, SupplierHTTPError) and value.status == 429
+                    if rate_limited or isinstance(value, SupplierThrottled):
+                        health.breaker.record_inconclusive()
+                    else:
+                        health.breaker.record_failure()
+                else:
+                    # Adapter has no credentials; nothing to report
+                    health.breaker.record_inconclusive()
+
+            if not pending:
+                break
+            wake = min(min(p.expires, p.hedge_at or p.expires) for p in pending.values())
+            futures = [f for p in pending.values() for f in p.futures]
+            wait(futures, timeout=max(0.0, wake - time.monotonic()), return_when=FIRST_COMPLETED)
+
+        if timed_out:
+            logger.warning(f"Suppliers timed out: {', '.join(timed_out)}")
+        if skipped:
+            logger.info(f"Suppliers skipped (circuit open): {', '.join(skipped)}")
+        return {
+            'results': results,
+            'timed_out': timed_out,
+            'failed': failed,
+            'skipped': skipped,
+            'elapsed_ms': (time.monotonic() - start) * 1000,
+        }
+
+    def shutdown(self):
+        """Stop the worker pool (waits for in-flight adapter calls)."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
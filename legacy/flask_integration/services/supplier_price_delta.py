@@ -0,0 +1,174 @@
+"""
+Ohmni Estimate - Supplier Price File Deltas
+Drop into: backend/services/supplier_price_delta.py
+
+Weekly supplier files are full exports where only a few percent of SKUs
+change. Instead of reloading, the new file is diffed against the loaded
+SupplierPriceTable in one streaming sorted merge:
+
+    new file  -> sorted runs of DELTA_RUN_ROWS (spilled to temp files)
+              -> heapq.merge by lowercase SKU (the table's order; the last
+                 duplicate in the file wins, as in a full load)
+    table     -> rows() in the same order
+    merge     -> added / removed / changed; unchanged rows are only counted
+
+Only the delta is held in memory. CSVPriceAdapter.apply_price_file applies
+it to the table and index, and SupplierPricingService.ingest_price_file
+re-prices the PricingItems mapped to changed SKUs.
+"""
+
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+import csv
+import heapq
+import itertools
+import pickle
+import tempfile
+
+
+DELTA_RUN_ROWS = 50000  # file rows sorted in memory per run
+SPILL_BLOCK = 1000
+
+
+class PriceRecord(NamedTuple):
+    sku: str
+    description: str
+    unit_price: float
+    uom: str
+    supplier: str
+
+
+@dataclass
+class PriceFileDelta:
+    """Changes between the loaded prices and a new price file."""
+    added: List[PriceRecord] = field(default_factory=list)
+    removed: List[Tuple[int, str]] = field(default_factory=list)       # (table row, sku)
+    changed: List[Tuple[int, PriceRecord]] = field(default_factory=list)  # (old table row, new record)
+    unchanged: int = 0
+    file_skus: int = 0
+    full_load: bool = False  # nothing was loaded to diff against
+    elapsed_ms: float = 0.0
+
+    @property
+    def changed_skus(self) -> List[str]:
+        """SKUs whose price may differ now (added or changed)."""
+        return [r.sku for r in self.added] + [r.sku for _, r in self.changed]
+
+    def to_dict(self) -> Dict:
+        return {
+            'added': len(self.added),
+            'removed': len(self.removed),
+            'changed': len(self.changed),
+            'unchanged': self.unchanged,
+            'file_skus': self.file_skus,
+            'full_load': self.full_load,
+            'elapsed_ms': round(self.elapsed_ms, 1),
+        }
+
+
+def _key(sku: str) -> bytes:
+    # Same ordering as SupplierPriceTable._key
+    return sku.encode('utf-8').lower()
+
+
+# =============================================================================
+# SORTED FILE STREAM
+# =============================================================================
+
+def _spill(run: List[Tuple]) -> BinaryIO:
+    # Our own temp file, so pickle is safe; far faster to read back than csv
+    f = tempfile.TemporaryFile()
+    for i in range(0, len(run), SPILL_BLOCK):
+        pickle.dump(run[i:i + SPILL_BLOCK], f, pickle.HIGHEST_PROTOCOL)
+    f.seek(0)
+    return f
+
+
+def _read_run(f: BinaryIO) -> Iterator[Tuple]:
+    while True:
+        try:
+            block = pickle.load(f)
+        except EOFError:
+            return
+        yield from block
+
+
+def sorted_price_records(
+    f: TextIO,
+    default_supplier: str,
+    run_rows: int = DELTA_RUN_ROWS
+) -> Iterator[Tuple[bytes, PriceRecord]]:
+    """
+    (sort key, record) for each SKU of a price CSV in SKU order; the last
+    row for a SKU wins. Memory is bounded by run_rows; longer files are
+    sorted in runs spilled to temp files and merged.
+    """
+    reader = csv.reader(f)
+    header = next(reader, [])
+    sku_i, desc_i, price_i = header.index('sku'), header.index('description'), header.index('unit_price')
+    uom_i = header.index('uom') if 'uom' in header else None
+    supplier_i = header.index('supplier') if 'supplier' in header else None
+    seq = itertools.count()
+    runs: List = []
+    try:
+        while True:
+            # (key, seq, ...) tuples order correctly without a key function
+            run = [
+                (_key(row[sku_i]), next(seq), row[sku_i], row[desc_i], float(row[price_i]),
+                 (row[uom_i] if uom_i is not None else '') or 'EA',
+                 (row[supplier_i] if supplier_i is not None else '') or default_supplier)
+                for row in itertools.islice(reader, run_rows)
+            ]
+            if not run:
+                break
+            run.sort()
+            runs.append(run)
+            if len(runs) > 1:
+                runs = [_spill(r) if isinstance(r, list) else r for r in runs]
+
+        streams = [iter(r) if isinstance(r, list) else _read_run(r) for r in runs]
+        previous = None
+        for item in heapq.merge(*streams):
+            if previous is not None and previous[0] != item[0]:
+                yield previous[0], PriceRecord(*previous[2:])
+            previous = item
+        if previous is not None:
+            yield previous[0], PriceRecord(*previous[2:])
+    finally:
+        for run in runs:
+            if not isinstance(run, list):
+                run.close()
+
+
+# =============================================================================
+# MERGE
+# =============================================================================
+
+def diff_price_records(table, new_records: Iterator[Tuple[bytes, PriceRecord]]) -> PriceFileDelta:
+    """Merge a SupplierPriceTable's rows against sorted_price_records output."""
+    delta = PriceFileDelta()
+    old_rows = iter(table.rows())
+    new_records = iter(new_records)
+    old: Optional[int] = next(old_rows, None)
+    old_key = table.key(old) if old is not None else None
+    new_key, new = next(new_records, (None, None))
+
+    while old is not None or new is not None:
+        if new is None or (old is not None and old_key < new_key):
+            delta.removed.append((old, table.sku(old)))
+            old = next(old_rows, None)
+            old_key = table.key(old) if old is not None else None
+            continue
+
+        delta.file_skus += 1
+        if old is None or new_key < old_key:
+            delta.added.append(new)
+        else:
+            if table.matches(old, *new):
+                delta.unchanged += 1
+            else:
+                delta.changed.append((old, new))
+            old = next(old_rows, None)
+            old_key = table.key(old) if old is not None else None
+        new_key, new = next(new_records, (None, None))
+    return delta
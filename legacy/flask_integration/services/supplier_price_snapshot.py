@@ -0,0 +1,204 @@
+"""
+Ohmni Estimate - Supplier Price Snapshots
+Drop into: backend/services/supplier_price_snapshot.py
+
+Parsing and indexing a large distributor CSV takes tens of seconds, and every
+gunicorn worker used to do it again. The parsed SupplierPriceTable and its
+SupplierCatalogIndex are column arrays already, so they are written once to a
+binary snapshot named after the CSV's SHA-256; later processes mmap the file
+and use the columns in place (memoryview casts, no parsing, no copy). The
+mapping is read-only and file-backed, so the pages sit once in the OS page
+cache and are shared by every worker. The first write to a loaded table
+copies its columns into private arrays (see SupplierPriceTable._thaw).
+
+Layout (native byte order; a snapshot from another platform is ignored):
+
+    MAGIC | u64 header length | JSON header | padding | sections...
+
+The header lists each section's typecode, offset and length plus small
+metadata (interned strings, load timestamps). Sections are 8-byte aligned.
+
+A snapshot decides supplier prices, so it is only written to or read from a
+directory (and file) owned by this user or root and not writable by group or
+others. The default directory lives under the app's instance folder;
+SUPPLIER_SNAPSHOT_DIR overrides it.
+"""
+
+from typing import Dict, Optional, Tuple
+import hashlib
+import json
+import logging
+import mmap
+import os
+import stat
+import struct
+import sys
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+SNAPSHOT_VERSION = 1
+MAGIC = b'OHMNIPS1'
+SNAPSHOT_SUFFIX = '.prices'
+SNAPSHOT_KEEP = 4  # newest snapshots kept per directory
+ALIGN = 8
+HASH_BLOCK = 1 << 20
+
+# <app root>/instance/price-snapshots (Flask's default instance folder for backend/)
+DEFAULT_SNAPSHOT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'instance', 'price-snapshots'
+)
+
+
+def snapshot_dir() -> str:
+    return os.getenv('SUPPLIER_SNAPSHOT_DIR', DEFAULT_SNAPSHOT_DIR)
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a price file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def snapshot_path(digest: str, directory: Optional[str] = None) -> str:
+    return os.path.join(directory or snapshot_dir(), digest[:32] + SNAPSHOT_SUFFIX)
+
+
+def _trusted(path: str) -> bool:
+    """Owned by us (or root) and not writable by anyone else."""
+    if not hasattr(os, 'geteuid'):
+        return True  # no POSIX ownership to check
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    return st.st_uid in (os.geteuid(), 0) and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _platform() -> Dict:
+    return {'byteorder': sys.byteorder, 'L': struct.calcsize('L'), 'I': struct.calcsize('I')}
+
+
+def _pad(n: int) -> int:
+    return -n % ALIGN
+
+
+# =============================================================================
+# WRITE / LOAD
+# =============================================================================
+
+def save_snapshot(path: str, sections: Dict[str, object], meta: Dict):
+    """
+    Write sections (arrays or bytearrays, by name) and JSON-able metadata.
+    Written to a temp file and renamed, so readers never see a partial file.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, mode=0o755, exist_ok=True)
+    if not _trusted(directory):
+        logger.warning(f"Not writing price snapshot: {directory} is writable by other users")
+        return
+
+    layout, offset = {}, 0
+    for name, data in sections.items():
+        size = memoryview(data).nbytes
+        layout[name] = {'typecode': getattr(data, 'typecode', 'B'), 'offset': offset, 'length': size}
+        offset += size + _pad(size)
+
+    header = json.dumps({
+        'version': SNAPSHOT_VERSION,
+        'platform': _platform(),
+        'sections': layout,
+        'meta': meta,
+    }).encode('utf-8')
+    start = len(MAGIC) + 8 + len(header)
+    start += _pad(start)
+
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<Q', len(header)))
+            f.write(header)
+            f.write(b'\0' * (start - f.tell()))
+            for name, data in sections.items():
+                raw = memoryview(data).cast('B')
+                f.write(raw)
+                f.write(b'\0' * _pad(len(raw)))
+        os.chmod(tmp, 0o644)  # readable by workers running as other users
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+    prune_snapshots(directory)
+
+
+def load_snapshot(path: str) -> Optional[Tuple[Dict[str, memoryview], Dict]]:
+    """
+    Map a snapshot read-only. Returns ({name: memoryview}, meta), or None if
+    the file is missing, from another format version or platform, or damaged.
+    The mapping stays open for as long as a view of it is alive. Snapshots
+    in a directory or file other users could have written are ignored.
+    """
+    if not (_trusted(os.path.dirname(path)) and _trusted(path)):
+        if os.path.exists(path):
+            logger.warning(f"Ignoring price snapshot {path}: writable by other users")
+        return None
+    try:
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        if mapped[:len(MAGIC)] != MAGIC:
+            raise ValueError('bad magic')
+        (header_len,) = struct.unpack('<Q', mapped[len(MAGIC):len(MAGIC) + 8])
+        header_start = len(MAGIC) + 8
+        header = json.loads(mapped[header_start:header_start + header_len])
+        if header['version'] != SNAPSHOT_VERSION or header['platform'] != _platform():
+            logger.info(f"Ignoring price snapshot {path}: different version or platform")
+            mapped.close()
+            return None
+
+        start = header_start + header_len
+        start += _pad(start)
+        view = memoryview(mapped)
+        sections = {}
+        for name, spec in header['sections'].items():
+            begin = start + spec['offset']
+            if begin + spec['length'] > len(mapped):
+                raise ValueError(f"section {name} truncated")
+            sections[name] = view[begin:begin + spec['length']].cast(spec['typecode'])
+    except (ValueError, KeyError, struct.error) as e:
+        logger.warning(f"Ignoring damaged price snapshot {path}: {e}")
+        return None
+
+    try:
+        os.utime(path)  # recently used: keep it through prune_snapshots
+    except OSError:
+        pass
+    return sections, header['meta']
+
+
+def prune_snapshots(directory: str, keep: int = SNAPSHOT_KEEP):
+    """Delete all but the newest `keep` snapshots (older price files)."""
+    try:
+        paths = [
+            os.path.join(directory, name) for name in os.listdir(directory)
+            if name.endswith(SNAPSHOT_SUFFIX)
+        ]
+        paths.sort(key=os.path.getmtime, reverse=True)
+        for path in paths[keep:]:
+            os.unlink(path)
+    except OSError as e:
+        logger.debug(f"Snapshot prune skipped: {e}")
@@ -0,0 +1,286 @@
+"""
+Ohmni Estimate - Compact Supplier Price Table
+Drop into: backend/services/supplier_price_table.py
+
+Column store behind CSVPriceAdapter. A PriceQuote dataclass per row (plus a
+datetime each) costs ~450 bytes before the strings; a 500k-row distributor
+file took gigabytes once indexed. Here a row is:
+
+    sku, description   UTF-8 bytes in two shared blobs + offset arrays
+    unit price         array('d')
+    uom, supplier      array('H') ids into one interned string table
+    fetched_at         array('H') id of the load batch (one timestamp per file)
+
+SKU lookups bisect `_order`, row ids sorted by lowercase SKU, rebuilt lazily
+after appends; duplicate SKUs are resolved there (the last row loaded wins),
+so bulk loads never look anything up. PriceQuote objects are only built on
+lookup (see CSVPriceAdapter._quote).
+
+The columns can be saved to and mapped back from a snapshot file
+(supplier_price_snapshot.py). A mapped table reads straight from read-only
+memoryviews and copies them into arrays on its first write.
+"""
+
+from typing import Dict, Iterator, List, Optional, Tuple
+from array import array
+import sys
+import threading
+
+
+class SupplierPriceTable:
+    """Append-only price rows with tombstones; row ids are stable."""
+
+    def __init__(self):
+        self._sku_blob = bytearray()
+        self._sku_off = array('L', [0])
+        self._desc_blob = bytearray()
+        self._desc_off = array('L', [0])
+        self.prices = array('d')
+        self._uom = array('H')
+        self._supplier = array('H')
+        self._batch = array('H')
+        self._live = bytearray()
+        self._dead = 0
+
+        self._strings: List[str] = []
+        self._string_ids = {}
+        self._batch_times: List[float] = []
+
+        self._order = array('L')
+        self._ordered_rows = 0  # rows [0, n) are covered by _order
+        self._dirty = False
+        self._frozen = False
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------------
+    # SNAPSHOTS
+    # -------------------------------------------------------------------------
+
+    _COLUMNS = ('_sku_blob', '_sku_off', '_desc_blob', '_desc_off', 'prices',
+                '_uom', '_supplier', '_batch', '_live', '_order')
+
+    def snapshot_sections(self) -> Tuple[Dict[str, object], Dict]:
+        """(columns by name, JSON-able metadata) for save_snapshot."""
+        self._refresh()
+        sections = {name.lstrip('_'): getattr(self, name) for name in self._COLUMNS}
+        meta = {'strings': self._strings, 'batch_times': self._batch_times, 'dead': self._dead}
+        return sections, meta
+
+    @classmethod
+    def from_snapshot(cls, sections: Dict[str, memoryview], meta: Dict) -> 'SupplierPriceTable':
+        table = cls()
+        for name in cls._COLUMNS:
+            setattr(table, name, sections[name.lstrip('_')])
+        table._strings = [sys.intern(s) for s in meta['strings']]
+        table._string_ids = {s: i for i, s in enumerate(table._strings)}
+        table._batch_times = list(meta['batch_times'])
+        table._dead = meta['dead']
+        table._ordered_rows = len(table._live)
+        table._frozen = True
+        return table
+
+    def _thaw(self):
+        """Copy mapped columns into private arrays before the first write."""
+        if not self._frozen:
+            return
+        for name in self._COLUMNS:
+            view = getattr(self, name)
+            if view.format == 'B':
+                column = bytearray(view)
+            else:
+                column = array(view.format)
+                column.frombytes(view.cast('B'))
+            setattr(self, name, column)
+        self._frozen = False
+
+    # -------------------------------------------------------------------------
+    # WRITES
+    # -------------------------------------------------------------------------
+
+    def _intern(self, value: str) -> int:
+        sid = self._string_ids.get(value)
+        if sid is None:
+            sid = len(self._strings)
+            self._strings.append(sys.intern(value))
+            self._string_ids[value] = sid
+        return sid
+
+    def new_batch(self, fetched_at: float) -> int:
+        """Register a load (epoch seconds); rows appended with it share the timestamp."""
+        self._batch_times.append(fetched_at)
+        return len(self._batch_times) - 1
+
+    def append(self, sku: str, description: str, price: float, uom: str, supplier: str, batch: int) -> int:
+        """Add a row and return its id. A SKU already present is superseded on the next lookup."""
+        # Under the lock so a concurrent _refresh sees the row whole or not at all
+        with self._lock:
+            self._thaw()
+            self._sku_blob += sku.encode('utf-8')
+            self._sku_off.append(len(self._sku_blob))
+            self._desc_blob += (description or '').encode('utf-8')
+            self._desc_off.append(len(self._desc_blob))
+            self.prices.append(price)
+            self._uom.append(self._intern(uom))
+            self._supplier.append(self._intern(supplier))
+            self._batch.append(batch)
+            self._live.append(1)
+            self._dirty = True
+            return len(self._live) - 1
+
+    def update(self, row: int, price: float, uom: str, supplier: str, batch: int):
+        """Re-price a row in place (same SKU and description)."""
+        with self._lock:
+            self._thaw()
+            self.prices[row] = price
+            self._uom[row] = self._intern(uom)
+            self._supplier[row] = self._intern(supplier)
+            self._batch[row] = batch
+
+    def remove_row(self, row: int):
+        with self._lock:
+            if self._live[row]:
+                self._thaw()
+                self._live[row] = 0
+                self._dead += 1
+                self._dirty = True
+
+    # -------------------------------------------------------------------------
+    # READS
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        self._refresh()
+        return len(self._order)
+
+    @property
+    def row_count(self) -> int:
+        """Rows ever appended (live or not); row ids are below this."""
+        return len(self._live)
+
+    def is_live(self, row: int) -> bool:
+        return bool(self._live[row])
+
+    def _sku_bytes(self, row: int) -> bytes:
+        return bytes(self._sku_blob[self._sku_off[row]:self._sku_off[row + 1]])
+
+    def sku(self, row: int) -> str:
+        return self._sku_bytes(row).decode('utf-8')
+
+    def description(self, row: int) -> str:
+        return bytes(self._desc_blob[self._desc_off[row]:self._desc_off[row + 1]]).decode('utf-8')
+
+    def description_length(self, row: int) -> int:
+        return self._desc_off[row + 1] - self._desc_off[row]
+
+    def row(self, row: int) -> Tuple[str, str, float, str, str, float]:
+        """(sku, description, unit_price, uom, supplier, fetched_at epoch)"""
+        return (
+            self.sku(row), self.description(row), self.prices[row],
+            self._strings[self._uom[row]], self._strings[self._supplier[row]],
+            self._batch_times[self._batch[row]],
+        )
+
+    def rows(self) -> Iterator[int]:
+        """Live row ids in SKU order."""
+        self._refresh()
+        return iter(self._order)
+
+    def _key(self, row: int) -> bytes:
+        return self._sku_bytes(row).lower()
+
+    key = _key  # sort key of rows(): lowercase UTF-8 SKU
+
+    def _refresh(self):
+        """Rebuild the SKU order; later rows win over earlier ones with the same SKU."""
+        if not self._dirty:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            live = self._live
+            key = self._key
+            n = len(live)
+            new = sorted(
+                (r for r in range(self._ordered_rows, n) if live[r]),
+                key=lambda r: (key(r), r)
+            )
+            base = array('L', (r for r in self._order if live[r]))
+            if base and len(new) * 16 > len(base):
+                # Many new rows: one sort beats bisecting each into place
+                new = sorted(list(base) + new, key=lambda r: (key(r), r))
+                base = array('L')
+            self._order = self._splice(base, new)
+            self._ordered_rows = n
+            self._dirty = False
+
+    def _splice(self, base: array, new: List[int]) -> array:
+        """Merge sorted new rows into the sorted base order by bisection."""
+        live = self._live
+        key = self._key
+        order = array('L')
+        i = 0
+        for r in new:
+            k = key(r)
+            pos = self._bisect(base, k, i)
+            order.extend(base[i:pos])
+            i = pos
+            if i < len(base) and key(base[i]) == k:
+                # Same SKU loaded again: keep the newer row
+                live[base[i]] = 0
+                self._dead += 1
+                i += 1
+            if order and key(order[-1]) == k:
+                live[order[-1]] = 0
+                self._dead += 1
+                order[-1] = r
+            else:
+                order.append(r)
+        order.extend(base[i:])
+        return order
+
+    def _bisect(self, order: array, key: bytes, lo: int = 0) -> int:
+        hi = len(order)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(order[mid]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def find(self, sku: str) -> Optional[int]:
+        """Row id for a SKU (case-insensitive), or None."""
+        self._refresh()
+        key = sku.encode('utf-8').lower()
+        order = self._order
+        i = self._bisect(order, key)
+        if i < len(order) and self._key(order[i]) == key:
+            return order[i]
+        return None
+
+    def prefix(self, prefix: str, limit: int) -> Iterator[Tuple[int, bool]]:
+        """(row, exact) for up to `limit` SKUs starting with prefix, in SKU order."""
+        self._refresh()
+        key = prefix.encode('utf-8').lower()
+        order = self._order
+        i = self._bisect(order, key)
+        end = min(len(order), i + limit)
+        while i < end:
+            k = self._key(order[i])
+            if not k.startswith(key):
+                break
+            yield order[i], k == key
+            i += 1
+
+    def matches(self, row: int, sku: str, description: str, price: float, uom: str, supplier: str) -> bool:
+        """True if the row holds exactly these values (cheapest checks first)."""
+        return (
+            self.prices[row] == price
+            and self._strings[self._uom[row]] == uom
+            and self._strings[self._supplier[row]] == supplier
+            and self._desc_blob[self._desc_off[row]:self._desc_off[row + 1]] == description.encode('utf-8')
+            and self._sku_bytes(row) == sku.encode('utf-8')
+        )
+
+    def dead_ratio(self) -> float:
+        return self._dead / len(self._live) if self._live else 0.0
@@ -4,213 +4,37 @@ Supplier Pricing Service - Scaffolding for Real-Time Material Pricing
 This service provides an abstraction layer for fetching live pricing from
 electrical distributors like Graybar, WESCO, Rexel, CED, etc.
 
-STATUS: Scaffolding only. Requires API credentials from suppliers.
+STATUS: Graybar/WESCO adapters (supplier_adapters.py) speak a typical B2B
+REST pattern over a pooled keep-alive transport (supplier_transport.py);
+they need API credentials from the suppliers. benchmarks/supplier_stub_server.py
+serves the same endpoints locally for testing. Supplier price files are served
+by CSVPriceAdapter (supplier_csv_adapter.py).
+
+Adapters are queried concurrently (supplier_fan_out.py): get_best_price /
+search_suppliers fan a query out to every adapter on a thread pool and return
+whatever quotes arrive before the global deadline, listing the suppliers that
+timed out. Each adapter has a SupplierHealth (supplier_resilience.py) for
+hedging and circuit breaking; see health_stats().
+
+Adapter answers go through a SupplierQuoteCache (supplier_quote_cache.py):
+fresh entries skip the adapter entirely, stale ones are served while a
+background refresh runs. Bulk pricing and catalog refreshes are in
+supplier_bulk_refresh.py.
 """
 
+import logging
 import os
-from abc import ABC, abstractmethod
-from typing import Optional, List, Dict
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+from typing import Dict, List, Optional
 
+from backend.services.supplier_adapters import GraybarAdapter, PriceQuote, SupplierAdapter, WESCOAdapter
+from backend.services.supplier_bulk_refresh import fetch_bulk_prices, refresh_database_prices
+from backend.services.supplier_csv_adapter import CSVPriceAdapter
+from backend.services.supplier_fan_out import (
+    DEFAULT_ADAPTER_TIMEOUT_SECONDS, DEFAULT_DEADLINE_SECONDS, SupplierFanOut, SupplierSearchResult
+)
+from backend.services.supplier_quote_cache import MISS, SupplierQuoteCache, price_key, search_key
 
-@dataclass
-class PriceQuote:
-    """Represents a price quote from a supplier."""
-    supplier: str
-    sku: str
-    description: str
-    unit_price: float
-    unit_of_measure: str  # EA, C (100), M (1000), FT
-    quantity_available: Optional[int]
-    lead_time_days: Optional[int]
-    quote_valid_until: Optional[datetime]
-    fetched_at: datetime
-
-
-class SupplierAdapter(ABC):
-    """Abstract base class for supplier API adapters."""
-
-    @abstractmethod
-    def search_product(self, query: str) -> List[PriceQuote]:
-        """Search for products by description or part number."""
-        pass
-
-    @abstractmethod
-    def get_price(self, sku: str, quantity: int = 1) -> Optional[PriceQuote]:
-        """Get current price for a specific SKU."""
-        pass
-
-    @abstractmethod
-    def get_bulk_prices(self, skus: List[str]) -> Dict[str, PriceQuote]:
-        """Get prices for multiple SKUs at once."""
-        pass
-
-
-# =============================================================================
-# GRAYBAR ADAPTER
-# =============================================================================
-
-class GraybarAdapter(SupplierAdapter):
-    """
-    Graybar Electric API Adapter
-
-    To get API access:
-    1. Contact your Graybar account rep
-    2. Request API access through Graybar's eBusiness team
-    3. They'll provide OAuth credentials
-
-    API Documentation (requires login):
-    https://www.graybar.com/store/en/gb/cms/customer-solutions/ecommerce-solutions
-
-    Endpoints (typical B2B pattern):
-    - POST /oauth/token - Get access token
-    - GET /api/products/search - Search products
-    - GET /api/products/{sku}/price - Get price
-    - POST /api/quotes - Request quote for bulk items
-    """
-
-    def __init__(self):
-        self.base_url = os.getenv("GRAYBAR_API_URL", "https://api.graybar.com")
-        self.client_id = os.getenv("GRAYBAR_CLIENT_ID")
-        self.client_secret = os.getenv("GRAYBAR_CLIENT_SECRET")
-        self.account_number = os.getenv("GRAYBAR_ACCOUNT_NUMBER")
-        self._token = None
-        self._token_expires = None
-
-    def _get_token(self) -> str:
-        """Get or refresh OAuth token."""
-        # TODO: Implement OAuth flow
-        # if self._token and self._token_expires > datetime.now():
-        #     return self._token
-        #
-        # response = requests.post(f"{self.base_url}/oauth/token", data={
-        #     "grant_type": "client_credentials",
-        #     "client_id": self.client_id,
-        #     "client_secret": self.client_secret
-        # })
-        # self._token = response.json()["access_token"]
-        # self._token_expires = datetime.now() + timedelta(hours=1)
-        # return self._token
-        raise NotImplementedError("Graybar API credentials not configured")
-
-    def search_product(self, query: str) -> List[PriceQuote]:
-        """Search Graybar catalog."""
-        # TODO: Implement search
-        # token = self._get_token()
-        # response = requests.get(
-        #     f"{self.base_url}/api/products/search",
-        #     headers={"Authorization": f"Bearer {token}"},
-        #     params={"q": query, "account": self.account_number}
-        # )
-        raise NotImplementedError("Graybar API not configured")
-
-    def get_price(self, sku: str, quantity: int = 1) -> Optional[PriceQuote]:
-        """Get Graybar price for SKU."""
-        raise NotImplementedError("Graybar API not configured")
-
-    def get_bulk_prices(self, skus: List[str]) -> Dict[str, PriceQuote]:
-        """Get Graybar prices for multiple SKUs."""
-        raise NotImplementedError("Graybar API not configured")
-
-
-# =============================================================================
-# WESCO ADAPTER
-# =============================================================================
-
-class WESCOAdapter(SupplierAdapter):
-    """
-    WESCO International API Adapter
-
-    To get API access:
-    1. Contact WESCO Digital Solutions team
-    2. Request API integration through your account manager
-    3. They use a similar OAuth/REST pattern
-
-    WESCO also offers:
-    - EDI integration (traditional)
-    - Punch-out catalog (for procurement systems)
-    - CSV price file updates (weekly)
-
-    The CSV option might be easiest for initial integration.
-    """
-
-    def __init__(self):
-        self.base_url = os.getenv("WESCO_API_URL", "https://api.wesco.com")
-        self.api_key = os.getenv("WESCO_API_KEY")
-        self.account_number = os.getenv("WESCO_ACCOUNT_NUMBER")
-
-    def search_product(self, query: str) -> List[PriceQuote]:
-        raise NotImplementedError("WESCO API not configured")
-
-    def get_price(self, sku: str, quantity: int = 1) -> Optional[PriceQuote]:
-        raise NotImplementedError("WESCO API not configured")
-
-    def get_bulk_prices(self, skus: List[str]) -> Dict[str, PriceQuote]:
-        raise NotImplementedError("WESCO API not configured")
-
-
-# =============================================================================
-# CSV IMPORT ADAPTER (SIMPLEST APPROACH)
-# =============================================================================
-
-class CSVPriceAdapter(SupplierAdapter):
-    """
-    CSV Price File Adapter
-
-    This is the simplest approach - most suppliers can provide weekly
-    or monthly price files in CSV format. Upload them and the system
-    updates automatically.
-
-    Expected CSV format:
-    sku,description,unit_price,uom,category
-    "EMT-075","3/4\" EMT Conduit 10ft",18.45,EA,CONDUIT
-    "THHN-6-BLK","#6 THHN Copper Black 500ft",450.00,EA,WIRE
-
-    Usage:
-    1. Get CSV price file from supplier
-    2. Upload to /api/pricing/upload-csv
-    3. Prices are updated in database
-    """
-
-    def __init__(self, csv_path: Optional[str] = None):
-        self.csv_path = csv_path
-        self._prices: Dict[str, PriceQuote] = {}
-
-    def load_from_csv(self, csv_path: str):
-        """Load prices from CSV file."""
-        import csv
-
-        with open(csv_path, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                self._prices[row['sku']] = PriceQuote(
-                    supplier="CSV Import",
-                    sku=row['sku'],
-                    description=row['description'],
-                    unit_price=float(row['unit_price']),
-                    unit_of_measure=row.get('uom', 'EA'),
-                    quantity_available=None,
-                    lead_time_days=None,
-                    quote_valid_until=None,
-                    fetched_at=datetime.now()
-                )
-
-    def search_product(self, query: str) -> List[PriceQuote]:
-        """Search loaded prices."""
-        query = query.lower()
-        return [
-            p for p in self._prices.values()
-            if query in p.sku.lower() or query in p.description.lower()
-        ]
-
-    def get_price(self, sku: str, quantity: int = 1) -> Optional[PriceQuote]:
-        """Get price from loaded data."""
-        return self._prices.get(sku)
-
-    def get_bulk_prices(self, skus: List[str]) -> Dict[str, PriceQuote]:
-        """Get multiple prices from loaded data."""
-        return {sku: self._prices[sku] for sku in skus if sku in self._prices}
+logger = logging.getLogger(__name__)
 
 
 # =============================================================================
@@ -227,8 +51,15 @@ class SupplierPricingService:
     3. Database fallback (our pricing_database.json)
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        deadline_seconds: float = DEFAULT_DEADLINE_SECONDS,
+        adapter_timeout_seconds: float = DEFAULT_ADAPTER_TIMEOUT_SECONDS,
+        quote_cache: Optional[SupplierQuoteCache] = None
+    ):
         self.adapters: List[SupplierAdapter] = []
+        self.quote_cache = quote_cache if quote_cache is not None else SupplierQuoteCache()
+        self.fan_out = SupplierFanOut(self.adapters, deadline_seconds, adapter_timeout_seconds)
         self._init_adapters()
 
     def _init_adapters(self):
@@ -248,56 +79,164 @@ class SupplierPricingService:
                 pass
 
         # CSV is always available as fallback
-        self.adapters.append(CSVPriceAdapter())
+        try:
+            self.adapters.append(CSVPriceAdapter(os.getenv("SUPPLIER_CSV_PATH")))
+        except Exception as e:
+            logger.warning(f"Supplier price file not loaded: {e}")
+            self.adapters.append(CSVPriceAdapter())
 
-    def get_best_price(self, query: str) -> Optional[PriceQuote]:
+    # -------------------------------------------------------------------------
+    # SUPPLIER QUERIES
+    # -------------------------------------------------------------------------
+
+    def search_suppliers(self, query: str, deadline_seconds: Optional[float] = None) -> SupplierSearchResult:
         """
-        Get the best available price from all suppliers.
+        Search every supplier concurrently.
 
         Args:
             query: Product description or SKU
+            deadline_seconds: Overall budget (defaults to fan_out.deadline_seconds)
 
         Returns:
-            Lowest price quote found, or None
+            Quotes that arrived in time plus the suppliers that timed out or failed
         """
-        all_quotes = []
-
+        return self._cached_fan_out(
+            lambda adapter: search_key(adapter.name, query),
+            lambda adapter: lambda: self.fan_out.call(adapter, adapter.search_product, query),
+            deadline_seconds,
+            'search'
+        )
+
+    def get_price(
+        self,
+        sku: str,
+        quantity: int = 1,
+        deadline_seconds: Optional[float] = None
+    ) -> SupplierSearchResult:
+        """Price one SKU at every supplier concurrently (cached per supplier/sku/quantity)."""
+        return self._cached_fan_out(
+            lambda adapter: price_key(adapter.name, sku, quantity),
+            lambda adapter: lambda: self.fan_out.call(adapter, adapter.get_price, sku, quantity),
+            deadline_seconds,
+            'price'
+        )
+
+    def _cached_fan_out(
+        self,
+        key_for,
+        loader_for,
+        deadline_seconds: Optional[float],
+        operation: str
+    ) -> SupplierSearchResult:
+        """Answer from the quote cache where possible; fan out only the misses."""
+        cached, missing = {}, []
         for adapter in self.adapters:
-            try:
-                quotes = adapter.search_product(query)
-                all_quotes.extend(quotes)
-            except NotImplementedError:
-                continue
-            except Exception as e:
-                # Log error but continue with other adapters
-                print(f"Error from {adapter.__class__.__name__}: {e}")
-                continue
-
-        if not all_quotes:
-            return None
-
-        # Return lowest price
-        return min(all_quotes, key=lambda q: q.unit_price)
-
-    def refresh_database_prices(self, sku_mapping: Dict[str, str]) -> Dict[str, float]:
+            value = self.quote_cache.get(key_for(adapter), refresh=loader_for(adapter))
+            if value is MISS:
+                missing.append(adapter)
+            else:
+                cached[adapter] = value
+
+        outcome = self.fan_out.run(
+            lambda adapter: self.quote_cache.load(key_for(adapter), loader_for(adapter)),
+            deadline_seconds,
+            adapters=missing,
+            operation=operation
+        ) if missing else {'results': {}, 'timed_out': [], 'failed': {}, 'skipped': [], 'elapsed_ms': 0.0}
+
+        result = SupplierSearchResult(
+            timed_out=outcome['timed_out'],
+            failed=outcome['failed'],
+            skipped=outcome['skipped'],
+            elapsed_ms=outcome['elapsed_ms']
+        )
+        for adapter, value in list(cached.items()) + list(outcome['results'].items()):
+            result.responded.append(adapter.name)
+            if isinstance(value, list):
+                result.quotes.extend(value)
+            elif value is not None:
+                result.quotes.append(value)
+        return result
+
+    def cache_stats(self) -> Dict:
+        return self.quote_cache.stats()
+
+    def get_best_price(self, query: str, deadline_seconds: Optional[float] = None) -> Optional[PriceQuote]:
         """
-        Refresh prices in our database from supplier APIs.
+        Get the best available price from all suppliers.
 
         Args:
-            sku_mapping: Dict mapping our item names to supplier SKUs
-                         {"Duplex Receptacle": "LEV-5320-W", ...}
+            query: Product description or SKU
+            deadline_seconds: Overall budget (defaults to fan_out.deadline_seconds)
 
         Returns:
-            Dict of updated prices
+            Lowest price quote found in time, or None
+            (use search_suppliers() to see which suppliers timed out)
         """
-        updated = {}
+        return self.search_suppliers(query, deadline_seconds).best
 
-        for item_name, sku in sku_mapping.items():
-            quote = self.get_best_price(sku)
-            if quote:
-                updated[item_name] = quote.unit_price
+    def throttle_stats(self) -> Dict[str, Dict]:
+        return self.fan_out.throttle_stats()
 
-        return updated
+    def health_stats(self) -> Dict[str, Dict]:
+        """Breaker state, hedge counts and rolling latency percentiles per adapter."""
+        return self.fan_out.health_stats()
+
+    def shutdown(self):
+        """Stop the worker pool (waits for in-flight adapter calls)."""
+        self.fan_out.shutdown()
+
+    # -------------------------------------------------------------------------
+    # BULK REFRESH
+    # -------------------------------------------------------------------------
+
+    # -------------------------------------------------------------------------
+    # BULK REFRESH (supplier_bulk_refresh.py)
+    # -------------------------------------------------------------------------
+
+    def fetch_bulk_prices(self, skus: List[str]) -> Dict[str, PriceQuote]:
+        """Cheapest quote per SKU across all suppliers, compared per each."""
+        return fetch_bulk_prices(self.fan_out, self.quote_cache, skus)
+
+    def refresh_database_prices(
+        self,
+        sku_mapping: Dict[str, str],
+        write: bool = True,
+        price_book: Optional[str] = None
+    ) -> Dict[str, float]:
+        """
+        Re-price the PricingItems named in sku_mapping ({item name: supplier SKU})
+        from bulk supplier quotes. Returns {item name: material_cost}.
+        """
+        return refresh_database_prices(self.fan_out, self.quote_cache, sku_mapping, write, price_book)
+
+    def ingest_price_file(
+        self,
+        path: str,
+        sku_mapping: Dict[str, str],
+        write: bool = True,
+        price_book: Optional[str] = None
+    ) -> Dict:
+        """
+        Load a new full supplier price file as a delta: the CSV adapter applies
+        only the added/removed/changed SKUs, and only PricingItems mapped to
+        added or changed SKUs are re-priced (via refresh_database_prices).
+        Items mapped to SKUs dropped from the file keep their last price.
+
+        Returns:
+            {"delta": counts (PriceFileDelta.to_dict), "updated": {item name -> material_cost}}
+        """
+        csv_adapter = next(a for a in self.adapters if isinstance(a, CSVPriceAdapter))
+        delta = csv_adapter.apply_price_file(path)
+        self.quote_cache.invalidate(csv_adapter.name)
+
+        if delta.full_load:
+            mapping = sku_mapping
+        else:
+            touched = {sku.lower() for sku in delta.changed_skus}
+            mapping = {name: sku for name, sku in sku_mapping.items() if sku.lower() in touched}
+        updated = self.refresh_database_prices(mapping, write, price_book) if mapping else {}
+        return {'delta': delta.to_dict(), 'updated': updated}
 
 
 # =============================================================================
@@ -319,9 +258,13 @@ Option 1: CSV Import (Recommended for MVP)
         adapter = CSVPriceAdapter()
         adapter.load_from_csv(file)
         # Update database with new prices
-        return {"updated": len(adapter._prices)}
+        return {"updated": len(adapter)}
 
 4. Set up a weekly cron job or manual upload
+5. Or point SUPPLIER_CSV_PATH at the latest file; each worker maps a
+   snapshot of the parsed file (SUPPLIER_SNAPSHOT_DIR) instead of re-parsing
+6. For the next weekly file, service.ingest_price_file(path, sku_mapping)
+   applies only the SKUs that changed and re-prices only their items
 
 
 Option 2: Live API (Best, but requires setup)
@@ -334,8 +277,17 @@ Option 2: Live API (Best, but requires setup)
    GRAYBAR_CLIENT_SECRET=your_secret
    GRAYBAR_ACCOUNT_NUMBER=your_account
 
+   WESCO_API_KEY=your_api_key
+   WESCO_ACCOUNT_NUMBER=your_account
+
 4. The adapters will automatically use live pricing
 
+To try it without credentials, run the stub supplier API and point the
+adapter at it:
+
+    python -m backend.benchmarks.supplier_stub_server --port 8765
+    GRAYBAR_API_URL=http://127.0.0.1:8765 GRAYBAR_CLIENT_ID=x GRAYBAR_CLIENT_SECRET=y
+
 
 Option 3: Hybrid (Recommended long-term)
 ----------------------------------------
@@ -0,0 +1,215 @@
+"""
+Ohmni Estimate - Supplier Quote Cache
+Drop into: backend/services/supplier_quote_cache.py
+
+Bounded TTL cache in front of the supplier adapters (see
+supplier_pricing_service.SupplierPricingService). Keys are
+(supplier, sku, quantity) for prices and (supplier, "search:<query>", None)
+for search results.
+
+An entry is fresh for ttl after it is cached, but never past the quote's
+quote_valid_until (naive UTC, like every PriceQuote datetime). fetched_at is
+not used: CSV quotes carry the price file's load time, which may be hours
+old. After that the entry is stale: it is still served for up to stale_ttl
+while a background refresh fetches a new one (stale-while-revalidate), but
+never past quote_valid_until, since an expired supplier quote is not a price
+we can bid with. "Not found" answers are cached for negative_ttl.
+"""
+
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timezone
+import logging
+import re
+import threading
+import time
+
+from backend.services.supplier_transport import SupplierNotConfigured
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+QUOTE_CACHE_SIZE = 20000
+QUOTE_TTL_SECONDS = 15 * 60
+STALE_TTL_SECONDS = 60 * 60
+NEGATIVE_TTL_SECONDS = 5 * 60
+REFRESH_WORKERS = 2
+
+# Returned by get() when there is nothing usable (distinct from a cached None)
+MISS = object()
+
+_WS_RE = re.compile(r"\s+")
+
+
+def price_key(supplier: str, sku: str, quantity: int = 1) -> Tuple:
+    return (supplier, sku, quantity)
+
+
+def search_key(supplier: str, query: str) -> Tuple:
+    return (supplier, 'search:' + _WS_RE.sub(' ', (query or '').strip().lower()), None)
+
+
+def _quotes(value) -> Iterable:
+    if value is None:
+        return ()
+    if isinstance(value, (list, tuple)):
+        return value
+    if isinstance(value, dict):
+        return value.values()
+    return (value,)
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class _Entry:
+    __slots__ = ('value', 'fresh_until', 'stale_until')
+
+    def __init__(self, value, fresh_until: float, stale_until: float):
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class SupplierQuoteCache:
+    """Thread-safe bounded LRU of supplier quotes with stale-while-revalidate."""
+
+    def __init__(
+        self,
+        maxsize: int = QUOTE_CACHE_SIZE,
+        ttl_seconds: float = QUOTE_TTL_SECONDS,
+        stale_ttl_seconds: float = STALE_TTL_SECONDS,
+        negative_ttl_seconds: float = NEGATIVE_TTL_SECONDS,
+        refresh_workers: int = REFRESH_WORKERS
+    ):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.stale_ttl_seconds = stale_ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._executor = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix='quote-refresh')
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.evictions = 0
+
+    def _expiry(self, value, now: float) -> Tuple[float, float]:
+        """(fresh_until, stale_until) as epoch seconds."""
+        quotes = list(_quotes(value))
+        if not quotes:
+            fresh = now + self.negative_ttl_seconds
+            return fresh, fresh
+
+        fresh = now + self.ttl_seconds
+        stale = fresh + self.stale_ttl_seconds
+        valid = [
+            q.quote_valid_until.replace(tzinfo=timezone.utc).timestamp()
+            for q in quotes if q.quote_valid_until
+        ]
+        if valid:
+            hard = min(valid)
+            fresh = min(fresh, hard)
+            stale = min(stale, hard)
+        return fresh, stale
+
+    def get(self, key: Hashable, refresh: Optional[Callable] = None):
+        """
+        Cached value, or MISS. A stale value is returned as-is and, when
+        `refresh` (a zero-arg loader) is given, refreshed in the background.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry.stale_until <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return MISS
+            self._data.move_to_end(key)
+            if entry.fresh_until > now:
+                self.hits += 1
+                return entry.value
+            self.stale_hits += 1
+            schedule = refresh is not None and key not in self._refreshing
+            if schedule:
+                self._refreshing.add(key)
+
+        if schedule:
+            self._executor.submit(self._refresh, key, refresh)
+        return entry.value
+
+    def put(self, key: Hashable, value):
+        fresh, stale = self._expiry(value, time.time())
+        with self._lock:
+            self._data[key] = _Entry(value, fresh, stale)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def load(self, key: Hashable, loader: Callable):
+        """Call the loader and cache its result (exceptions are not cached)."""
+        value = loader()
+        self.put(key, value)
+        return value
+
+    def get_or_load(self, key: Hashable, loader: Callable):
+        value = self.get(key, refresh=loader)
+        if value is MISS:
+            value = self.load(key, loader)
+        return value
+
+    def _refresh(self, key: Hashable, loader: Callable):
+        try:
+            self.load(key, loader)
+            with self._lock:
+                self.refreshes += 1
+        except SupplierNotConfigured:
+            pass
+        except Exception as e:
+            with self._lock:
+                self.refresh_failures += 1
+            logger.warning(f"Background quote refresh failed for {key}: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def invalidate(self, supplier: Optional[str] = None):
+        """Drop everything, or only one supplier's entries."""
+        with self._lock:
+            if supplier is None:
+                self._data.clear()
+            else:
+                for key in [k for k in self._data if k[0] == supplier]:
+                    del self._data[key]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.stale_hits + self.misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'misses': self.misses,
+                'hit_rate': round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+                'fresh_hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'refreshes': self.refreshes,
+                'refresh_failures': self.refresh_failures,
+                'refreshing': len(self._refreshing),
+                'evictions': self.evictions,
+            }
@@ -0,0 +1,238 @@
+"""
+Ohmni Estimate - Supplier Rate Limiting
+Drop into: backend/services/supplier_rate_limit.py
+
+Per-adapter throttle for the supplier APIs (see SupplierAdapter.throttle):
+
+- TokenBucket: fixed request rate when the supplier publishes one
+  (GRAYBAR_RATE_LIMIT=10 -> 10 req/s); a 429/503 pauses it for Retry-After
+- AdaptiveConcurrency: AIMD limit on calls in flight. Each completed call at
+  a full window adds 1/limit (about +1 per round trip); a 429/503 halves the
+  limit and latency above LATENCY_TOLERANCE x the baseline cuts it by 10%.
+  Cuts are spaced DECREASE_COOLDOWN_SECONDS apart so one burst of rejections
+  counts once.
+
+Latency baselines are kept per operation (a 100-SKU bulk call is naturally
+slower than one price lookup), starting at the fastest call seen and drifting
+up slowly so an old minimum is eventually forgotten.
+"""
+
+from typing import Callable, Dict, Optional
+import threading
+import time
+
+from backend.services.supplier_transport import SupplierHTTPError
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+THROTTLE_STATUSES = (429, 503)
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+INITIAL_CONCURRENCY = 4
+MAX_CONCURRENCY = 16
+THROTTLE_BACKOFF = 0.5
+LATENCY_BACKOFF = 0.9
+LATENCY_TOLERANCE = 2.0
+BASELINE_DRIFT = 0.02
+DECREASE_COOLDOWN_SECONDS = 0.5
+
+
+class SupplierThrottled(Exception):
+    """No rate or concurrency slot became free within the caller's timeout."""
+
+
+def is_throttle_error(error: Exception) -> bool:
+    return isinstance(error, SupplierHTTPError) and error.status in THROTTLE_STATUSES
+
+
+# =============================================================================
+# TOKEN BUCKET
+# =============================================================================
+
+class TokenBucket:
+    """`rate` tokens/second up to `burst`; rate None = no limit (pauses still apply)."""
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst or max(1.0, rate or 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return 0, or return the seconds to wait for one."""
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.rate is None:
+            return 0.0
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                wait = self._reserve()
+            if wait <= 0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Hold all requests for `seconds` (Retry-After)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    @property
+    def paused_for(self) -> float:
+        return max(0.0, self._paused_until - time.monotonic())
+
+
+# =============================================================================
+# ADAPTIVE CONCURRENCY
+# =============================================================================
+
+class AdaptiveConcurrency:
+    """AIMD limit on concurrent calls."""
+
+    def __init__(self, initial: int = INITIAL_CONCURRENCY, minimum: int = 1, maximum: int = MAX_CONCURRENCY):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self.inflight = 0
+        self._baselines: Dict[str, float] = {}
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def window(self) -> int:
+        return int(self.limit)
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.inflight < int(self.limit), timeout):
+                return False
+            self.inflight += 1
+            return True
+
+    def release(self, latency_ms: Optional[float] = None, throttled: bool = False, kind: str = ''):
+        """Return a slot; latency_ms None means the call failed for another reason."""
+        with self._cond:
+            full = self.inflight >= int(self.limit)
+            self.inflight -= 1
+            if throttled:
+                self._decrease(THROTTLE_BACKOFF)
+            elif latency_ms is not None:
+                baseline = self._baselines.get(kind)
+                if baseline is None or latency_ms < baseline:
+                    baseline = latency_ms
+                else:
+                    baseline += (latency_ms - baseline) * BASELINE_DRIFT
+                self._baselines[kind] = baseline
+
+                if latency_ms > baseline * LATENCY_TOLERANCE:
+                    self._decrease(LATENCY_BACKOFF)
+                elif full and self.limit < self.maximum:
+                    # Only grow while the window is actually used
+                    self.limit = min(self.maximum, self.limit + 1 / self.limit)
+                    self.increases += 1
+            self._cond.notify_all()
+
+    def _decrease(self, factor: float):
+        now = time.monotonic()
+        if now - self._last_decrease < DECREASE_COOLDOWN_SECONDS:
+            return
+        self._last_decrease = now
+        self.limit = max(self.minimum, self.limit * factor)
+        self.decreases += 1
+
+
+# =============================================================================
+# THROTTLE
+# =============================================================================
+
+class SupplierThrottle:
+    """Token bucket + adaptive concurrency around one supplier's calls."""
+
+    def __init__(
+        self,
+        name: str,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        initial_concurrency: int = INITIAL_CONCURRENCY
+    ):
+        self.name = name
+        self.bucket = TokenBucket(rate, burst)
+        self.concurrency = AdaptiveConcurrency(initial_concurrency, maximum=max_concurrency)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.throttled = 0
+        self.rejected = 0
+
+    @property
+    def window(self) -> int:
+        return self.concurrency.window
+
+    def call(self, fn: Callable, *args, timeout: Optional[float] = None):
+        """
+        Run fn(*args) once a rate token and a concurrency slot are free.
+        Raises SupplierThrottled if that takes longer than `timeout`.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self.bucket.acquire(timeout):
+            self._count('rejected')
+            raise SupplierThrottled(f"{self.name}: rate limited")
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if not self.concurrency.acquire(remaining):
+            self._count('rejected')
+            raise SupplierThrottled(f"{self.name}: concurrency limit reached")
+
+        self._count('calls')
+        start = time.perf_counter()
+        latency_ms, throttled = None, False
+        try:
+            result = fn(*args)
+            latency_ms = (time.perf_counter() - start) * 1000
+            return result
+        except Exception as e:
+            if is_throttle_error(e):
+                throttled = True
+                self._count('throttled')
+                self.bucket.pause(min(MAX_RETRY_AFTER_SECONDS, e.retry_after or DEFAULT_RETRY_AFTER_SECONDS))
+            raise
+        finally:
+            self.concurrency.release(latency_ms, throttled, getattr(fn, '__name__', ''))
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> Dict:
+        concurrency = self.concurrency
+        return {
+            'rate': self.bucket.rate,
+            'paused_for': round(self.bucket.paused_for, 2),
+            'limit': round(concurrency.limit, 2),
+            'inflight': concurrency.inflight,
+            'calls': self.calls,
+            'throttled': self.throttled,
+            'rejected': self.rejected,
+            'increases': concurrency.increases,
+            'decreases': concurrency.decreases,
+        }
@@ -0,0 +1,254 @@
+"""
+Ohmni Estimate - Supplier Latency Tracking, Hedging and Circuit Breakers
+Drop into: backend/services/supplier_resilience.py
+
+Per-adapter health for SupplierPricingService (one SupplierHealth each):
+
+- LatencyHistogram: rolling log-scale histogram (25% wide buckets, 1 ms to
+  60 s) over the last HISTOGRAM_WINDOW_SECONDS, kept in time slices so old
+  samples age out. Calls are recorded when they finish, even after the
+  fan-out gave up on them, so the tail is not hidden by timeouts.
+- Hedging: a read still running at the adapter's p95 gets one duplicate
+  request and the first answer wins. Hedges are capped at HEDGE_BUDGET of
+  calls so a slow supplier doesn't get twice the traffic.
+- CircuitBreaker: BREAKER_FAILURES consecutive failures or timeouts open the
+  circuit and the adapter is skipped. After the reset timeout one probe call
+  goes through (half-open); success closes the circuit, failure reopens it
+  with the timeout doubled up to BREAKER_MAX_RESET_SECONDS. A probe that ends
+  inconclusive (rate limited) reopens it with the same timeout, and one that
+  never reports back is replaced after BREAKER_PROBE_TIMEOUT_SECONDS.
+"""
+
+from typing import Dict, List, Optional
+import math
+import threading
+import time
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+HISTOGRAM_WINDOW_SECONDS = 300
+HISTOGRAM_SLICES = 5
+BUCKET_GROWTH = 1.25
+MAX_LATENCY_MS = 60000.0
+_BUCKETS = int(math.log(MAX_LATENCY_MS) / math.log(BUCKET_GROWTH)) + 2
+
+HEDGE_PERCENTILE = 0.95
+HEDGE_MIN_SAMPLES = 20
+HEDGE_MIN_DELAY_MS = 50.0
+HEDGE_BUDGET = 0.1  # hedges per call
+HEDGE_BURST = 3
+
+BREAKER_FAILURES = 5
+BREAKER_RESET_SECONDS = 30.0
+BREAKER_MAX_RESET_SECONDS = 300.0
+BREAKER_PROBE_TIMEOUT_SECONDS = 30.0
+
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+
+# =============================================================================
+# LATENCY HISTOGRAM
+# =============================================================================
+
+def _bucket(latency_ms: float) -> int:
+    if latency_ms <= 1:
+        return 0
+    return min(_BUCKETS - 1, int(math.log(latency_ms) / math.log(BUCKET_GROWTH)) + 1)
+
+
+def _bucket_upper(index: int) -> float:
+    return BUCKET_GROWTH ** index
+
+
+class LatencyHistogram:
+    """Rolling latency distribution (percentiles within one bucket, ~25%)."""
+
+    def __init__(self, window_seconds: float = HISTOGRAM_WINDOW_SECONDS, slices: int = HISTOGRAM_SLICES):
+        self.slice_seconds = window_seconds / slices
+        self._counts: List[List[int]] = [[0] * _BUCKETS for _ in range(slices)]
+        self._epochs = [-1] * slices
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float):
+        epoch = int(time.monotonic() // self.slice_seconds)
+        i = epoch % len(self._counts)
+        with self._lock:
+            if self._epochs[i] != epoch:
+                self._counts[i] = [0] * _BUCKETS
+                self._epochs[i] = epoch
+            self._counts[i][_bucket(latency_ms)] += 1
+
+    def _merged(self) -> List[int]:
+        oldest = int(time.monotonic() // self.slice_seconds) - len(self._counts) + 1
+        merged = [0] * _BUCKETS
+        with self._lock:
+            for epoch, counts in zip(self._epochs, self._counts):
+                if epoch >= oldest:
+                    merged = [a + b for a, b in zip(merged, counts)]
+        return merged
+
+    @staticmethod
+    def _percentile(counts: List[int], total: int, q: float) -> Optional[float]:
+        if not total:
+            return None
+        rank = q * total
+        seen = 0
+        for i, count in enumerate(counts):
+            seen += count
+            if seen >= rank:
+                return _bucket_upper(i)
+        return MAX_LATENCY_MS
+
+    @property
+    def count(self) -> int:
+        return sum(self._merged())
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound (ms) of the bucket holding the q-th quantile, or None if empty."""
+        counts = self._merged()
+        return self._percentile(counts, sum(counts), q)
+
+    def stats(self) -> Dict:
+        counts = self._merged()
+        total = sum(counts)
+        p = lambda q: round(self._percentile(counts, total, q), 1) if total else None
+        return {'count': total, 'p50': p(0.5), 'p90': p(0.9), 'p95': p(0.95), 'p99': p(0.99)}
+
+
+# =============================================================================
+# CIRCUIT BREAKER
+# =============================================================================
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with a single half-open probe."""
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURES,
+        reset_seconds: float = BREAKER_RESET_SECONDS,
+        max_reset_seconds: float = BREAKER_MAX_RESET_SECONDS,
+        probe_timeout_seconds: float = BREAKER_PROBE_TIMEOUT_SECONDS
+    ):
+        self.failure_threshold = failure_threshold
+        self.base_reset_seconds = reset_seconds
+        self.max_reset_seconds = max_reset_seconds
+        self.probe_timeout_seconds = probe_timeout_seconds
+        self.state = CLOSED
+        self.failures = 0
+        self.opens = 0
+        self._reset_seconds = reset_seconds
+        self._opened_at = 0.0
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """May a call go out? In half-open state only the single probe may."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == OPEN and now - self._opened_at >= self._reset_seconds:
+                self.state = HALF_OPEN
+            elif not (self.state == HALF_OPEN and now - self._probe_started >= self.probe_timeout_seconds):
+                return False
+            # First probe, or the last one never reported back
+            self._probe_started = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._reset_seconds = self.base_reset_seconds
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN:
+                # Probe failed: back off further
+                self._reset_seconds = min(self.max_reset_seconds, self._reset_seconds * 2)
+                self._open()
+            elif self.state == CLOSED and self.failures >= self.failure_threshold:
+                self._open()
+
+    def record_inconclusive(self):
+        """The call says nothing about health (rate limited); a probe's slot is freed."""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._open()
+
+    def _open(self):
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self.opens += 1
+
+    def stats(self) -> Dict:
+        with self._lock:
+            retry_in = self._reset_seconds - (time.monotonic() - self._opened_at) if self.state == OPEN else 0.0
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'opens': self.opens,
+                'retry_in_seconds': round(max(0.0, retry_in), 1),
+            }
+
+
+# =============================================================================
+# PER-ADAPTER HEALTH
+# =============================================================================
+
+class SupplierHealth:
+    """Latency histograms per operation, hedge budget and breaker for one adapter."""
+
+    def __init__(self):
+        self.breaker = CircuitBreaker()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def histogram(self, operation: str) -> LatencyHistogram:
+        histogram = self._histograms.get(operation)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(operation, LatencyHistogram())
+        return histogram
+
+    def record_latency(self, operation: str, latency_ms: float):
+        self.histogram(operation).record(latency_ms)
+
+    def hedge_delay(self, operation: str) -> Optional[float]:
+        """Seconds after which to hedge a call, or None without enough samples."""
+        histogram = self.histogram(operation)
+        if histogram.count < HEDGE_MIN_SAMPLES:
+            return None
+        return max(HEDGE_MIN_DELAY_MS, histogram.percentile(HEDGE_PERCENTILE)) / 1000
+
+    def count_call(self):
+        with self._lock:
+            self.calls += 1
+
+    def try_hedge(self) -> bool:
+        """Take a hedge from the budget."""
+        with self._lock:
+            if self.hedges >= self.calls * HEDGE_BUDGET + HEDGE_BURST:
+                return False
+            self.hedges += 1
+            return True
+
+    def count_hedge_win(self):
+        with self._lock:
+            self.hedge_wins += 1
+
+    def stats(self) -> Dict:
+        return {
+            'breaker': self.breaker.stats(),
+            'calls': self.calls,
+            'hedges': self.hedges,
+            'hedge_wins': self.hedge_wins,
+            'latency_ms': {op: h.stats() for op, h in list(self._histograms.items())},
+        }
@@ -0,0 +1,365 @@
+"""
+Ohmni Estimate - Supplier HTTP Transport
+Drop into: backend/services/supplier_transport.py
+
+Shared HTTP layer for the live supplier adapters (Graybar, WESCO, ...), on the
+standard library so it adds no dependency:
+
+- keep-alive connection pool per supplier host (http.client connections
+  reused LIFO, so idle sockets stay warm); a request on a connection the
+  server already closed is retried once on a fresh one
+- gzip: responses are requested with Accept-Encoding: gzip and decoded here;
+  large JSON request bodies are gzipped when the transport is told the
+  supplier accepts it
+- OAuth token cache with early refresh: a token is renewed once less than
+  TOKEN_REFRESH_MARGIN of its lifetime is left (single flight; other threads
+  keep using the current token), and a 401 forces one renewal + retry
+
+Transports are shared per supplier name:
+    transport = get_transport('graybar', base_url)
+    transport.use_oauth('/oauth/token', client_id, client_secret)
+    data = transport.get_json('/api/products/search', params={'q': 'EMT'})
+
+Errors surface as SupplierHTTPError (status, retry_after) so callers can react
+to 429/503. Adapters without credentials raise SupplierNotConfigured.
+"""
+
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+import gzip
+import http.client
+import json
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+MAX_CONNECTIONS = 8
+REQUEST_TIMEOUT_SECONDS = 10.0
+GZIP_REQUEST_MIN_BYTES = 1024
+TOKEN_REFRESH_MARGIN = 0.2  # renew when < 20% of the token lifetime is left
+TOKEN_MIN_MARGIN_SECONDS = 30
+TOKEN_RETRY_SECONDS = 5  # wait between failed early refreshes
+
+# The pooled connection was closed by the server between requests
+_STALE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                 ConnectionResetError, BrokenPipeError)
+
+
+class SupplierNotConfigured(Exception):
+    """The supplier has no API credentials; callers skip it rather than count a failure."""
+
+
+class SupplierHTTPError(Exception):
+    """Non-2xx supplier response."""
+
+    def __init__(self, status: int, message: str, retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class HTTPResult(NamedTuple):
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    elapsed_ms: float
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+# =============================================================================
+# CONNECTION POOL
+# =============================================================================
+
+class ConnectionPool:
+    """Keep-alive connections to one host; at most `maxsize` kept idle."""
+
+    def __init__(self, base_url: str, maxsize: int = MAX_CONNECTIONS,
+                 timeout: float = REQUEST_TIMEOUT_SECONDS):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or 'https'
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base_path = parts.path.rstrip('/')
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._idle = []
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.connections_opened = 0
+        self.connections_reused = 0
+        self.retries = 0
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        cls = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+        with self._lock:
+            self.connections_opened += 1
+        return cls(self.host, self.port, timeout=self.timeout)
+
+    def _checkout(self) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            if self._idle:
+                self.connections_reused += 1
+                return self._idle.pop(), True
+        return self._new_connection(), False
+
+    def _checkin(self, conn: http.client.HTTPConnection):
+        with self._lock:
+            if len(self._idle) < self.maxsize:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(self, method: str, path: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None) -> HTTPResult:
+        url = self.base_path + path
+        start = time.perf_counter()
+        with self._lock:
+            self.requests += 1
+
+        conn, reused = self._checkout()
+        while True:
+            try:
+                conn.request(method, url, body=body, headers=headers or {})
+                response = conn.getresponse()
+                data = response.read()
+                break
+            except _STALE_ERRORS:
+                conn.close()
+                if not reused:
+                    raise
+                # Idle keep-alive socket closed by the server: one retry on a fresh connection
+                with self._lock:
+                    self.retries += 1
+                conn, reused = self._new_connection(), False
+            except Exception:
+                conn.close()
+                raise
+
+        result_headers = {k.lower(): v for k, v in response.getheaders()}
+        if response.will_close:
+            conn.close()
+        else:
+            self._checkin(conn)
+
+        if result_headers.get('content-encoding') == 'gzip':
+            data = gzip.decompress(data)
+        return HTTPResult(response.status, result_headers, data, (time.perf_counter() - start) * 1000)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'connections_opened': self.connections_opened,
+                'connections_reused': self.connections_reused,
+                'idle': len(self._idle),
+                'retries': self.retries,
+            }
+
+
+# =============================================================================
+# TOKEN CACHE
+# =============================================================================
+
+class TokenCache:
+    """
+    Caches a bearer token from `fetch() -> (token, expires_in_seconds)` and
+    renews it early. Renewal is single flight: while one thread fetches, the
+    others keep using the still-valid token.
+    """
+
+    def __init__(self, fetch: Callable[[], Tuple[str, float]], refresh_margin: float = TOKEN_REFRESH_MARGIN):
+        self._fetch = fetch
+        self.refresh_margin = refresh_margin
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self._lock = threading.Lock()
+        self.fetches = 0
+
+    def get(self) -> str:
+        now = time.monotonic()
+        token = self._token
+        if token and now < self._refresh_at:
+            return token
+        if token and now < self._expires_at:
+            # Early refresh window: one thread renews, the rest use the current token
+            if not self._lock.acquire(blocking=False):
+                return token
+            try:
+                if time.monotonic() >= self._refresh_at:
+                    self._renew()
+            except Exception as e:
+                logger.warning(f"Early token refresh failed, keeping current token: {e}")
+                self._refresh_at = min(self._expires_at, time.monotonic() + TOKEN_RETRY_SECONDS)
+            finally:
+                self._lock.release()
+            return self._token
+        with self._lock:
+            if not self._token or time.monotonic() >= self._expires_at:
+                self._renew()
+            return self._token
+
+    def _renew(self):
+        token, expires_in = self._fetch()
+        now = time.monotonic()
+        margin = max(expires_in * self.refresh_margin, min(TOKEN_MIN_MARGIN_SECONDS, expires_in / 2))
+        self._token = token
+        self._expires_at = now + expires_in
+        self._refresh_at = self._expires_at - margin
+        self.fetches += 1
+
+    def invalidate(self):
+        with self._lock:
+            self._token = None
+            self._expires_at = self._refresh_at = 0.0
+
+
+def oauth_client_credentials(pool: ConnectionPool, path: str, client_id: str,
+                             client_secret: str) -> Callable[[], Tuple[str, float]]:
+    """Token fetcher for the OAuth client-credentials grant, over the supplier's pool."""
+    def fetch() -> Tuple[str, float]:
+        body = urlencode({
+            'grant_type': 'client_credentials',
+            'client_id': client_id,
+            'client_secret': client_secret,
+        }).encode()
+        result = pool.request('POST', path, body=body, headers={
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip',
+        })
+        if result.status >= 400:
+            raise SupplierHTTPError(result.status, result.body[:200].decode('utf-8', 'replace'))
+        data = result.json()
+        return data['access_token'], float(data.get('expires_in', 3600))
+    return fetch
+
+
+# =============================================================================
+# TRANSPORT
+# =============================================================================
+
+class SupplierTransport:
+    """JSON over a pooled, gzip-aware connection with optional bearer auth."""
+
+    def __init__(
+        self,
+        base_url: str,
+        token_cache: Optional[TokenCache] = None,
+        headers: Optional[Dict[str, str]] = None,
+        max_connections: int = MAX_CONNECTIONS,
+        timeout: float = REQUEST_TIMEOUT_SECONDS,
+        gzip_requests: bool = False
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.pool = ConnectionPool(base_url, maxsize=max_connections, timeout=timeout)
+        self.token_cache = token_cache
+        self._auth_lock = threading.Lock()
+        self.headers = {'Accept': 'application/json', 'Accept-Encoding': 'gzip', **(headers or {})}
+        self.gzip_requests = gzip_requests
+
+    def use_oauth(self, token_path: str, client_id: str, client_secret: str):
+        """Authenticate with the client-credentials grant (token fetched over this pool)."""
+        with self._auth_lock:
+            if self.token_cache is None:
+                self.token_cache = TokenCache(
+                    oauth_client_credentials(self.pool, token_path, client_id, client_secret)
+                )
+
+    def request(self, method: str, path: str, params: Optional[Dict] = None,
+                json_body=None) -> HTTPResult:
+        if params:
+            path = f"{path}?{urlencode(params, doseq=True)}"
+        headers = dict(self.headers)
+        body = None
+        if json_body is not None:
+            body = json.dumps(json_body, separators=(',', ':')).encode()
+            headers['Content-Type'] = 'application/json'
+            if self.gzip_requests and len(body) >= GZIP_REQUEST_MIN_BYTES:
+                body = gzip.compress(body)
+                headers['Content-Encoding'] = 'gzip'
+
+        for attempt in (1, 2):
+            if self.token_cache:
+                headers['Authorization'] = f"Bearer {self.token_cache.get()}"
+            result = self.pool.request(method, path, body=body, headers=headers)
+            if result.status == 401 and self.token_cache and attempt == 1:
+                self.token_cache.invalidate()
+                continue
+            break
+
+        if result.status >= 400:
+            retry_after = result.headers.get('retry-after')
+            raise SupplierHTTPError(
+                result.status,
+                result.body[:200].decode('utf-8', 'replace'),
+                retry_after=float(retry_after) if retry_after and retry_after.replace('.', '', 1).isdigit() else None
+            )
+        return result
+
+    def get_json(self, path: str, params: Optional[Dict] = None):
+        return self.request('GET', path, params=params).json()
+
+    def post_json(self, path: str, payload, params: Optional[Dict] = None):
+        return self.request('POST', path, params=params, json_body=payload).json()
+
+    def close(self):
+        self.pool.close()
+
+    def stats(self) -> Dict:
+        stats = self.pool.stats()
+        if self.token_cache:
+            stats['token_fetches'] = self.token_cache.fetches
+        return stats
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+_transports: Dict[str, SupplierTransport] = {}
+_transports_lock = threading.Lock()
+
+
+def get_transport(name: str, base_url: str, **kwargs) -> SupplierTransport:
+    """
+    Process-wide transport per supplier name, so every adapter instance shares
+    one pool and one token. A different base_url replaces the transport.
+    """
+    with _transports_lock:
+        transport = _transports.get(name)
+        if transport is None or transport.base_url != base_url.rstrip('/'):
+            if transport is not None:
+                transport.close()
+            transport = SupplierTransport(base_url, **kwargs)
+            _transports[name] = transport
+        return transport
+
+
+def close_transports():
+    with _transports_lock:
+        transports = list(_transports.values())
+        _transports.clear()
+    for transport in transports:
+        transport.close()
+
+
+def transport_stats() -> Dict[str, Dict]:
+    with _transports_lock:
+        return {name: t.stats() for name, t in _transports.items()}
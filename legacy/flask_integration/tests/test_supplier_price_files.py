@@ -0,0 +1,269 @@
+"""
+Ohmni Estimate - Supplier Price File Tests
+Drop into: backend/tests/test_supplier_price_files.py
+
+Covers the pieces of supplier price file handling that are easy to get
+subtly wrong: the sorted-merge diff (supplier_price_delta.py), duplicate-SKU
+resolution in SupplierPriceTable._splice, and snapshot round-trips
+(supplier_price_snapshot.py). No database is used:
+    python -m pytest backend/tests/test_supplier_price_files.py
+"""
+
+import io
+
+import pytest
+
+from backend.services.supplier_catalog_index import SupplierCatalogIndex
+from backend.services.supplier_csv_adapter import CSVPriceAdapter
+from backend.services.supplier_price_delta import PriceRecord, diff_price_records, sorted_price_records
+from backend.services.supplier_price_snapshot import load_snapshot, save_snapshot
+from backend.services.supplier_price_table import SupplierPriceTable
+
+HEADER = 'sku,description,unit_price,uom,supplier\n'
+
+
+def price_csv(*rows) -> str:
+    """CSV text for (sku, description, unit_price[, uom[, supplier]]) tuples."""
+    lines = [HEADER]
+    for row in rows:
+        sku, description, price, uom, supplier = (tuple(row) + ('', ''))[:5]
+        lines.append(f"{sku},{description},{price},{uom},{supplier}\n")
+    return ''.join(lines)
+
+
+def load_table(*rows) -> SupplierPriceTable:
+    table = SupplierPriceTable()
+    batch = table.new_batch(0.0)
+    for sku, description, price in rows:
+        table.append(sku, description, price, 'EA', 'Test Supply', batch)
+    return table
+
+
+def records(text: str, run_rows: int = 50000):
+    return list(sorted_price_records(io.StringIO(text), 'Test Supply', run_rows=run_rows))
+
+
+def live_skus(table: SupplierPriceTable):
+    return [table.sku(row) for row in table.rows()]
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    directory = tmp_path / 'snapshots'
+    monkeypatch.setenv('SUPPLIER_SNAPSHOT_DIR', str(directory))
+    return directory
+
+
+# =============================================================================
+# SORTED FILE STREAM
+# =============================================================================
+
+def test_sorted_records_order_by_lowercase_sku_with_defaults():
+    out = records(price_csv(('b-2', 'Two', 2), ('A-1', 'One', 1, 'FT', 'Graybar')))
+    assert [key for key, _ in out] == [b'a-1', b'b-2']
+    assert out[0][1] == PriceRecord('A-1', 'One', 1.0, 'FT', 'Graybar')
+    assert out[1][1] == PriceRecord('b-2', 'Two', 2.0, 'EA', 'Test Supply')
+
+
+@pytest.mark.parametrize('run_rows', [50000, 2, 1])
+def test_sorted_records_last_duplicate_wins(run_rows):
+    # Repeats within a run, across spilled runs, and differing only in case
+    text = price_csv(
+        ('EMT-075', 'first', 1), ('THHN-6', 'wire', 5), ('emt-075', 'second', 2),
+        ('ZZ-1', 'last sku', 9), ('Emt-075', 'third', 3)
+    )
+    out = records(text, run_rows=run_rows)
+    assert [key for key, _ in out] == [b'emt-075', b'thhn-6', b'zz-1']
+    assert out[0][1] == PriceRecord('Emt-075', 'third', 3.0, 'EA', 'Test Supply')
+
+
+def test_sorted_records_empty_file():
+    assert records(HEADER) == []
+
+
+# =============================================================================
+# MERGE
+# =============================================================================
+
+def test_diff_added_removed_changed_unchanged():
+    table = load_table(('A-1', 'One', 1.0), ('B-2', 'Two', 2.0), ('C-3', 'Three', 3.0))
+    old_b, old_c = table.find('B-2'), table.find('C-3')
+    delta = diff_price_records(table, iter(records(price_csv(
+        ('A-1', 'One', 1.0), ('B-2', 'Two', 2.5), ('D-4', 'Four', 4.0)
+    ))))
+
+    assert delta.unchanged == 1
+    assert delta.changed == [(old_b, PriceRecord('B-2', 'Two', 2.5, 'EA', 'Test Supply'))]
+    assert delta.removed == [(old_c, 'C-3')]
+    assert delta.added == [PriceRecord('D-4', 'Four', 4.0, 'EA', 'Test Supply')]
+    assert delta.file_skus == 3
+    assert delta.changed_skus == ['D-4', 'B-2']
+
+
+def test_diff_case_only_sku_change_is_a_change_not_add_and_remove():
+    table = load_table(('emt-075', 'EMT', 1.0))
+    delta = diff_price_records(table, iter(records(price_csv(('EMT-075', 'EMT', 1.0)))))
+    assert delta.added == [] and delta.removed == []
+    assert delta.changed == [(table.find('emt-075'), PriceRecord('EMT-075', 'EMT', 1.0, 'EA', 'Test Supply'))]
+
+
+def test_diff_against_empty_table_and_empty_file():
+    delta = diff_price_records(SupplierPriceTable(), iter(records(price_csv(('A-1', 'One', 1)))))
+    assert len(delta.added) == 1 and delta.file_skus == 1
+
+    table = load_table(('A-1', 'One', 1.0), ('B-2', 'Two', 2.0))
+    delta = diff_price_records(table, iter(records(HEADER)))
+    assert [sku for _, sku in delta.removed] == ['A-1', 'B-2']
+    assert delta.file_skus == 0
+
+
+def test_diff_file_with_repeated_skus_matches_last_row():
+    table = load_table(('A-1', 'One', 2.0))
+    delta = diff_price_records(table, iter(records(price_csv(
+        ('A-1', 'One', 1.0), ('A-1', 'One', 2.0)
+    ), run_rows=1)))
+    assert delta.unchanged == 1 and delta.file_skus == 1
+    assert not (delta.added or delta.removed or delta.changed)
+
+
+# =============================================================================
+# DUPLICATE SKUS (SupplierPriceTable._splice)
+# =============================================================================
+
+def test_duplicates_in_one_load_keep_the_last_row():
+    table = load_table(('A-1', 'old', 1.0), ('B-2', 'Two', 2.0), ('a-1', 'new', 3.0))
+    assert len(table) == 2
+    assert table.row(table.find('A-1'))[:3] == ('a-1', 'new', 3.0)
+    assert live_skus(table) == ['a-1', 'B-2']
+    assert table.dead_ratio() == pytest.approx(1 / 3)
+
+
+def test_duplicates_across_loads_replace_the_earlier_row():
+    # Many base rows and few new ones, so new rows are bisected into place
+    table = load_table(*[(f'SKU-{i:03d}', f'item {i}', float(i)) for i in range(40)])
+    assert len(table) == 40
+    batch = table.new_batch(1.0)
+    old = table.find('SKU-010')
+    table.append('sku-010', 'replaced', 99.0, 'EA', 'Test Supply', batch)
+    table.append('SKU-010', 'replaced again', 100.0, 'EA', 'Test Supply', batch)
+    table.append('SKU-999', 'new', 1.0, 'EA', 'Test Supply', batch)
+
+    assert len(table) == 41
+    assert not table.is_live(old)
+    assert table.row(table.find('Sku-010'))[:3] == ('SKU-010', 'replaced again', 100.0)
+    assert live_skus(table) == sorted(live_skus(table), key=str.lower)
+
+
+def test_duplicates_across_loads_with_many_new_rows():
+    # Enough new rows that the order is rebuilt with one sort instead
+    table = load_table(('A-1', 'One', 1.0), ('B-2', 'Two', 2.0))
+    assert len(table) == 2
+    batch = table.new_batch(1.0)
+    for sku, price in [('b-2', 20.0), ('C-3', 3.0), ('a-1', 10.0), ('A-1', 11.0)]:
+        table.append(sku, 'x', price, 'EA', 'Test Supply', batch)
+
+    assert live_skus(table) == ['A-1', 'b-2', 'C-3']
+    assert [table.prices[row] for row in table.rows()] == [11.0, 20.0, 3.0]
+
+
+def test_removed_row_is_not_found():
+    table = load_table(('A-1', 'One', 1.0), ('B-2', 'Two', 2.0))
+    table.remove_row(table.find('A-1'))
+    assert table.find('A-1') is None
+    assert live_skus(table) == ['B-2']
+
+
+# =============================================================================
+# SNAPSHOTS
+# =============================================================================
+
+def test_snapshot_file_round_trip(tmp_path):
+    table = load_table(('A-1', 'One', 1.0))
+    sections, meta = table.snapshot_sections()
+    path = str(tmp_path / 'prices' / 'test.prices')
+    save_snapshot(path, sections, {'table': meta})
+
+    loaded, loaded_meta = load_snapshot(path)
+    assert loaded_meta == {'table': meta}
+    for name, data in sections.items():
+        assert bytes(loaded[name].cast('B')) == bytes(memoryview(data).cast('B'))
+
+
+def test_snapshot_rejects_damaged_file(tmp_path):
+    path = tmp_path / 'bad.prices'
+    path.write_bytes(b'not a snapshot')
+    assert load_snapshot(str(path)) is None
+    assert load_snapshot(str(tmp_path / 'missing.prices')) is None
+
+
+def test_mapped_table_and_index_match_the_original(tmp_path):
+    table = load_table(('LEV-5320-W', 'Duplex receptacle white', 4.5), ('EMT-075', 'EMT conduit', 1.0),
+                       ('lev-5320-w', 'Duplex receptacle white 15A', 4.75))
+    index = SupplierCatalogIndex(table)
+    for row in range(table.row_count):
+        index.add(row, table.sku(row), table.description(row))
+
+    table_sections, meta = table.snapshot_sections()
+    sections = {f"table.{k}": v for k, v in table_sections.items()}
+    sections.update({f"index.{k}": v for k, v in index.snapshot_sections().items()})
+    path = str(tmp_path / 'test.prices')
+    save_snapshot(path, sections, {'table': meta})
+    loaded, loaded_meta = load_snapshot(path)
+
+    mapped = SupplierPriceTable.from_snapshot(
+        {k[len('table.'):]: v for k, v in loaded.items() if k.startswith('table.')}, loaded_meta['table']
+    )
+    mapped_index = SupplierCatalogIndex.from_snapshot(
+        mapped, {k[len('index.'):]: v for k, v in loaded.items() if k.startswith('index.')}
+    )
+    assert [mapped.row(r) for r in mapped.rows()] == [table.row(r) for r in table.rows()]
+    assert mapped.find('LEV-5320-W') == table.find('LEV-5320-W')
+    assert mapped_index.search('receptacle') == index.search('receptacle')
+    assert mapped_index.search('5320') == index.search('5320')
+
+    # The first write copies the mapped columns; duplicates still resolve
+    batch = mapped.new_batch(1.0)
+    mapped.append('EMT-075', 'EMT conduit', 1.25, 'EA', 'Test Supply', batch)
+    assert mapped.row(mapped.find('emt-075'))[2] == 1.25
+    assert len(mapped) == 2
+
+
+def test_adapter_maps_snapshot_of_the_same_file(tmp_path, snapshot_dir):
+    path = tmp_path / 'prices.csv'
+    path.write_text(price_csv(('A-1', 'One', 1), ('a-1', 'One again', 2), ('B-2', 'Two', 3)))
+
+    first = CSVPriceAdapter(str(path))
+    assert len(list(snapshot_dir.iterdir())) == 1
+    second = CSVPriceAdapter(str(path))
+    assert second._table._frozen
+    assert len(second) == len(first) == 2
+    assert second.get_price('A-1').unit_price == first.get_price('A-1').unit_price == 2.0
+    assert [q.sku for q in second.search_product('two')] == ['B-2']
+
+
+def test_apply_price_file_across_runs(tmp_path, snapshot_dir):
+    week1 = tmp_path / 'week1.csv'
+    week1.write_text(price_csv(('emt-075', 'EMT', 1), ('B-2', 'Two', 2), ('C-3', 'Three', 3)))
+    week2 = tmp_path / 'week2.csv'
+    week2.write_text(price_csv(
+        ('EMT-075', 'EMT', 1), ('B-2', 'Two', 2), ('B-2', 'Two', 2.5), ('D-4', 'Four', 4)
+    ))
+
+    adapter = CSVPriceAdapter(str(week1))
+    delta = adapter.apply_price_file(str(week2))
+    assert delta.to_dict()['added'] == 1
+    assert delta.to_dict()['removed'] == 1
+    assert delta.to_dict()['changed'] == 2  # B-2 re-priced, emt-075 re-spelled
+    assert adapter.get_price('emt-075').sku == 'EMT-075'
+    assert adapter.get_price('B-2').unit_price == 2.5
+    assert adapter.get_price('C-3') is None
+    assert [q.sku for q in adapter.search_product('emt')] == ['EMT-075']
+
+    # Applying the same file again changes nothing; a fresh worker maps the result
+    again = adapter.apply_price_file(str(week2))
+    assert again.unchanged == 3 and not (again.added or again.removed or again.changed)
+    mapped = CSVPriceAdapter(str(week2))
+    assert mapped._table._frozen
+    assert sorted(q.sku for q in mapped.get_bulk_prices(['emt-075', 'B-2', 'D-4']).values()) == [
+        'B-2', 'D-4', 'EMT-075'
+    ]